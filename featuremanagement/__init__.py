@@ -8,7 +8,23 @@
 from ._featuremanager import FeatureManager
 from ._featurefilters import FeatureFilter
 from ._defaultfilters import TimeWindowFilter, TargetingFilter
-from ._models import FeatureFlag, Variant, EvaluationEvent, VariantAssignmentReason, TargetingContext
+from ._targeting_marker import get_targeting_cache_info
+from ._targeting_context_var import set_targeting_context, reset_targeting_context, get_targeting_context
+from ._models import (
+    FeatureFlag,
+    Variant,
+    EvaluationEvent,
+    EvaluationResult,
+    VariantAssignmentReason,
+    TargetingContext,
+    ClientPayload,
+    CacheInfo,
+    FeatureFlagClassification,
+    ProfileStats,
+    SlowEvaluation,
+)
+from ._profiler import EvaluationProfiler
+from ._event_bus import EvaluationEventBus
 
 from ._version import VERSION
 
@@ -21,6 +37,18 @@ __all__ = [
     "FeatureFlag",
     "Variant",
     "EvaluationEvent",
+    "EvaluationResult",
     "VariantAssignmentReason",
     "TargetingContext",
+    "ClientPayload",
+    "CacheInfo",
+    "FeatureFlagClassification",
+    "ProfileStats",
+    "SlowEvaluation",
+    "EvaluationProfiler",
+    "EvaluationEventBus",
+    "get_targeting_cache_info",
+    "set_targeting_context",
+    "reset_targeting_context",
+    "get_targeting_context",
 ]
@@ -6,12 +6,12 @@
 """Built-in feature filter implementations."""
 
 import logging
-import hashlib
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import cast, List, Mapping, Optional, Dict, Any
 from ._featurefilters import FeatureFilter
-from ._time_window_filter import Recurrence, is_match, TimeWindowFilterSettings
+from ._targeting_marker import get_context_marker
+from ._time_window_filter import Recurrence, is_match, get_next_transition, TimeWindowFilterSettings
 
 FEATURE_FLAG_NAME_KEY = "feature_name"
 ROLLOUT_PERCENTAGE_KEY = "RolloutPercentage"
@@ -31,6 +31,9 @@ TIME_WINDOW_FILTER_INVALID_RECURRENCE = (
     "{}: The {} feature filter is not valid for feature {}. It must specify both {} and {} when Recurrence is not None."
 )
 
+# Time window kwargs
+EVALUATION_TIME_KEY = "evaluation_time"
+
 # Targeting kwargs
 TARGETED_USER_KEY = "user"
 TARGETED_GROUPS_KEY = "groups"
@@ -63,6 +66,7 @@ class TimeWindowFilter(FeatureFilter):
         Determine if the feature flag is enabled for the given context.
 
         :keyword Mapping context: Mapping with the Start and End time for the feature flag.
+        :keyword datetime evaluation_time: Time to evaluate the time window at. Defaults to the current time.
         :return: True if the current time is within the time window.
         :rtype: bool
         """
@@ -71,7 +75,8 @@ class TimeWindowFilter(FeatureFilter):
         recurrence_data = context.get(PARAMETERS_KEY, {}).get(TIME_WINDOW_FILTER_SETTING_RECURRENCE, None)
         recurrence = None
 
-        current_time = datetime.now(timezone.utc)
+        evaluation_time = kwargs.get(EVALUATION_TIME_KEY)
+        current_time = evaluation_time if isinstance(evaluation_time, datetime) else datetime.now(timezone.utc)
 
         if not start and not end:
             logger.warning(
@@ -96,6 +101,43 @@ class TimeWindowFilter(FeatureFilter):
 
         return False
 
+    @staticmethod
+    def _get_next_transition(context: Mapping[Any, Any], now: datetime) -> Optional[datetime]:
+        """
+        Get the earliest time after now at which the result of the filter may change.
+
+        :param Mapping context: Mapping with the Start and End time for the feature flag.
+        :param datetime now: The current time.
+        :return: The time of the next transition, or None if the result never changes again.
+        :rtype: datetime
+        """
+        start = context.get(PARAMETERS_KEY, {}).get(START_KEY, None)
+        end = context.get(PARAMETERS_KEY, {}).get(END_KEY, None)
+        recurrence_data = context.get(PARAMETERS_KEY, {}).get(TIME_WINDOW_FILTER_SETTING_RECURRENCE, None)
+        if not start and not end:
+            return None
+
+        start_time: Optional[datetime] = parsedate_to_datetime(start) if start else None
+        end_time: Optional[datetime] = parsedate_to_datetime(end) if end else None
+        recurrence = Recurrence(recurrence_data) if recurrence_data else None
+        return get_next_transition(TimeWindowFilterSettings(start_time, end_time, recurrence), now)
+
+    def _get_constant_result(self, context: Mapping[Any, Any], now: datetime) -> Optional[bool]:
+        """
+        Get the result of the filter if it can no longer change, such as when the time window has ended.
+
+        :param Mapping context: Mapping with the Start and End time for the feature flag.
+        :param datetime now: The current time.
+        :return: The result of the filter, or None if it can still change.
+        :rtype: bool
+        """
+        try:
+            if self._get_next_transition(context, now) is not None:
+                return None
+        except (TypeError, ValueError):
+            return None
+        return self.evaluate(context)
+
 
 @FeatureFilter.alias("Microsoft.Targeting")
 class TargetingFilter(FeatureFilter):
@@ -110,10 +152,7 @@ class TargetingFilter(FeatureFilter):
         if rollout_percentage == 100:
             return True
 
-        hashed_context_id = hashlib.sha256(context_id.encode()).digest()
-        context_marker = int.from_bytes(hashed_context_id[:4], byteorder="little", signed=False)
-
-        percentage = (context_marker / (2**32 - 1)) * 100
+        percentage = (get_context_marker(context_id) / (2**32 - 1)) * 100
         return percentage < rollout_percentage
 
     def _target_group(
@@ -185,6 +224,29 @@ class TargetingFilter(FeatureFilter):
         context_id = target_user + "\n" + feature_flag_name
         return self._is_targeted(context_id, default_rollout_percentage)
 
+    @staticmethod
+    def _get_constant_result(context: Mapping[Any, Any]) -> Optional[bool]:
+        """
+        Get the result of the filter if it is the same for every targeting context. This is the case when no user is
+        listed and every rollout percentage is 0.
+
+        :param Mapping context: Context for evaluating the user/group.
+        :return: The result of the filter, or None if it depends on the targeting context.
+        :rtype: bool
+        """
+        audience = context.get(PARAMETERS_KEY, {}).get(AUDIENCE_KEY, None)
+        if not audience or audience.get(USERS_KEY):
+            return None
+        groups = audience.get(GROUPS_KEY, [])
+        default_rollout_percentage = audience.get(DEFAULT_ROLLOUT_PERCENTAGE_KEY, 0)
+        try:
+            TargetingFilter._validate(groups, default_rollout_percentage)
+        except (TargetingException, TypeError):
+            return None
+        if default_rollout_percentage == 0 and all(group.get(ROLLOUT_PERCENTAGE_KEY, 0) == 0 for group in groups):
+            return False
+        return None
+
     @staticmethod
     def _validate(groups: List[Dict[str, Any]], default_rollout_percentage: int) -> None:
         # Validate the audience settings
@@ -0,0 +1,149 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Delivery of evaluation events to several subscribers."""
+
+import atexit
+import contextvars
+import logging
+import queue
+import threading
+import time
+from typing import cast, Callable, Dict, List, Optional, Tuple
+from ._models import EvaluationEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 1024
+DEFAULT_SHUTDOWN_TIMEOUT = 5.0
+
+_STOP = object()
+
+
+class _Subscriber:
+    def __init__(self, callback: Callable[[EvaluationEvent], None], max_queue_size: int) -> None:
+        self.callback = callback
+        self.queue: "queue.Queue[object]" = queue.Queue(max_queue_size)
+        self.dropped_events = 0
+        self.worker = threading.Thread(target=self.run, name="FeatureManagementEventBus", daemon=True)
+        self.worker.start()
+
+    def run(self) -> None:
+        """
+        Delivers the queued events to the callback until stopped.
+        """
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                evaluation_event, context = cast(Tuple[EvaluationEvent, contextvars.Context], item)
+                context.run(self.callback, evaluation_event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Evaluation event subscriber %s failed.", self.callback)
+            finally:
+                self.queue.task_done()
+
+
+class EvaluationEventBus:
+    """
+    Delivers evaluation events to several subscribers, each with its own bounded queue and worker thread, so a slow
+    subscriber neither blocks evaluations nor the other subscribers. Subscribers are called in a copy of the context the
+    event was published in, so they see the OpenTelemetry trace and span of the evaluation. When the queue of a
+    subscriber is full, new events for that subscriber are dropped. At interpreter exit, the queued events are delivered
+    for up to 5 seconds. Pass an instance as the on_feature_evaluated callback of a FeatureManager.
+
+    :keyword int max_queue_size: Maximum number of queued events per subscriber. Defaults to 1024.
+    """
+
+    def __init__(self, *, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be greater than 0")
+        self._max_queue_size = max_queue_size
+        self._subscribers: List[_Subscriber] = []
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown, DEFAULT_SHUTDOWN_TIMEOUT)
+
+    def subscribe(self, callback: Callable[[EvaluationEvent], None]) -> Callable[[EvaluationEvent], None]:
+        """
+        Adds a subscriber. Can be used as a decorator.
+
+        :param Callable[[EvaluationEvent], None] callback: Function called with every evaluation event.
+        :return: The callback.
+        :rtype: Callable[[EvaluationEvent], None]
+        """
+        with self._lock:
+            self._subscribers = self._subscribers + [_Subscriber(callback, self._max_queue_size)]
+        return callback
+
+    def unsubscribe(self, callback: Callable[[EvaluationEvent], None]) -> None:
+        """
+        Removes a subscriber after the events already queued for it are delivered.
+
+        :param Callable[[EvaluationEvent], None] callback: The callback of the subscriber.
+        """
+        with self._lock:
+            removed = [subscriber for subscriber in self._subscribers if subscriber.callback == callback]
+            self._subscribers = [subscriber for subscriber in self._subscribers if subscriber.callback != callback]
+        for subscriber in removed:
+            subscriber.queue.put(_STOP)
+        for subscriber in removed:
+            subscriber.worker.join()
+
+    def __call__(self, evaluation_event: EvaluationEvent) -> None:
+        """
+        Queues an evaluation event for every subscriber.
+
+        :param EvaluationEvent evaluation_event: The evaluation event.
+        """
+        for subscriber in self._subscribers:
+            try:
+                # Each worker thread needs its own copy, as a context can't be entered by two threads at once
+                subscriber.queue.put_nowait((evaluation_event, contextvars.copy_context()))
+            except queue.Full:
+                with self._lock:
+                    subscriber.dropped_events += 1
+
+    @property
+    def dropped_events(self) -> Dict[Callable[[EvaluationEvent], None], int]:
+        """
+        Number of events dropped per subscriber because its queue was full.
+
+        :rtype: dict[Callable, int]
+        """
+        with self._lock:
+            return {subscriber.callback: subscriber.dropped_events for subscriber in self._subscribers}
+
+    def flush(self) -> None:
+        """
+        Waits until all queued events are delivered.
+        """
+        for subscriber in self._subscribers:
+            subscriber.queue.join()
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Delivers the queued events and stops the worker threads. Events published afterwards are ignored.
+
+        :param float timeout: Maximum number of seconds to wait for the worker threads, or None to wait until all
+         queued events are delivered.
+        """
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        atexit.unregister(self.shutdown)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put(_STOP, timeout=_remaining(deadline))
+            except queue.Full:
+                pass
+        for subscriber in subscribers:
+            subscriber.worker.join(_remaining(deadline))
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0)
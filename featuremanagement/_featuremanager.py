@@ -5,20 +5,48 @@
 # -------------------------------------------------------------------------
 """Synchronous feature manager implementation."""
 
+import concurrent.futures
 import logging
-from typing import cast, overload, Any, Optional, Dict, Mapping, List, Tuple
-from ._defaultfilters import TimeWindowFilter, TargetingFilter
+import os
+import time
+from datetime import datetime, timezone
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice, repeat
+from typing import cast, overload, Any, Callable, Optional, Dict, Iterable, Iterator, Mapping, List, Tuple, Union
+from ._defaultfilters import TimeWindowFilter, TargetingFilter, EVALUATION_TIME_KEY
 from ._featurefilters import FeatureFilter
-from ._models import EvaluationEvent, Variant, TargetingContext
+from ._models import (
+    EvaluationEvent,
+    EvaluationResult,
+    FeatureFlag,
+    Variant,
+    VariantAssignmentReason,
+    TargetingContext,
+    ClientPayload,
+)
+from ._targeting_context_var import get_targeting_context
 from ._featuremanagerbase import (
     FeatureManagerBase,
     PROVIDED_FEATURE_FILTERS,
     REQUIREMENT_TYPE_ALL,
     FEATURE_FILTER_NAME,
+    DEFAULT_CHUNK_SIZE,
+    EvaluationState,
+    UNKNOWN_FEATURE_FLAG_STATE,
+    DEMAND_ENABLED,
+    DEMAND_VARIANT,
+    DEMAND_ALL,
 )
 
 logger = logging.getLogger(__name__)
 
+BUILTIN_FILTER_TYPES = (TimeWindowFilter, TargetingFilter)
+
+BATCH_EXECUTOR_PROCESS = "process"
+BATCH_EXECUTOR_INTERPRETER = "interpreter"
+BATCH_EXECUTOR_THREAD = "thread"
+
 
 class FeatureManager(FeatureManagerBase):
     """
@@ -30,6 +58,14 @@ class FeatureManager(FeatureManagerBase):
     evaluated.
     :keyword Callable[[], TargetingContext] targeting_context_accessor: Callback function to get the current targeting
     context if one isn't provided.
+    :keyword int result_cache_size: If set, evaluation results of feature flags that only use the built-in filters are
+    cached per user and groups, in a least recently used cache of this size.
+    :keyword int filter_result_cache_size: Size of the least recently used cache of results of feature filters
+    declared with FeatureFilter.cacheable. Set to 0 to disable it. Defaults to 1024.
+    :keyword EvaluationProfiler profiler: Profiler collecting the durations of feature flag evaluations, feature
+    filters and variant allocation. Profiling is disabled if not set.
+    :keyword MeterProvider meter_provider: OpenTelemetry meter provider used to record evaluation counts and durations,
+    feature filter invocations, snapshot refresh durations and cache hit ratios. Metrics are disabled if not set.
     """
 
     def __init__(self, configuration: Mapping[str, Any], **kwargs: Any):
@@ -43,6 +79,10 @@ class FeatureManager(FeatureManagerBase):
             if not isinstance(feature_filter, FeatureFilter):
                 raise ValueError("Custom filter must be a subclass of FeatureFilter")
             self._filters[feature_filter.name] = feature_filter
+        self._builtin_filter_names = {
+            name for name, feature_filter in self._filters.items() if type(feature_filter) in BUILTIN_FILTER_TYPES
+        }
+        self._filter_names = set(self._filters)
 
     @overload  # type: ignore
     def is_enabled(self, feature_flag_id: str, user_id: str, **kwargs: Any) -> bool:
@@ -65,16 +105,16 @@ class FeatureManager(FeatureManagerBase):
         """
         targeting_context: TargetingContext = self._build_targeting_context(args)
 
-        result = self._check_feature(feature_flag_id, targeting_context, **kwargs)
-        if (
-            self._on_feature_evaluated
-            and result.feature
-            and result.feature.telemetry.enabled
-            and callable(self._on_feature_evaluated)
-        ):
-            result.user = targeting_context.user_id
-            self._on_feature_evaluated(result)
-        return result.enabled
+        self._refresh_snapshot()
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        if self._is_evaluation_observed(feature_flag):
+            result = self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+            self._invoke_on_feature_evaluated(result, targeting_context)
+            return result.enabled
+        enabled, _, _ = self._evaluate_feature_state(
+            feature_flag, feature_flag_id, targeting_context, DEMAND_ENABLED, **kwargs
+        )
+        return enabled
 
     @overload  # type: ignore
     def get_variant(self, feature_flag_id: str, user_id: str, **kwargs: Any) -> Optional[Variant]:
@@ -98,7 +138,260 @@ class FeatureManager(FeatureManagerBase):
         """
         targeting_context: TargetingContext = self._build_targeting_context(args)
 
-        result = self._check_feature(feature_flag_id, targeting_context, **kwargs)
+        self._refresh_snapshot()
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        if self._is_evaluation_observed(feature_flag):
+            result = self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+            self._invoke_on_feature_evaluated(result, targeting_context)
+            return result.variant
+        _, variant_name, _ = self._evaluate_feature_state(
+            feature_flag, feature_flag_id, targeting_context, DEMAND_VARIANT, **kwargs
+        )
+        return self._variant_name_to_variant(feature_flag, variant_name) if feature_flag else None
+
+    @overload  # type: ignore
+    def evaluate(self, feature_flag_id: str, user_id: str, **kwargs: Any) -> EvaluationResult:
+        """
+        Determine the enabled state and the variant of the feature flag for the given context.
+
+        :param str feature_flag_id: Name of the feature flag.
+        :param str user_id: User identifier.
+        :return: Enabled state, variant, assignment reason and snapshot version of the evaluation.
+        :rtype: EvaluationResult
+        """
+
+    def evaluate(self, feature_flag_id: str, *args: Any, **kwargs: Any) -> EvaluationResult:
+        """
+        Determine the enabled state and the variant of the feature flag for the given context. Unlike calling
+        is_enabled and then get_variant, the feature flag is evaluated once and the on_feature_evaluated callback is
+        called once.
+
+        :param str feature_flag_id: Name of the feature flag.
+        :return: Enabled state, variant, assignment reason and snapshot version of the evaluation.
+        :rtype: EvaluationResult
+        """
+        targeting_context: TargetingContext = self._build_targeting_context(args)
+
+        self._refresh_snapshot()
+        snapshot_version = self._snapshot_version
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        if self._is_evaluation_observed(feature_flag):
+            result = self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+            self._invoke_on_feature_evaluated(result, targeting_context)
+            return EvaluationResult(result.enabled, result.variant, result.reason, snapshot_version)
+        evaluation_state = self._evaluate_feature_state(
+            feature_flag, feature_flag_id, targeting_context, DEMAND_ALL, **kwargs
+        )
+        return self._to_evaluation_result(feature_flag, evaluation_state, snapshot_version)
+
+    def get_client_payload(self, *args: Any, feature_flag_ids: Iterable[str], **kwargs: Any) -> ClientPayload:
+        """
+        Evaluate feature flags for the given context and serialize their enabled state, variant name and variant
+        configuration to a compact JSON payload for client applications. The targeting context is resolved once for
+        all feature flags. Only the feature flags that are explicitly listed are included, as the payload is visible
+        to the client.
+
+        :keyword Iterable[str] feature_flag_ids: Names of the feature flags that are visible to the client.
+        :return: Serialized feature flag state, with the snapshot version and an ETag.
+        :rtype: ClientPayload
+        """
+        targeting_context: TargetingContext = self._build_targeting_context(args)
+        # The version is read right after the feature flags are resolved, so both come from the same snapshot
+        feature_flags = self._resolve_feature_flags(list(feature_flag_ids))
+        snapshot_version = self._snapshot_version
+        results = self._evaluate_resolved_feature_flags(feature_flags, targeting_context, **kwargs)
+        return ClientPayload.from_evaluation_events(results, snapshot_version)
+
+    def evaluate_many(self, feature_flag_ids: Iterable[str], *args: Any, **kwargs: Any) -> Dict[str, EvaluationEvent]:
+        """
+        Evaluate several feature flags for the same context. The targeting context is resolved once for all feature
+        flags.
+
+        :param Iterable[str] feature_flag_ids: Names of the feature flags to evaluate.
+        :return: Mapping of feature flag name to EvaluationEvent.
+        :rtype: dict[str, EvaluationEvent]
+        """
+        targeting_context: TargetingContext = self._build_targeting_context(args)
+        feature_flags = self._resolve_feature_flags(list(feature_flag_ids))
+        return self._evaluate_resolved_feature_flags(feature_flags, targeting_context, **kwargs)
+
+    def _evaluate_resolved_feature_flags(
+        self,
+        feature_flags: List[Tuple[str, Optional[FeatureFlag]]],
+        targeting_context: TargetingContext,
+        **kwargs: Any,
+    ) -> Dict[str, EvaluationEvent]:
+        results: Dict[str, EvaluationEvent] = {}
+        for feature_flag_id, feature_flag in feature_flags:
+            result = self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+            result.user = targeting_context.user_id
+            self._invoke_on_feature_evaluated(result, targeting_context)
+            results[feature_flag_id] = result
+        return results
+
+    def evaluate_stream(
+        self,
+        contexts: Iterable[Union[str, TargetingContext]],
+        feature_flag_ids: Iterable[str],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[List[Dict[str, EvaluationEvent]]]:
+        """
+        Lazily evaluate feature flags for a stream of targeting contexts. Contexts are consumed in chunks, so memory use
+        only depends on the chunk size, not on the size of the input. Feature flags are resolved once per chunk.
+
+        :param Iterable contexts: User ids or TargetingContexts to evaluate the feature flags for.
+        :param Iterable[str] feature_flag_ids: Names of the feature flags to evaluate.
+        :keyword int chunk_size: Number of contexts evaluated per chunk.
+        :return: Iterator yielding, for every chunk, one mapping of feature flag name to EvaluationEvent per context,
+        in input order.
+        :rtype: Iterator[list[dict[str, EvaluationEvent]]]
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+        # Not a generator itself, so an invalid chunk size raises when called instead of on first iteration
+        return self._evaluate_stream(iter(contexts), list(feature_flag_ids), chunk_size, **kwargs)
+
+    def _evaluate_stream(
+        self,
+        context_iterator: Iterator[Union[str, TargetingContext]],
+        feature_flag_ids: List[str],
+        chunk_size: int,
+        **kwargs: Any,
+    ) -> Iterator[List[Dict[str, EvaluationEvent]]]:
+        while True:
+            chunk = list(islice(context_iterator, chunk_size))
+            if not chunk:
+                return
+            yield self._evaluate_chunk(chunk, feature_flag_ids, **kwargs)
+
+    def evaluate_batch(  # pylint: disable=too-many-locals
+        self,
+        contexts: Iterable[Union[str, TargetingContext]],
+        feature_flag_ids: Iterable[str],
+        *,
+        executor: str = BATCH_EXECUTOR_PROCESS,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> List[Dict[str, EvaluationResult]]:
+        """
+        Evaluate feature flags for a batch of targeting contexts in parallel. The contexts are sharded across a pool
+        of workers in chunks, and the results are merged back in input order.
+
+        The executor can be one of:
+
+        * ``"process"``: a ProcessPoolExecutor. The feature flag definitions of the current snapshot are sent to
+          every worker process once.
+        * ``"interpreter"``: an InterpreterPoolExecutor, which requires Python 3.14 or newer. The feature flag
+          definitions of the current snapshot are loaded once per subinterpreter, without the cost of starting
+          processes. This executor is experimental, and it is only tested on Python 3.14.
+        * ``"thread"``: a ThreadPoolExecutor sharing this FeatureManager.
+
+        For the process and interpreter executors, feature filters and keyword arguments are sent to the workers, so
+        they must be picklable. Workers only return the enabled state, variant name and reason of every evaluation.
+        EvaluationEvents are only created for the on_feature_evaluated callback, which is always called in the
+        calling thread once the results are merged. Evaluation metrics aren't recorded for batch evaluations.
+
+        :param Iterable contexts: User ids or TargetingContexts to evaluate the feature flags for.
+        :param Iterable[str] feature_flag_ids: Names of the feature flags to evaluate.
+        :keyword str executor: The kind of worker pool to use. Defaults to ``"process"``.
+        :keyword int max_workers: Maximum number of workers. Defaults to the number of processors.
+        :keyword int chunk_size: Number of contexts sent to a worker at a time.
+        :return: One mapping of feature flag name to EvaluationResult per context, in input order.
+        :rtype: list[dict[str, EvaluationResult]]
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+        feature_flag_ids = list(feature_flag_ids)
+        targeting_contexts: List[TargetingContext] = []
+        for context in contexts:
+            targeting_contexts.append(super()._build_targeting_context((context,)) or TargetingContext())
+        shards = [targeting_contexts[i : i + chunk_size] for i in range(0, len(targeting_contexts), chunk_size)]
+        if not shards:
+            return []
+
+        max_workers = min(max_workers or os.cpu_count() or 1, len(shards))
+        feature_flags = self._resolve_feature_flags(feature_flag_ids)
+        snapshot_version = self._snapshot_version
+        pool: Executor
+        evaluate_shard: Callable[..., List[List[EvaluationState]]]
+        if executor == BATCH_EXECUTOR_THREAD:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            evaluate_shard = partial(_evaluate_shard, self, feature_flags)
+        elif executor in (BATCH_EXECUTOR_PROCESS, BATCH_EXECUTOR_INTERPRETER):
+            pool_type: Any = ProcessPoolExecutor
+            if executor == BATCH_EXECUTOR_INTERPRETER:
+                pool_type = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+                if pool_type is None:
+                    raise ValueError("The interpreter executor requires Python 3.14 or newer.")
+            pool = pool_type(
+                max_workers=max_workers,
+                initializer=_initialize_batch_worker,
+                initargs=(self._get_snapshot_configuration(), list(self._filters.values())),
+            )
+            evaluate_shard = partial(_evaluate_batch_shard, feature_flag_ids)
+        else:
+            raise ValueError(f"Unknown executor {executor}.")
+
+        with pool:
+            states = chain.from_iterable(pool.map(evaluate_shard, shards, repeat(kwargs)))
+            return self._merge_batch_states(targeting_contexts, feature_flags, states, snapshot_version)
+
+    def _merge_batch_states(
+        self,
+        targeting_contexts: List[TargetingContext],
+        feature_flags: List[Tuple[str, Optional[FeatureFlag]]],
+        states: Iterable[List[EvaluationState]],
+        snapshot_version: int,
+    ) -> List[Dict[str, EvaluationResult]]:
+        # Most contexts share a handful of states per feature flag, so each result is only created once
+        evaluation_results: Dict[Tuple[str, EvaluationState], EvaluationResult] = {}
+        observed = {
+            feature_flag_id
+            for feature_flag_id, feature_flag in feature_flags
+            if self._on_feature_evaluated and feature_flag and feature_flag.telemetry.enabled
+        }
+        results: List[Dict[str, EvaluationResult]] = []
+        for targeting_context, context_states in zip(targeting_contexts, states):
+            context_results: Dict[str, EvaluationResult] = {}
+            for (feature_flag_id, feature_flag), evaluation_state in zip(feature_flags, context_states):
+                if feature_flag_id in observed:
+                    self._invoke_on_feature_evaluated(
+                        self._from_evaluation_state(feature_flag, evaluation_state), targeting_context
+                    )
+                result = evaluation_results.get((feature_flag_id, evaluation_state))
+                if result is None:
+                    result = self._to_evaluation_result(feature_flag, evaluation_state, snapshot_version)
+                    evaluation_results[(feature_flag_id, evaluation_state)] = result
+                context_results[feature_flag_id] = result
+            results.append(context_results)
+        return results
+
+    def _evaluate_chunk(
+        self, chunk: List[Union[str, TargetingContext]], feature_flag_ids: List[str], **kwargs: Any
+    ) -> List[Dict[str, EvaluationEvent]]:
+        feature_flags = self._resolve_feature_flags(feature_flag_ids)
+        results = []
+        for context in chunk:
+            targeting_context = super()._build_targeting_context((context,)) or TargetingContext()
+            context_results: Dict[str, EvaluationEvent] = {}
+            for feature_flag_id, feature_flag in feature_flags:
+                result = self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+                result.user = targeting_context.user_id
+                self._invoke_on_feature_evaluated(result, targeting_context)
+                context_results[feature_flag_id] = result
+            results.append(context_results)
+        return results
+
+    def _invoke_on_feature_evaluated(self, result: EvaluationEvent, targeting_context: TargetingContext) -> None:
+        """
+        Calls the on_feature_evaluated callback, if the feature flag has telemetry enabled.
+
+        :param EvaluationEvent result: Evaluation event of the feature flag.
+        :param TargetingContext targeting_context: Targeting context the feature flag was evaluated for.
+        """
         if (
             self._on_feature_evaluated
             and result.feature
@@ -107,10 +400,9 @@ class FeatureManager(FeatureManagerBase):
         ):
             result.user = targeting_context.user_id
             self._on_feature_evaluated(result)
-        return result.variant
 
     def _build_targeting_context(self, args: Tuple[Any]) -> TargetingContext:
-        targeting_context = super()._build_targeting_context(args)
+        targeting_context = super()._build_targeting_context(args) or get_targeting_context()
         if targeting_context:
             return targeting_context
         if not targeting_context and self._targeting_context_accessor and callable(self._targeting_context_accessor):
@@ -125,35 +417,62 @@ class FeatureManager(FeatureManagerBase):
         return TargetingContext()
 
     def _check_feature_filters(
-        self, evaluation_event: EvaluationEvent, targeting_context: TargetingContext, **kwargs: Any
-    ) -> None:
-        feature_flag = evaluation_event.feature
-        if not feature_flag:
-            return
+        self, feature_flag: FeatureFlag, targeting_context: TargetingContext, **kwargs: Any
+    ) -> bool:
         feature_conditions = feature_flag.conditions
         feature_filters = feature_conditions.client_filters
 
         if len(feature_filters) == 0:
             # Feature flags without any filters return evaluate
-            evaluation_event.enabled = True
-        else:
-            # The assumed value is no filters is based on the requirement type.
-            # Requirement type Any assumes false until proven true, All assumes true until proven false
-            evaluation_event.enabled = feature_conditions.requirement_type == REQUIREMENT_TYPE_ALL
+            return True
+        # The assumed value is no filters is based on the requirement type.
+        # Requirement type Any assumes false until proven true, All assumes true until proven false
+        enabled = feature_conditions.requirement_type == REQUIREMENT_TYPE_ALL
 
-        for feature_filter in feature_filters:
+        for filter_index, feature_filter in enumerate(feature_filters):
             filter_name = feature_filter[FEATURE_FILTER_NAME]
             kwargs["user"] = targeting_context.user_id
             kwargs["groups"] = targeting_context.groups
             if filter_name not in self._filters:
                 raise ValueError(f"Feature flag {feature_flag.name} has unknown filter {filter_name}")
             if feature_conditions.requirement_type == REQUIREMENT_TYPE_ALL:
-                if not self._filters[filter_name].evaluate(feature_filter, **kwargs):
-                    evaluation_event.enabled = False
+                if not self._evaluate_feature_filter(feature_flag.name, filter_index, feature_filter, **kwargs):
+                    enabled = False
                     break
-            elif self._filters[filter_name].evaluate(feature_filter, **kwargs):
-                evaluation_event.enabled = True
+            elif self._evaluate_feature_filter(feature_flag.name, filter_index, feature_filter, **kwargs):
+                enabled = True
                 break
+        return enabled
+
+    def _evaluate_feature_filter(
+        self, feature_flag_name: str, filter_index: int, feature_filter: Mapping[str, Any], **kwargs: Any
+    ) -> bool:
+        """
+        Evaluates a feature filter, reusing the cached result of filters declared as cacheable.
+
+        :param str feature_flag_name: Name of the feature flag the filter belongs to.
+        :param int filter_index: Position of the filter in the conditions of the feature flag.
+        :param Mapping feature_filter: The feature filter configuration.
+        :return: The result of the feature filter.
+        :rtype: bool
+        """
+        filter_instance = self._filters[feature_filter[FEATURE_FILTER_NAME]]
+        cache_key = self._get_filter_cache_key(filter_instance, feature_flag_name, filter_index, kwargs)
+        if cache_key is not None:
+            cached_result = self._load_filter_result(cache_key)
+            if cached_result is not None:
+                return cached_result
+        if self._profiler is None:
+            result = bool(filter_instance.evaluate(feature_filter, **kwargs))
+        else:
+            start_time = time.perf_counter()
+            result = bool(filter_instance.evaluate(feature_filter, **kwargs))
+            self._profiler.record_filter(feature_flag_name, filter_instance.name, time.perf_counter() - start_time)
+        if self._metrics:
+            self._metrics.record_filter_invocation(feature_flag_name, filter_instance.name)
+        if cache_key is not None:
+            self._cache_filter_result(cache_key, filter_instance, result)
+        return result
 
     def _check_feature(
         self, feature_flag_id: str, targeting_context: TargetingContext, **kwargs: Any
@@ -166,12 +485,172 @@ class FeatureManager(FeatureManagerBase):
         :return: EvaluationEvent for the given context.
         :rtype: EvaluationEvent
         """
-        evaluation_event, done = super()._check_feature_base(feature_flag_id)
+        self._refresh_snapshot()
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        return self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
 
-        if done:
-            return evaluation_event
-
-        self._check_feature_filters(evaluation_event, targeting_context, **kwargs)
+    def _check_feature_flag(
+        self,
+        feature_flag: Optional[FeatureFlag],
+        feature_flag_id: str,
+        targeting_context: TargetingContext,
+        **kwargs: Any,
+    ) -> EvaluationEvent:
+        """
+        Determine if an already resolved feature flag is enabled for the given context.
 
-        self._assign_allocation(evaluation_event, targeting_context)
+        :param FeatureFlag feature_flag: The feature flag, or None if it doesn't exist.
+        :param str feature_flag_id: Name of the feature flag.
+        :param TargetingContext targeting_context: Targeting context.
+        :return: EvaluationEvent for the given context.
+        :rtype: EvaluationEvent
+        """
+        if self._metrics is None:
+            return self._evaluate_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+        start_time = time.perf_counter()
+        evaluation_event = self._evaluate_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+        self._metrics.record_evaluation(evaluation_event, feature_flag_id, time.perf_counter() - start_time)
         return evaluation_event
+
+    def _evaluate_feature_flag(
+        self,
+        feature_flag: Optional[FeatureFlag],
+        feature_flag_id: str,
+        targeting_context: TargetingContext,
+        **kwargs: Any,
+    ) -> EvaluationEvent:
+        evaluation_state = self._evaluate_feature_state(
+            feature_flag, feature_flag_id, targeting_context, DEMAND_ALL, **kwargs
+        )
+        return self._from_evaluation_state(feature_flag, evaluation_state)
+
+    def _evaluate_feature_state(
+        self,
+        feature_flag: Optional[FeatureFlag],
+        feature_flag_id: str,
+        targeting_context: TargetingContext,
+        demand: str,
+        **kwargs: Any,
+    ) -> EvaluationState:
+        """
+        Determine the enabled state, variant and reason of a feature flag for the given context, without creating an
+        EvaluationEvent. Feature filters and allocation that can't change the value the caller needs are skipped.
+
+        :param FeatureFlag feature_flag: The feature flag, or None if it doesn't exist.
+        :param str feature_flag_id: Name of the feature flag.
+        :param TargetingContext targeting_context: Targeting context.
+        :param str demand: What the caller needs from the evaluation, one of DEMAND_ENABLED, DEMAND_VARIANT or
+        DEMAND_ALL.
+        :return: Enabled state, variant name and assignment reason.
+        :rtype: tuple[bool, str, str]
+        """
+        constant_state = self._get_constant_state(feature_flag, feature_flag_id)
+        if constant_state is not None or not feature_flag:
+            return constant_state or UNKNOWN_FEATURE_FLAG_STATE
+
+        if not self._needs_feature_filters(feature_flag, demand):
+            return False, None, VariantAssignmentReason.NONE.value
+
+        if self._profiler is None:
+            return self._evaluate_feature_filters(feature_flag, targeting_context, demand, **kwargs)
+        token = self._profiler.start_evaluation()
+        start_time = time.perf_counter()
+        try:
+            return self._evaluate_feature_filters(feature_flag, targeting_context, demand, **kwargs)
+        finally:
+            self._profiler.record_evaluation(token, feature_flag.name, time.perf_counter() - start_time)
+
+    def _evaluate_feature_filters(
+        self, feature_flag: FeatureFlag, targeting_context: TargetingContext, demand: str, **kwargs: Any
+    ) -> EvaluationState:
+        """
+        Determine the enabled state, variant and reason of a feature flag whose state depends on its feature filters,
+        using the result cache if it's enabled.
+
+        :param FeatureFlag feature_flag: The feature flag.
+        :param TargetingContext targeting_context: Targeting context.
+        :param str demand: What the caller needs from the evaluation, one of DEMAND_ENABLED, DEMAND_VARIANT or
+        DEMAND_ALL.
+        :return: Enabled state, variant name and assignment reason.
+        :rtype: tuple[bool, str, str]
+        """
+        cache_key = self._get_result_cache_key(feature_flag, targeting_context, kwargs)
+        if cache_key is not None:
+            cached_state = self._load_cached_state(cache_key)
+            if cached_state is not None:
+                return cached_state
+            # The time windows are evaluated at the same time the expiry of the result is computed from
+            kwargs[EVALUATION_TIME_KEY] = datetime.now(timezone.utc)
+
+        enabled = self._check_feature_filters(feature_flag, targeting_context, **kwargs)
+        # Partial results aren't cached
+        if cache_key is None and not self._needs_allocation(feature_flag, enabled, demand):
+            return enabled, None, VariantAssignmentReason.NONE.value
+
+        if self._profiler is None:
+            evaluation_state = self._allocate(feature_flag, enabled, targeting_context)
+        else:
+            start_time = time.perf_counter()
+            evaluation_state = self._allocate(feature_flag, enabled, targeting_context)
+            self._profiler.record_allocation(feature_flag.name, time.perf_counter() - start_time)
+        if cache_key is not None:
+            self._cache_state(cache_key, feature_flag, evaluation_state, kwargs[EVALUATION_TIME_KEY])
+        return evaluation_state
+
+
+_BATCH_WORKER_FEATURE_MANAGER: Optional[FeatureManager] = None
+
+
+def _initialize_batch_worker(snapshot: Mapping[str, Any], feature_filters: List[FeatureFilter]) -> None:
+    """
+    Creates the FeatureManager of a batch evaluation worker from a snapshot of the feature flag definitions.
+
+    :param Mapping snapshot: Configuration containing the feature flag definitions.
+    :param list[FeatureFilter] feature_filters: Feature filters used by the parent FeatureManager.
+    """
+    global _BATCH_WORKER_FEATURE_MANAGER  # pylint: disable=global-statement
+    _BATCH_WORKER_FEATURE_MANAGER = FeatureManager(snapshot, feature_filters=feature_filters)
+
+
+def _evaluate_batch_shard(
+    feature_flag_ids: List[str], targeting_contexts: List[TargetingContext], kwargs: Dict[str, Any]
+) -> List[List[EvaluationState]]:
+    """
+    Evaluates a shard of a batch in a process or subinterpreter worker.
+
+    :param list[str] feature_flag_ids: Names of the feature flags to evaluate.
+    :param list[TargetingContext] targeting_contexts: Targeting contexts of the shard.
+    :param dict kwargs: Keyword arguments passed to the feature filters.
+    :return: For every context, the evaluation state of every feature flag, in order.
+    :rtype: list[list[tuple[bool, str, str]]]
+    """
+    feature_manager = cast(FeatureManager, _BATCH_WORKER_FEATURE_MANAGER)
+    feature_flags = feature_manager._resolve_feature_flags(feature_flag_ids)  # pylint: disable=protected-access
+    return _evaluate_shard(feature_manager, feature_flags, targeting_contexts, kwargs)
+
+
+def _evaluate_shard(
+    feature_manager: FeatureManager,
+    feature_flags: List[Tuple[str, Optional[FeatureFlag]]],
+    targeting_contexts: List[TargetingContext],
+    kwargs: Dict[str, Any],
+) -> List[List[EvaluationState]]:
+    """
+    Evaluates a shard of a batch with the given FeatureManager, without creating EvaluationEvents.
+
+    :param FeatureManager feature_manager: FeatureManager used to evaluate the shard.
+    :param list[tuple[str, FeatureFlag]] feature_flags: Feature flags to evaluate, resolved by feature_manager.
+    :param list[TargetingContext] targeting_contexts: Targeting contexts of the shard.
+    :param dict kwargs: Keyword arguments passed to the feature filters.
+    :return: For every context, the evaluation state of every feature flag, in order.
+    :rtype: list[list[tuple[bool, str, str]]]
+    """
+    return [
+        [
+            feature_manager._evaluate_feature_state(  # pylint: disable=protected-access
+                feature_flag, feature_flag_id, targeting_context, DEMAND_ALL, **kwargs
+            )
+            for feature_flag_id, feature_flag in feature_flags
+        ]
+        for targeting_context in targeting_contexts
+    ]
@@ -5,11 +5,28 @@
 # -------------------------------------------------------------------------
 """Base class for feature manager implementations."""
 
-import hashlib
 import logging
+import time
 from abc import ABC
-from typing import List, Optional, Dict, Tuple, Any, Mapping, Callable
-from ._models import FeatureFlag, Variant, VariantAssignmentReason, TargetingContext, EvaluationEvent, VariantReference
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Tuple, Any, Mapping, Callable, Hashable, Set
+from weakref import WeakKeyDictionary
+from ._models import (
+    FeatureFlag,
+    Variant,
+    VariantAssignmentReason,
+    TargetingContext,
+    EvaluationEvent,
+    EvaluationResult,
+    VariantReference,
+    CacheInfo,
+    FeatureFlagClassification,
+)
+from ._defaultfilters import TimeWindowFilter, TargetingFilter
+from ._result_cache import ResultCache
+from ._targeting_marker import get_context_marker
+from ._metrics import create_evaluation_metrics
+from ._profiler import EvaluationProfiler
 
 FEATURE_MANAGEMENT_KEY = "feature_management"
 FEATURE_FLAG_KEY = "feature_flags"
@@ -21,11 +38,29 @@ REQUIREMENT_TYPE_ANY = "Any"
 
 FEATURE_FILTER_PARAMETERS = "parameters"
 
+TIME_WINDOW_FILTER_NAME = "Microsoft.TimeWindow"
+TARGETING_FILTER_NAME = "Microsoft.Targeting"
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_FILTER_RESULT_CACHE_SIZE = 1024
+
+# Enabled state, variant name and assignment reason of an evaluation
+EvaluationState = Tuple[bool, Optional[str], str]
+
+# Unknown feature flags are disabled by default
+UNKNOWN_FEATURE_FLAG_STATE: EvaluationState = (False, None, VariantAssignmentReason.NONE.value)
+
+# What an entry point needs from an evaluation. Work that can't change the needed value is skipped, so the other values
+# of the evaluation state are only meaningful if everything is needed.
+DEMAND_ENABLED = "enabled"
+DEMAND_VARIANT = "variant"
+DEMAND_ALL = "all"
+
 
 logger = logging.getLogger(__name__)
 
 
-class FeatureManagerBase(ABC):
+class FeatureManagerBase(ABC):  # pylint: disable=too-many-instance-attributes
     """
     Base class for Feature Manager. This class is responsible for all shared logic between the sync and async.
     """
@@ -36,108 +71,380 @@ class FeatureManagerBase(ABC):
         self._configuration = configuration
         self._cache: Dict[str, Optional[FeatureFlag]] = {}
         self._copy = configuration.get(FEATURE_MANAGEMENT_KEY)
+        self._snapshot_version = 0
+        result_cache_size: Optional[int] = kwargs.pop("result_cache_size", None)
+        self._result_cache: Optional[ResultCache[EvaluationState]] = (
+            ResultCache(result_cache_size) if result_cache_size else None
+        )
+        filter_result_cache_size = kwargs.pop("filter_result_cache_size", DEFAULT_FILTER_RESULT_CACHE_SIZE)
+        self._filter_result_cache: Optional[ResultCache[bool]] = (
+            ResultCache(filter_result_cache_size) if filter_result_cache_size else None
+        )
+        # Names of the built-in filters that haven't been replaced by custom filters, set by the subclasses
+        self._builtin_filter_names: Set[str] = set()
+        # Names of all the feature filters, set by the subclasses
+        self._filter_names: Set[str] = set()
+        # Classification of the feature flags in the current snapshot, and the result of the constant ones
+        self._classifications: Dict[str, Tuple[FeatureFlagClassification, Optional[EvaluationState]]] = {}
+        # Whether a variant of a feature flag in the current snapshot can disable it with its status override
+        self._status_overrides: Dict[str, bool] = {}
+        # Variants of every feature flag by name, shared by all the evaluations of the feature flag
+        self._variants: "WeakKeyDictionary[FeatureFlag, Dict[str, Variant]]" = WeakKeyDictionary()
         self._on_feature_evaluated = kwargs.pop("on_feature_evaluated", None)
         self._targeting_context_accessor: Optional[Callable[[], TargetingContext]] = kwargs.pop(
             "targeting_context_accessor", None
         )
+        self._metrics = create_evaluation_metrics(kwargs.pop("meter_provider", None), self)
+        self._profiler: Optional[EvaluationProfiler] = kwargs.pop("profiler", None)
 
-    @staticmethod
-    def _assign_default_disabled_variant(evaluation_event: EvaluationEvent) -> None:
+    @property
+    def snapshot_version(self) -> int:
+        """
+        Version of the feature flag configuration currently in use. The version is incremented every time the
+        feature management configuration is replaced, such as after a refresh.
+
+        :return: Snapshot version.
+        :rtype: int
+        """
+        self._refresh_snapshot()
+        return self._snapshot_version
+
+    @property
+    def metrics_enabled(self) -> bool:
+        """
+        Whether the feature manager records OpenTelemetry metrics. Metrics are recorded when a meter_provider is
+        configured and the opentelemetry-api package is installed.
+
+        :return: True if metrics are recorded.
+        :rtype: bool
+        """
+        return self._metrics is not None
+
+    def _refresh_snapshot(self) -> None:
+        """
+        Clears the cached feature flags if the feature management configuration has been replaced.
+        """
+        if self._copy is not self._configuration.get(FEATURE_MANAGEMENT_KEY):
+            start_time = time.perf_counter()
+            self._cache = {}
+            self._classifications = {}
+            self._status_overrides = {}
+            self._copy = self._configuration.get(FEATURE_MANAGEMENT_KEY)
+            self._snapshot_version += 1
+            if self._result_cache:
+                self._result_cache.clear()
+            if self._filter_result_cache:
+                self._filter_result_cache.clear()
+            if self._metrics:
+                self._metrics.record_refresh(time.perf_counter() - start_time)
+
+    @property
+    def result_cache_info(self) -> Optional[CacheInfo]:
+        """
+        Statistics of the evaluation result cache.
+
+        :return: Cache statistics, or None if the result cache isn't enabled.
+        :rtype: CacheInfo
+        """
+        if self._result_cache is None:
+            return None
+        return self._result_cache.cache_info()
+
+    def _get_result_cache_key(
+        self, feature_flag: FeatureFlag, targeting_context: TargetingContext, kwargs: Mapping[str, Any]
+    ) -> Optional[Hashable]:
+        """
+        Gets the key of the evaluation result in the result cache. Only results that are a function of the user, the
+        groups and the current time can be cached, so feature flags with custom filters, or evaluations with extra
+        keyword arguments, are not cached.
+
+        :param FeatureFlag feature_flag: The feature flag.
+        :param TargetingContext targeting_context: Targeting context.
+        :param Mapping kwargs: Keyword arguments passed to the feature filters.
+        :return: Key of the result, or None if the result can't be cached.
+        :rtype: Hashable
         """
-        A method called when the feature flag is disabled, to determine what the default variant should be. If there is
-        no allocation, then None is set as the value of the variant in the EvaluationEvent.
+        if self._result_cache is None or kwargs:
+            return None
+        classification, _ = self._classify_feature_flag(feature_flag)
+        if classification == FeatureFlagClassification.CUSTOM_FILTER_DEPENDENT:
+            return None
+        groups = tuple(sorted(set(targeting_context.groups or [])))
+        return self._snapshot_version, feature_flag.name, targeting_context.user_id, groups
+
+    @property
+    def filter_result_cache_info(self) -> Optional[CacheInfo]:
+        """
+        Statistics of the cache of feature filter results, used by filters declared as cacheable.
+
+        :return: Cache statistics, or None if the filter result cache isn't enabled.
+        :rtype: CacheInfo
+        """
+        if self._filter_result_cache is None:
+            return None
+        return self._filter_result_cache.cache_info()
 
-        :param EvaluationEvent evaluation_event: Evaluation event object.
+    def _get_filter_cache_key(
+        self, feature_filter: Any, feature_flag_name: str, filter_index: int, kwargs: Mapping[str, Any]
+    ) -> Optional[Hashable]:
         """
-        evaluation_event.reason = VariantAssignmentReason.DEFAULT_WHEN_DISABLED
-        if not evaluation_event.feature or not evaluation_event.feature.allocation:
+        Gets the key of a feature filter result in the filter result cache. Only filters declared as cacheable are
+        cached, keyed by the keyword arguments they depend on.
+
+        :param FeatureFilter feature_filter: The feature filter.
+        :param str feature_flag_name: Name of the feature flag the filter belongs to.
+        :param int filter_index: Position of the filter in the conditions of the feature flag.
+        :param Mapping kwargs: Keyword arguments passed to the feature filter.
+        :return: Key of the result, or None if the result can't be cached.
+        :rtype: Hashable
+        """
+        if self._filter_result_cache is None or not getattr(feature_filter, "_cacheable", False):
+            return None
+        values = []
+        for name in feature_filter._cache_depends_on:  # pylint: disable=protected-access
+            value = kwargs.get(name)
+            values.append(tuple(value) if isinstance(value, list) else value)
+        cache_key = (self._snapshot_version, feature_flag_name, filter_index, tuple(values))
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def _load_filter_result(self, cache_key: Hashable) -> Optional[bool]:
+        """
+        Loads a cached feature filter result.
+
+        :param Hashable cache_key: Key of the result.
+        :return: The result, or None if there is no valid result.
+        :rtype: bool
+        """
+        return self._filter_result_cache.get(cache_key) if self._filter_result_cache else None
+
+    def _cache_filter_result(self, cache_key: Hashable, feature_filter: Any, result: bool) -> None:
+        """
+        Adds a feature filter result to the filter result cache, expiring it after the TTL of the filter.
+
+        :param Hashable cache_key: Key of the result.
+        :param FeatureFilter feature_filter: The feature filter.
+        :param bool result: The result of the feature filter.
+        """
+        if not self._filter_result_cache:
             return
-        FeatureManagerBase._assign_variant_override(
-            evaluation_event.feature.variants,
-            evaluation_event.feature.allocation.default_when_disabled,
-            False,
-            evaluation_event,
-        )
+        ttl = feature_filter._cache_ttl  # pylint: disable=protected-access
+        self._filter_result_cache.put(cache_key, result, time.time() + ttl if ttl is not None else None)
 
-    @staticmethod
-    def _assign_default_enabled_variant(evaluation_event: EvaluationEvent) -> None:
+    def get_feature_flag_classification(self, feature_flag_id: str) -> Optional[FeatureFlagClassification]:
+        """
+        Gets what the evaluation result of a feature flag depends on in the current snapshot. Caching layers can use
+        it to decide what is safe to cache: constant results can be cached for the lifetime of the snapshot,
+        context dependent results per user and groups, and time dependent results only until the time windows change.
+
+        :param str feature_flag_id: Name of the feature flag.
+        :return: Classification of the feature flag, or None if the feature flag doesn't exist.
+        :rtype: FeatureFlagClassification
+        """
+        self._refresh_snapshot()
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        if not feature_flag:
+            return None
+        classification, _ = self._classify_feature_flag(feature_flag)
+        return classification
+
+    def _classify_feature_flag(
+        self, feature_flag: FeatureFlag
+    ) -> Tuple[FeatureFlagClassification, Optional[EvaluationState]]:
+        """
+        Gets the classification of a feature flag in the current snapshot, classifying it on first use.
+
+        :param FeatureFlag feature_flag: The feature flag.
+        :return: The classification, and the result of the feature flag if it is constant.
+        :rtype: tuple[FeatureFlagClassification, tuple]
+        """
+        classification = self._classifications.get(feature_flag.name)
+        if classification is None:
+            classification = self._fold_feature_flag(feature_flag)
+            self._classifications[feature_flag.name] = classification
+        return classification
+
+    def _fold_feature_flag(
+        self, feature_flag: FeatureFlag
+    ) -> Tuple[FeatureFlagClassification, Optional[EvaluationState]]:
+        """
+        Classifies a feature flag, and evaluates it ahead of time if its result is the same for every context. Feature
+        filters are folded in order, the same way they are evaluated, so a filter that would raise an error is never
+        skipped.
+
+        :param FeatureFlag feature_flag: The feature flag.
+        :return: The classification, and the result of the feature flag if it is constant.
+        :rtype: tuple[FeatureFlagClassification, tuple]
+        """
+        if not feature_flag.enabled:
+            # Feature flags that are disabled are always disabled, variants can't override it
+            variant_name = feature_flag.allocation.default_when_disabled if feature_flag.allocation else None
+            return FeatureFlagClassification.CONSTANT, (
+                False,
+                variant_name,
+                VariantAssignmentReason.DEFAULT_WHEN_DISABLED.value,
+            )
+
+        feature_conditions = feature_flag.conditions
+        requirement_all = feature_conditions.requirement_type == REQUIREMENT_TYPE_ALL
+        # Feature flags without any filters are enabled
+        enabled: Optional[bool] = requirement_all or not feature_conditions.client_filters
+        now = datetime.now(timezone.utc)
+        for feature_filter in feature_conditions.client_filters:
+            filter_result = self._fold_feature_filter(feature_filter, now)
+            if filter_result is None:
+                enabled = None
+                break
+            if filter_result != requirement_all:
+                enabled = filter_result
+                break
+
+        allocation = feature_flag.allocation
+        targeted_allocation = bool(allocation and (allocation.user or allocation.group or allocation.percentile))
+        if enabled is None or (enabled and targeted_allocation):
+            return self._classify_dependencies(feature_flag), None
+
+        return FeatureFlagClassification.CONSTANT, self._allocate(feature_flag, bool(enabled), TargetingContext())
+
+    def _fold_feature_filter(self, feature_filter: Mapping[str, Any], now: datetime) -> Optional[bool]:
+        """
+        Gets the result of a feature filter if it is the same for every context from now on.
+
+        :param Mapping feature_filter: The feature filter configuration.
+        :param datetime now: The current time.
+        :return: The result of the feature filter, or None if it isn't constant.
+        :rtype: bool
         """
-        A method called when the feature flag is enabled, to determine what the default variant should be. If there is
-        no allocation, then None is set as the value of the variant in the EvaluationEvent.
+        filter_name = feature_filter.get(FEATURE_FILTER_NAME)
+        if filter_name not in self._builtin_filter_names:
+            return None
+        if filter_name == TIME_WINDOW_FILTER_NAME:
+            return TimeWindowFilter()._get_constant_result(feature_filter, now)  # pylint: disable=protected-access
+        if filter_name == TARGETING_FILTER_NAME:
+            return TargetingFilter._get_constant_result(feature_filter)  # pylint: disable=protected-access
+        return None
+
+    def _classify_dependencies(self, feature_flag: FeatureFlag) -> FeatureFlagClassification:
+        """
+        Classifies a feature flag that isn't constant by the most restrictive input its feature filters depend on.
+
+        :param FeatureFlag feature_flag: The feature flag.
+        :return: Classification of the feature flag.
+        :rtype: FeatureFlagClassification
+        """
+        filter_names = {
+            feature_filter.get(FEATURE_FILTER_NAME) for feature_filter in feature_flag.conditions.client_filters
+        }
+        if not filter_names <= self._builtin_filter_names:
+            return FeatureFlagClassification.CUSTOM_FILTER_DEPENDENT
+        if TIME_WINDOW_FILTER_NAME in filter_names:
+            return FeatureFlagClassification.TIME_DEPENDENT
+        return FeatureFlagClassification.CONTEXT_DEPENDENT
+
+    def _load_cached_state(self, cache_key: Hashable) -> Optional[EvaluationState]:
+        """
+        Loads a cached evaluation result.
+
+        :param Hashable cache_key: Key of the result.
+        :return: Enabled state, variant name and assignment reason, or None if there is no valid result.
+        :rtype: tuple[bool, str, str]
+        """
+        return self._result_cache.get(cache_key) if self._result_cache else None
 
-        :param EvaluationEvent evaluation_event: Evaluation event object.
+    def _cache_state(
+        self, cache_key: Hashable, feature_flag: FeatureFlag, evaluation_state: EvaluationState, now: datetime
+    ) -> None:
+        """
+        Adds an evaluation result to the result cache. Results of feature flags with time window filters expire at the
+        next time after the evaluation the time windows can start or end.
+
+        :param Hashable cache_key: Key of the result.
+        :param FeatureFlag feature_flag: The feature flag.
+        :param tuple evaluation_state: Enabled state, variant name and assignment reason.
+        :param datetime now: The time the time window filters were evaluated at.
         """
-        evaluation_event.reason = VariantAssignmentReason.DEFAULT_WHEN_ENABLED
-        if not evaluation_event.feature or not evaluation_event.feature.allocation:
+        if not self._result_cache:
             return
-        FeatureManagerBase._assign_variant_override(
-            evaluation_event.feature.variants,
-            evaluation_event.feature.allocation.default_when_enabled,
-            True,
-            evaluation_event,
-        )
+        expires_at: Optional[datetime] = None
+        for feature_filter in feature_flag.conditions.client_filters:
+            if feature_filter.get(FEATURE_FILTER_NAME) == TIME_WINDOW_FILTER_NAME:
+                next_transition = TimeWindowFilter._get_next_transition(  # pylint: disable=protected-access
+                    feature_filter, now
+                )
+                if next_transition and (expires_at is None or next_transition < expires_at):
+                    expires_at = next_transition
+        self._result_cache.put(cache_key, evaluation_state, expires_at.timestamp() if expires_at else None)
 
     @staticmethod
-    def _assign_variant_override(
-        variants: Optional[List[VariantReference]],
-        default_variant_name: Optional[str],
-        status: bool,
-        evaluation_event: EvaluationEvent,
-    ) -> None:
+    def _get_status_override(
+        variants: Optional[List[VariantReference]], variant_name: Optional[str], status: bool
+    ) -> bool:
         """
         A method to check if a variant is overridden to be enabled or disabled by the variant.
 
-        :param list[Variant] variants: List of variants.
-        :param str default_variant_name: Name of the default variant.
+        :param list[VariantReference] variants: List of variants.
+        :param str variant_name: Name of the assigned variant.
         :param bool status: Status of the feature flag.
-        :param EvaluationEvent evaluation_event: Evaluation event object.
+        :return: The status of the feature flag, after the override of the variant.
+        :rtype: bool
         """
-        if not variants or not default_variant_name:
-            evaluation_event.enabled = status
-            return
+        if not variants or not variant_name:
+            return status
         for variant in variants:
-            if variant.name == default_variant_name:
+            if variant.name == variant_name:
                 if variant.status_override == "Enabled":
-                    evaluation_event.enabled = True
-                    return
+                    return True
                 if variant.status_override == "Disabled":
-                    evaluation_event.enabled = False
-                    return
-        evaluation_event.enabled = status
+                    return False
+        return status
 
     @staticmethod
     def _is_targeted(context_id: str) -> float:
         """Determine if the user is targeted for the given context"""
-        hashed_context_id = hashlib.sha256(context_id.encode()).digest()
-        context_marker = int.from_bytes(hashed_context_id[:4], byteorder="little", signed=False)
+        return (get_context_marker(context_id) / (2**32 - 1)) * 100
 
-        return (context_marker / (2**32 - 1)) * 100
-
-    def _assign_variant(self, targeting_context: TargetingContext, evaluation_event: EvaluationEvent) -> None:
+    def _allocate(
+        self, feature_flag: FeatureFlag, enabled: bool, targeting_context: TargetingContext
+    ) -> EvaluationState:
         """
-        Assign a variant to the user based on the allocation.
+        Assign a variant to the user based on the allocation. The status override of the assigned variant can change
+        the enabled state.
 
+        :param FeatureFlag feature_flag: The feature flag.
+        :param bool enabled: Result of the feature filters.
         :param TargetingContext targeting_context: Targeting context.
-        :param EvaluationEvent evaluation_event: Evaluation event object.
+        :return: Enabled state, variant name and assignment reason.
+        :rtype: tuple[bool, str, str]
         """
-        feature_flag = evaluation_event.feature
-        variant_name = None
-        if not feature_flag or not feature_flag.variants or not feature_flag.allocation:
-            return
-
         allocation = feature_flag.allocation
+        if not feature_flag.variants or not allocation:
+            return enabled, None, VariantAssignmentReason.NONE.value
+
+        if not enabled:
+            variant_name = allocation.default_when_disabled
+            return (
+                self._get_status_override(feature_flag.variants, variant_name, False),
+                variant_name,
+                VariantAssignmentReason.DEFAULT_WHEN_DISABLED.value,
+            )
+
+        reason = VariantAssignmentReason.NONE
+        variant_name = None
         groups = targeting_context.groups
 
         if allocation.user and targeting_context.user_id:
             for user_allocation in allocation.user:
                 if targeting_context.user_id in user_allocation.users:
-                    evaluation_event.reason = VariantAssignmentReason.USER
+                    reason = VariantAssignmentReason.USER
                     variant_name = user_allocation.variant
 
         if not variant_name and allocation.group and groups:
             for group_allocation in allocation.group:
                 if any(group in group_allocation.groups for group in groups):
-                    evaluation_event.reason = VariantAssignmentReason.GROUP
+                    reason = VariantAssignmentReason.GROUP
                     variant_name = group_allocation.variant
 
         if not variant_name and allocation.percentile:
@@ -149,21 +456,15 @@ class FeatureManagerBase(ABC):
                 if (box == 100 and percentile_to == 100) or (
                     percentile_allocation.percentile_from <= box < percentile_to
                 ):
-                    evaluation_event.reason = VariantAssignmentReason.PERCENTILE
+                    reason = VariantAssignmentReason.PERCENTILE
                     variant_name = percentile_allocation.variant
                     break
 
         if not variant_name:
-            FeatureManagerBase._assign_default_enabled_variant(evaluation_event)
-            if feature_flag.allocation:
-                evaluation_event.variant = self._variant_name_to_variant(
-                    feature_flag, feature_flag.allocation.default_when_enabled
-                )
-                return
+            reason = VariantAssignmentReason.DEFAULT_WHEN_ENABLED
+            variant_name = allocation.default_when_enabled
 
-        evaluation_event.variant = self._variant_name_to_variant(feature_flag, variant_name)
-        if feature_flag.variants:
-            FeatureManagerBase._assign_variant_override(feature_flag.variants, variant_name, True, evaluation_event)
+        return self._get_status_override(feature_flag.variants, variant_name, True), variant_name, reason.value
 
     def _variant_name_to_variant(self, feature_flag: FeatureFlag, variant_name: Optional[str]) -> Optional[Variant]:
         """
@@ -171,15 +472,21 @@ class FeatureManagerBase(ABC):
 
         :param FeatureFlag feature_flag: Feature flag object.
         :param str variant_name: Name of the variant.
-        :return: Variant object.
+        :return: Variant object, shared by all the evaluations of the feature flag.
         """
         if not feature_flag.variants or not variant_name:
             return None
 
-        for variant_reference in feature_flag.variants:
-            if variant_reference.name == variant_name:
-                return Variant(variant_reference.name, variant_reference.configuration_value)
-        return None
+        variants = self._variants.get(feature_flag)
+        if variants is None:
+            variants = {}
+            for variant_reference in feature_flag.variants:
+                if variant_reference.name and variant_reference.name not in variants:
+                    variants[variant_reference.name] = Variant(
+                        variant_reference.name, variant_reference.configuration_value
+                    )
+            self._variants[feature_flag] = variants
+        return variants.get(variant_name)
 
     def _build_targeting_context(self, args: Tuple[Any]) -> Optional[TargetingContext]:
         """
@@ -199,58 +506,158 @@ class FeatureManagerBase(ABC):
                 return arg
         return None
 
-    def _assign_allocation(self, evaluation_event: EvaluationEvent, targeting_context: TargetingContext) -> None:
-        feature_flag = evaluation_event.feature
+    def _get_cached_feature_flag(self, feature_flag_id: str) -> Optional[FeatureFlag]:
+        """
+        Gets the feature flag from the cache, loading it from the configuration if it isn't cached yet.
+
+        :param str feature_flag_id: Name of the feature flag.
+        :return: FeatureFlag, or None if the feature flag doesn't exist.
+        :rtype: FeatureFlag
+        """
+        feature_flag = self._cache.get(feature_flag_id)
         if not feature_flag:
-            return
+            start_time = time.perf_counter()
+            feature_flag = self._get_feature_flag(feature_flag_id)
+            self._cache[feature_flag_id] = feature_flag
+            if self._metrics and feature_flag:
+                self._metrics.record_compile(feature_flag_id, time.perf_counter() - start_time)
+        return feature_flag
 
-        if not feature_flag.variants or not feature_flag.allocation:
-            return
+    def _resolve_feature_flags(self, feature_flag_ids: List[str]) -> List[Tuple[str, Optional[FeatureFlag]]]:
+        """
+        Resolves a list of feature flags against the current snapshot, so they can be evaluated for several targeting
+        contexts without looking them up again.
 
-        if not evaluation_event.enabled:
-            FeatureManagerBase._assign_default_disabled_variant(evaluation_event)
-            evaluation_event.variant = self._variant_name_to_variant(
-                feature_flag, feature_flag.allocation.default_when_disabled
-            )
-            return
+        :param list[str] feature_flag_ids: Names of the feature flags.
+        :return: Pairs of feature flag name and FeatureFlag, or None if the feature flag doesn't exist.
+        :rtype: list[tuple[str, FeatureFlag]]
+        """
+        self._refresh_snapshot()
+        return [
+            (feature_flag_id, self._get_cached_feature_flag(feature_flag_id)) for feature_flag_id in feature_flag_ids
+        ]
+
+    def _get_constant_state(
+        self, feature_flag: Optional[FeatureFlag], feature_flag_id: str
+    ) -> Optional[EvaluationState]:
+        """
+        Gets the result of a feature flag that doesn't need its feature filters to be evaluated, because it doesn't
+        exist, is disabled, or has the same result for every context.
 
-        self._assign_variant(targeting_context, evaluation_event)
+        :param FeatureFlag feature_flag: The feature flag, or None if it doesn't exist.
+        :param str feature_flag_id: Name of the feature flag.
+        :return: Enabled state, variant name and assignment reason, or None if the feature filters need to be checked.
+        :rtype: tuple[bool, str, str]
+        """
+        if not feature_flag:
+            logger.warning("Feature flag %s not found", feature_flag_id)
+            return UNKNOWN_FEATURE_FLAG_STATE
 
-    def _check_feature_base(self, feature_flag_id: str) -> Tuple[EvaluationEvent, bool]:
+        # Disabled feature flags, and feature flags with a constant result, were folded when they were classified
+        _, constant_state = self._classify_feature_flag(feature_flag)
+        return constant_state
+
+    def _needs_feature_filters(self, feature_flag: FeatureFlag, demand: str) -> bool:
+        """
+        Determine if the feature filters of a feature flag can change the value an entry point needs. Only the variant
+        is needed by get_variant, which is always None for feature flags without variants or allocation. Feature flags
+        with an unknown feature filter are still evaluated, so the error it raises is never skipped.
+
+        :param FeatureFlag feature_flag: The feature flag.
+        :param str demand: What the entry point needs from the evaluation.
+        :return: True if the feature filters have to be evaluated.
+        :rtype: bool
         """
-        Determine if the feature flag is enabled for the given context.
+        if demand != DEMAND_VARIANT or (feature_flag.variants and feature_flag.allocation):
+            return True
+        return any(
+            feature_filter.get(FEATURE_FILTER_NAME) not in self._filter_names
+            for feature_filter in feature_flag.conditions.client_filters
+        )
 
-        :param str feature_flag_id: Name of the feature flag.
-        :return: The evaluation event and if the feature filters need to be checked.
-        :rtype: evaluation_event, bool
+    def _needs_allocation(self, feature_flag: FeatureFlag, enabled: bool, demand: str) -> bool:
         """
-        if self._copy is not self._configuration.get(FEATURE_MANAGEMENT_KEY):
-            self._cache = {}
-            self._copy = self._configuration.get(FEATURE_MANAGEMENT_KEY)
+        Determine if the variant allocation of a feature flag can change the value an entry point needs. Only the
+        enabled state is needed by is_enabled, which the allocation can only change from enabled to disabled if a
+        variant has a status override.
+
+        :param FeatureFlag feature_flag: The feature flag.
+        :param bool enabled: Result of the feature filters.
+        :param str demand: What the entry point needs from the evaluation.
+        :return: True if the variant has to be allocated.
+        :rtype: bool
+        """
+        if demand != DEMAND_ENABLED or not enabled:
+            return True
+        can_disable = self._status_overrides.get(feature_flag.name)
+        if can_disable is None:
+            can_disable = any(variant.status_override == "Disabled" for variant in feature_flag.variants or [])
+            self._status_overrides[feature_flag.name] = can_disable
+        return can_disable
+
+    def _is_evaluation_observed(self, feature_flag: Optional[FeatureFlag]) -> bool:
+        """
+        Determine if an evaluation of the feature flag needs an EvaluationEvent, because it is passed to the
+        on_feature_evaluated callback or recorded by the metrics. Other evaluations only produce an EvaluationState.
 
-        if not self._cache.get(feature_flag_id):
-            feature_flag = self._get_feature_flag(feature_flag_id)
-            self._cache[feature_flag_id] = feature_flag
-        else:
-            feature_flag = self._cache.get(feature_flag_id)
+        :param FeatureFlag feature_flag: The feature flag, or None if it doesn't exist.
+        :return: True if an EvaluationEvent is needed.
+        :rtype: bool
+        """
+        if self._metrics is not None:
+            return True
+        return bool(
+            feature_flag
+            and feature_flag.telemetry.enabled
+            and self._on_feature_evaluated
+            and callable(self._on_feature_evaluated)
+        )
 
-        evaluation_event = EvaluationEvent(feature_flag)
-        if not feature_flag:
-            logger.warning("Feature flag %s not found", feature_flag_id)
-            # Unknown feature flags are disabled by default
-            return evaluation_event, True
+    def _get_snapshot_configuration(self) -> Dict[str, Any]:
+        """
+        Gets a plain copy of the feature flag definitions in the current snapshot. Unlike the configuration, which may
+        be a provider object, the copy can be cheaply pickled and used to create a FeatureManager in another process.
 
-        if not feature_flag.enabled:
-            # Feature flags that are disabled are always disabled
-            self._assign_default_disabled_variant(evaluation_event)
-            if feature_flag.allocation:
-                variant_name = feature_flag.allocation.default_when_disabled
-                evaluation_event.variant = self._variant_name_to_variant(feature_flag, variant_name)
-
-            # If a feature flag is disabled and override can't enable it
-            evaluation_event.enabled = False
-            return evaluation_event, True
-        return evaluation_event, False
+        :return: Configuration containing only the feature flag definitions.
+        :rtype: dict
+        """
+        self._refresh_snapshot()
+        return {FEATURE_MANAGEMENT_KEY: {FEATURE_FLAG_KEY: list(self._get_feature_flags())}}
+
+    def _to_evaluation_result(
+        self, feature_flag: Optional[FeatureFlag], evaluation_state: EvaluationState, snapshot_version: int
+    ) -> EvaluationResult:
+        """
+        Converts an evaluation state to the result returned by evaluate.
+
+        :param FeatureFlag feature_flag: The feature flag the state was evaluated for.
+        :param tuple evaluation_state: Enabled state, variant name and assignment reason.
+        :param int snapshot_version: Version of the snapshot the feature flag was resolved from.
+        :return: Evaluation result.
+        :rtype: EvaluationResult
+        """
+        enabled, variant_name, reason = evaluation_state
+        variant = self._variant_name_to_variant(feature_flag, variant_name) if feature_flag else None
+        return EvaluationResult(enabled, variant, VariantAssignmentReason(reason), snapshot_version)
+
+    def _from_evaluation_state(
+        self, feature_flag: Optional[FeatureFlag], evaluation_state: EvaluationState
+    ) -> EvaluationEvent:
+        """
+        Builds an evaluation event from the state created by _evaluate_feature_state.
+
+        :param FeatureFlag feature_flag: The feature flag the state was evaluated for.
+        :param tuple evaluation_state: Enabled state, variant name and assignment reason.
+        :return: Evaluation event object.
+        :rtype: EvaluationEvent
+        """
+        enabled, variant_name, reason = evaluation_state
+        evaluation_event = EvaluationEvent(feature_flag)
+        evaluation_event.enabled = enabled
+        evaluation_event.reason = VariantAssignmentReason(reason)
+        if feature_flag:
+            evaluation_event.variant = self._variant_name_to_variant(feature_flag, variant_name)
+        return evaluation_event
 
     def list_feature_flag_names(self) -> List[str]:
         """
@@ -0,0 +1,155 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""OpenTelemetry metrics for feature flag evaluation."""
+
+import weakref
+from typing import Any, Callable, Iterable, List, Optional
+from ._models import CacheInfo, EvaluationEvent
+from ._targeting_marker import get_targeting_cache_info
+from ._version import VERSION
+
+try:
+    from opentelemetry.metrics import CallbackOptions, MeterProvider, Observation
+
+    HAS_OPENTELEMETRY_METRICS = True
+except ImportError:
+    HAS_OPENTELEMETRY_METRICS = False
+    CallbackOptions = object  # type: ignore
+    MeterProvider = object  # type: ignore
+    Observation = object  # type: ignore
+
+METER_NAME = "featuremanagement"
+
+FEATURE_FLAG_KEY = "feature_flag.key"
+FEATURE_FLAG_VARIANT = "feature_flag.result.variant"
+FEATURE_FLAG_REASON = "feature_flag.result.reason"
+FEATURE_FILTER_NAME = "feature_flag.filter.name"
+CACHE_NAME = "feature_flag.cache.name"
+
+
+class EvaluationMetrics:
+    """
+    OpenTelemetry instruments of a feature manager.
+
+    :param MeterProvider meter_provider: The meter provider to create the instruments with.
+    :param Any feature_manager: The feature manager whose caches are observed.
+    """
+
+    def __init__(self, meter_provider: MeterProvider, feature_manager: Any) -> None:
+        meter = meter_provider.get_meter(METER_NAME, VERSION)
+        self._evaluations = meter.create_counter(
+            "feature_flag.evaluations", unit="{evaluation}", description="Number of feature flag evaluations."
+        )
+        self._evaluation_duration = meter.create_histogram(
+            "feature_flag.evaluation.duration", unit="s", description="Duration of feature flag evaluations."
+        )
+        self._filter_invocations = meter.create_counter(
+            "feature_flag.filter.invocations", unit="{invocation}", description="Number of feature filter invocations."
+        )
+        self._compile_duration = meter.create_histogram(
+            "feature_flag.compile.duration",
+            unit="s",
+            description="Duration of loading a feature flag from the configuration.",
+        )
+        self._refresh_duration = meter.create_histogram(
+            "feature_flag.snapshot.refresh.duration",
+            unit="s",
+            description="Duration of replacing the feature flag snapshot after the configuration changed.",
+        )
+        feature_manager_ref = weakref.ref(feature_manager)
+        meter.create_observable_gauge(
+            "feature_flag.cache.hit_ratio",
+            callbacks=[_observe_cache_hit_ratios(feature_manager_ref)],
+            unit="1",
+            description="Ratio of cache lookups that were hits.",
+        )
+
+    def record_evaluation(self, evaluation_event: EvaluationEvent, feature_flag_id: str, duration: float) -> None:
+        """
+        Records a feature flag evaluation.
+
+        :param EvaluationEvent evaluation_event: Result of the evaluation.
+        :param str feature_flag_id: Name of the feature flag.
+        :param float duration: Duration of the evaluation, in seconds.
+        """
+        attributes = {
+            FEATURE_FLAG_KEY: feature_flag_id,
+            FEATURE_FLAG_REASON: evaluation_event.reason.value,
+        }
+        if evaluation_event.variant:
+            attributes[FEATURE_FLAG_VARIANT] = evaluation_event.variant.name
+        self._evaluations.add(1, attributes)
+        self._evaluation_duration.record(duration, {FEATURE_FLAG_KEY: feature_flag_id})
+
+    def record_filter_invocation(self, feature_flag_name: str, filter_name: str) -> None:
+        """
+        Records a feature filter invocation. Results served from the filter result cache aren't invocations.
+
+        :param str feature_flag_name: Name of the feature flag.
+        :param str filter_name: Name of the feature filter.
+        """
+        self._filter_invocations.add(1, {FEATURE_FLAG_KEY: feature_flag_name, FEATURE_FILTER_NAME: filter_name})
+
+    def record_compile(self, feature_flag_id: str, duration: float) -> None:
+        """
+        Records loading a feature flag from the configuration.
+
+        :param str feature_flag_id: Name of the feature flag.
+        :param float duration: Duration of loading the feature flag, in seconds.
+        """
+        self._compile_duration.record(duration, {FEATURE_FLAG_KEY: feature_flag_id})
+
+    def record_refresh(self, duration: float) -> None:
+        """
+        Records replacing the feature flag snapshot.
+
+        :param float duration: Duration of the refresh, in seconds.
+        """
+        self._refresh_duration.record(duration)
+
+
+def _observe_cache_hit_ratios(
+    feature_manager_ref: "weakref.ReferenceType[Any]",
+) -> Callable[[CallbackOptions], Iterable[Observation]]:
+    def callback(_options: CallbackOptions) -> Iterable[Observation]:
+        observations: List[Observation] = []
+        feature_manager = feature_manager_ref()
+        if feature_manager is None:
+            return observations
+        caches = (
+            ("result", feature_manager.result_cache_info),
+            ("filter_result", feature_manager.filter_result_cache_info),
+            ("targeting", get_targeting_cache_info()),
+        )
+        for cache_name, cache_info in caches:
+            hit_ratio = _get_hit_ratio(cache_info)
+            if hit_ratio is not None:
+                observations.append(Observation(hit_ratio, {CACHE_NAME: cache_name}))
+        return observations
+
+    return callback
+
+
+def _get_hit_ratio(cache_info: Optional[CacheInfo]) -> Optional[float]:
+    if cache_info is None or not cache_info.hits + cache_info.misses:
+        return None
+    return cache_info.hits / (cache_info.hits + cache_info.misses)
+
+
+def create_evaluation_metrics(
+    meter_provider: Optional[MeterProvider], feature_manager: Any
+) -> Optional[EvaluationMetrics]:
+    """
+    Creates the instruments of a feature manager, if a meter provider is configured.
+
+    :param MeterProvider meter_provider: The meter provider, or None to disable metrics.
+    :param Any feature_manager: The feature manager whose caches are observed.
+    :return: The instruments, or None if metrics are disabled.
+    :rtype: EvaluationMetrics
+    """
+    if meter_provider is None or not HAS_OPENTELEMETRY_METRICS:
+        return None
+    return EvaluationMetrics(meter_provider, feature_manager)
@@ -8,9 +8,14 @@
 from ._feature_flag import FeatureFlag
 from ._variant import Variant
 from ._evaluation_event import EvaluationEvent
+from ._evaluation_result import EvaluationResult
 from ._variant_assignment_reason import VariantAssignmentReason
 from ._targeting_context import TargetingContext
 from ._variant_reference import VariantReference
+from ._client_payload import ClientPayload
+from ._cache_info import CacheInfo
+from ._feature_flag_classification import FeatureFlagClassification
+from ._profile_stats import ProfileStats, SlowEvaluation
 
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
@@ -18,7 +23,13 @@ __all__ = [
     "FeatureFlag",
     "Variant",
     "EvaluationEvent",
+    "EvaluationResult",
     "VariantAssignmentReason",
     "TargetingContext",
     "VariantReference",
+    "ClientPayload",
+    "CacheInfo",
+    "FeatureFlagClassification",
+    "ProfileStats",
+    "SlowEvaluation",
 ]
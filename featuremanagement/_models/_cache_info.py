@@ -0,0 +1,49 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Cache statistics model."""
+
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """
+    Represents the statistics of a bounded cache.
+    """
+
+    hits: int
+    """
+    Number of lookups that found a valid entry.
+
+    :type: int
+    """
+
+    misses: int
+    """
+    Number of lookups that found no valid entry.
+
+    :type: int
+    """
+
+    evictions: int
+    """
+    Number of entries removed to stay within the maximum size.
+
+    :type: int
+    """
+
+    maxsize: int
+    """
+    Maximum number of entries.
+
+    :type: int
+    """
+
+    currsize: int
+    """
+    Current number of entries.
+
+    :type: int
+    """
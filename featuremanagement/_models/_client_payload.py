@@ -0,0 +1,106 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Serialized feature flag state for client applications."""
+
+import hashlib
+import json
+from typing import Any, Dict, Mapping, Optional
+from ._evaluation_event import EvaluationEvent
+
+PAYLOAD_FEATURE_FLAGS = "feature_flags"
+PAYLOAD_ENABLED = "enabled"
+PAYLOAD_VARIANT = "variant"
+PAYLOAD_CONFIGURATION = "configuration"
+
+
+class ClientPayload:
+    """
+    Represents the evaluated state of a set of feature flags for a single targeting context, serialized as compact
+    JSON for delivery to client applications. The content, and so the ETag, only depend on the state of the feature
+    flags, so the same state has the same ETag across snapshots and application instances.
+
+    :param bytes content: The serialized payload.
+    :param int snapshot_version: Version of the feature flag configuration the payload was evaluated against.
+    """
+
+    def __init__(self, content: bytes, snapshot_version: int) -> None:
+        self._content = content
+        self._snapshot_version = snapshot_version
+        self._etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+
+    @classmethod
+    def from_evaluation_events(
+        cls, evaluation_events: Mapping[str, EvaluationEvent], snapshot_version: int
+    ) -> "ClientPayload":
+        """
+        Serialize a set of evaluation events to a ClientPayload.
+
+        :param Mapping[str, EvaluationEvent] evaluation_events: Evaluation events keyed by feature flag name.
+        :param int snapshot_version: Version of the feature flag configuration.
+        :return: ClientPayload.
+        :rtype: ClientPayload
+        """
+        feature_flags: Dict[str, Dict[str, Any]] = {}
+        for feature_flag_id, evaluation_event in evaluation_events.items():
+            state: Dict[str, Any] = {PAYLOAD_ENABLED: evaluation_event.enabled}
+            if evaluation_event.variant:
+                state[PAYLOAD_VARIANT] = evaluation_event.variant.name
+                if evaluation_event.variant.configuration is not None:
+                    state[PAYLOAD_CONFIGURATION] = evaluation_event.variant.configuration
+            feature_flags[feature_flag_id] = state
+        content = json.dumps(
+            {PAYLOAD_FEATURE_FLAGS: feature_flags},
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode()
+        return cls(content, snapshot_version)
+
+    @property
+    def content(self) -> bytes:
+        """
+        The serialized payload, as UTF-8 encoded JSON.
+
+        :rtype: bytes
+        """
+        return self._content
+
+    @property
+    def etag(self) -> str:
+        """
+        Strong entity tag of the payload, suitable for the ETag response header.
+
+        :rtype: str
+        """
+        return self._etag
+
+    @property
+    def snapshot_version(self) -> int:
+        """
+        Version of the feature flag configuration the payload was evaluated against.
+
+        :rtype: int
+        """
+        return self._snapshot_version
+
+    def is_not_modified(self, if_none_match: Optional[str]) -> bool:
+        """
+        Determine if a client already has this payload, based on the value of its If-None-Match request header.
+
+        :param str if_none_match: Value of the If-None-Match header, if any.
+        :return: True if a 304 Not Modified response can be returned.
+        :rtype: bool
+        """
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*":
+                return True
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag == self._etag:
+                return True
+        return False
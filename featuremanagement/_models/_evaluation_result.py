@@ -0,0 +1,44 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Evaluation result model."""
+
+from typing import NamedTuple, Optional
+from ._variant import Variant
+from ._variant_assignment_reason import VariantAssignmentReason
+
+
+class EvaluationResult(NamedTuple):
+    """
+    Represents the result of a single evaluation of a feature flag.
+    """
+
+    enabled: bool
+    """
+    True if the feature flag is enabled for the context.
+
+    :type: bool
+    """
+
+    variant: Optional[Variant]
+    """
+    The variant assigned to the context, if any.
+
+    :type: Variant
+    """
+
+    reason: VariantAssignmentReason
+    """
+    The reason the variant was assigned.
+
+    :type: VariantAssignmentReason
+    """
+
+    snapshot_version: int
+    """
+    Version of the feature flag configuration the feature flag was evaluated against.
+
+    :type: int
+    """
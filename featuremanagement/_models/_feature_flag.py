@@ -131,6 +131,9 @@ class FeatureFlag:
         if not isinstance(self._enabled, bool):
             raise ValueError(f"Invalid setting 'enabled' with value '{self._enabled}' for feature '{self._id}'.")
         self.conditions._validate(self._id)  # pylint: disable=protected-access
+        sample_rate = self._telemetry.sample_rate
+        if isinstance(sample_rate, bool) or not isinstance(sample_rate, (int, float)) or not 0 <= sample_rate <= 1:
+            raise ValueError(f"Invalid setting 'sample_rate' with value '{sample_rate}' for feature '{self._id}'.")
 
 
 def _convert_boolean_value(enabled: Union[str, bool], feature_name: str) -> bool:
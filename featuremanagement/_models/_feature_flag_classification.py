@@ -0,0 +1,26 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Enum for feature flag classifications."""
+
+from enum import Enum
+
+
+class FeatureFlagClassification(Enum):
+    """
+    Represents what the evaluation result of a feature flag depends on.
+    """
+
+    CONSTANT = "Constant"
+    """The result is the same for every context, now and in the future."""
+
+    CONTEXT_DEPENDENT = "ContextDependent"
+    """The result only depends on the user and groups of the targeting context."""
+
+    TIME_DEPENDENT = "TimeDependent"
+    """The result depends on the current time, and possibly on the user and groups of the targeting context."""
+
+    CUSTOM_FILTER_DEPENDENT = "CustomFilterDependent"
+    """The result depends on custom feature filters, so it can't be determined ahead of time."""
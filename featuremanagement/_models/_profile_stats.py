@@ -0,0 +1,70 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Evaluation profiling models."""
+
+from typing import NamedTuple, Optional, Tuple
+
+
+class ProfileStats(NamedTuple):
+    """
+    Represents the timing statistics of a step of feature flag evaluation.
+    """
+
+    calls: int
+    """
+    Number of times the step ran.
+
+    :type: int
+    """
+
+    total_time: float
+    """
+    Total duration of the step, in seconds.
+
+    :type: float
+    """
+
+    max_time: float
+    """
+    Longest duration of the step, in seconds.
+
+    :type: float
+    """
+
+
+class SlowEvaluation(NamedTuple):
+    """
+    Represents a feature flag evaluation that took longer than the slow threshold of the profiler.
+    """
+
+    feature_flag_name: str
+    """
+    Name of the feature flag.
+
+    :type: str
+    """
+
+    duration: float
+    """
+    Duration of the evaluation, in seconds.
+
+    :type: float
+    """
+
+    timestamp: float
+    """
+    POSIX timestamp of the end of the evaluation.
+
+    :type: float
+    """
+
+    steps: Tuple[Tuple[Optional[str], float], ...]
+    """
+    Names and durations in seconds of the feature filters that ran, in order, with None as the name of the variant
+    allocation step. Cached filter results are not included.
+
+    :type: tuple[tuple[str, float], ...]
+    """
@@ -17,3 +17,4 @@ class Telemetry:
 
     enabled: bool = False
     metadata: Dict[str, str] = field(default_factory=dict)
+    sample_rate: float = 1.0
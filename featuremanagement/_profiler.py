@@ -0,0 +1,159 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Profiling of feature filters and variant allocation."""
+
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Deque, Dict, List, Optional, Tuple
+from ._models import ProfileStats, SlowEvaluation
+
+DEFAULT_SLOW_THRESHOLD = 0.01
+DEFAULT_MAX_SLOW_SAMPLES = 100
+
+# Feature filters and allocation that ran in the current evaluation, as (filter name or None, duration) pairs
+_evaluation_steps: ContextVar[Optional[List[Tuple[Optional[str], float]]]] = ContextVar(
+    "featuremanagement_evaluation_steps", default=None
+)
+
+
+class EvaluationProfiler:
+    """
+    Collects timing statistics of feature flag evaluations, feature filters and variant allocation. Pass an instance
+    as the profiler keyword argument of a FeatureManager to enable profiling. Feature managers without a profiler skip
+    all timing.
+
+    :keyword float slow_threshold: Duration in seconds above which an evaluation is sampled as a slow evaluation, with
+     the durations of its feature filters and allocation. Defaults to 0.01.
+    :keyword int max_slow_samples: Maximum number of kept slow evaluations. The oldest samples are dropped first.
+     Defaults to 100.
+    """
+
+    def __init__(
+        self, *, slow_threshold: float = DEFAULT_SLOW_THRESHOLD, max_slow_samples: int = DEFAULT_MAX_SLOW_SAMPLES
+    ) -> None:
+        self._slow_threshold = slow_threshold
+        self._evaluation_stats: Dict[str, ProfileStats] = {}
+        self._filter_stats: Dict[Tuple[str, str], ProfileStats] = {}
+        self._allocation_stats: Dict[str, ProfileStats] = {}
+        self._slow_evaluations: Deque[SlowEvaluation] = deque(maxlen=max_slow_samples)
+        self._lock = threading.Lock()
+
+    def start_evaluation(self) -> "Token[Optional[List[Tuple[Optional[str], float]]]]":
+        """
+        Starts collecting the steps of a feature flag evaluation in the current thread or asyncio task.
+
+        :return: Token to pass to record_evaluation when the evaluation ends.
+        :rtype: ~contextvars.Token
+        """
+        return _evaluation_steps.set([])
+
+    def record_evaluation(
+        self, token: "Token[Optional[List[Tuple[Optional[str], float]]]]", feature_flag_name: str, duration: float
+    ) -> None:
+        """
+        Records a feature flag evaluation started with start_evaluation. If it took longer than the slow threshold,
+        it's sampled with the durations of its steps.
+
+        :param ~contextvars.Token token: Token returned by start_evaluation.
+        :param str feature_flag_name: Name of the feature flag.
+        :param float duration: Duration of the evaluation, in seconds.
+        """
+        steps = _evaluation_steps.get() or []
+        _evaluation_steps.reset(token)
+        with self._lock:
+            self._evaluation_stats[feature_flag_name] = _add_duration(
+                self._evaluation_stats.get(feature_flag_name), duration
+            )
+            if duration > self._slow_threshold:
+                self._slow_evaluations.append(SlowEvaluation(feature_flag_name, duration, time.time(), tuple(steps)))
+
+    def record_filter(self, feature_flag_name: str, filter_name: str, duration: float) -> None:
+        """
+        Records the evaluation of a feature filter.
+
+        :param str feature_flag_name: Name of the feature flag.
+        :param str filter_name: Name of the feature filter.
+        :param float duration: Duration of the evaluation, in seconds.
+        """
+        steps = _evaluation_steps.get()
+        if steps is not None:
+            steps.append((filter_name, duration))
+        with self._lock:
+            key = (feature_flag_name, filter_name)
+            self._filter_stats[key] = _add_duration(self._filter_stats.get(key), duration)
+
+    def record_allocation(self, feature_flag_name: str, duration: float) -> None:
+        """
+        Records the variant allocation of a feature flag.
+
+        :param str feature_flag_name: Name of the feature flag.
+        :param float duration: Duration of the allocation, in seconds.
+        """
+        steps = _evaluation_steps.get()
+        if steps is not None:
+            steps.append((None, duration))
+        with self._lock:
+            self._allocation_stats[feature_flag_name] = _add_duration(
+                self._allocation_stats.get(feature_flag_name), duration
+            )
+
+    @property
+    def evaluation_stats(self) -> Dict[str, ProfileStats]:
+        """
+        Timing statistics of whole feature flag evaluations, keyed by feature flag name.
+
+        :rtype: dict[str, ProfileStats]
+        """
+        with self._lock:
+            return dict(self._evaluation_stats)
+
+    @property
+    def filter_stats(self) -> Dict[Tuple[str, str], ProfileStats]:
+        """
+        Timing statistics of the feature filters, keyed by feature flag name and filter name.
+
+        :rtype: dict[tuple[str, str], ProfileStats]
+        """
+        with self._lock:
+            return dict(self._filter_stats)
+
+    @property
+    def allocation_stats(self) -> Dict[str, ProfileStats]:
+        """
+        Timing statistics of the variant allocation, keyed by feature flag name.
+
+        :rtype: dict[str, ProfileStats]
+        """
+        with self._lock:
+            return dict(self._allocation_stats)
+
+    @property
+    def slow_evaluations(self) -> List[SlowEvaluation]:
+        """
+        The most recent evaluations that took longer than the slow threshold, oldest first.
+
+        :rtype: list[SlowEvaluation]
+        """
+        with self._lock:
+            return list(self._slow_evaluations)
+
+    def reset(self) -> None:
+        """
+        Clears all statistics and slow evaluation samples.
+        """
+        with self._lock:
+            self._evaluation_stats.clear()
+            self._filter_stats.clear()
+            self._allocation_stats.clear()
+            self._slow_evaluations.clear()
+
+
+def _add_duration(stats: Optional[ProfileStats], duration: float) -> ProfileStats:
+    if stats is None:
+        return ProfileStats(1, duration, duration)
+    return ProfileStats(stats.calls + 1, stats.total_time + duration, max(stats.max_time, duration))
@@ -0,0 +1,84 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Bounded cache of feature flag evaluation results."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+from ._models import CacheInfo
+
+T = TypeVar("T")
+
+
+class ResultCache(Generic[T]):
+    """
+    Thread-safe least recently used cache, where every entry can have its own expiry time.
+
+    :param int maxsize: Maximum number of entries.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("The cache size must be greater than 0")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[T, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """
+        Gets a cached value.
+
+        :param Hashable key: Key of the entry.
+        :return: The cached value, or None if there is no valid entry.
+        :rtype: Any
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or time.time() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, value: T, expires_at: Optional[float] = None) -> None:
+        """
+        Adds a value to the cache, evicting the least recently used entry if the cache is full.
+
+        :param Hashable key: Key of the entry.
+        :param Any value: Value to cache.
+        :param float expires_at: POSIX timestamp at which the entry expires, or None if it doesn't expire.
+        """
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all entries. The statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Gets the statistics of the cache.
+
+        :return: Cache statistics.
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._entries))
@@ -0,0 +1,47 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Targeting context of the current request, held in a context variable."""
+
+from contextvars import ContextVar, Token
+from typing import Optional
+from ._models import TargetingContext
+
+_current_targeting_context: ContextVar[Optional[TargetingContext]] = ContextVar(
+    "featuremanagement_targeting_context", default=None
+)
+
+
+def set_targeting_context(targeting_context: Optional[TargetingContext]) -> "Token[Optional[TargetingContext]]":
+    """
+    Sets the targeting context of the current thread or asyncio task, such as at the start of a request. The feature
+    managers and the TargetingSpanProcessor use it when no targeting context is provided, before calling the
+    targeting_context_accessor.
+
+    :param TargetingContext targeting_context: The targeting context, or None to clear it.
+    :return: Token to restore the previous targeting context with reset_targeting_context.
+    :rtype: ~contextvars.Token
+    """
+    return _current_targeting_context.set(targeting_context)
+
+
+def reset_targeting_context(token: "Token[Optional[TargetingContext]]") -> None:
+    """
+    Restores the targeting context that was current before set_targeting_context was called, such as at the end of a
+    request.
+
+    :param ~contextvars.Token token: Token returned by set_targeting_context.
+    """
+    _current_targeting_context.reset(token)
+
+
+def get_targeting_context() -> Optional[TargetingContext]:
+    """
+    Gets the targeting context of the current thread or asyncio task.
+
+    :return: The targeting context, or None if it isn't set.
+    :rtype: TargetingContext
+    """
+    return _current_targeting_context.get()
@@ -0,0 +1,39 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Memoized hashing of targeting context ids."""
+
+import hashlib
+from functools import lru_cache
+from ._models import CacheInfo
+
+CONTEXT_MARKER_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=CONTEXT_MARKER_CACHE_SIZE)
+def get_context_marker(context_id: str) -> int:
+    """
+    Gets the 32-bit marker of a targeting context id, used to place the user in a rollout or percentile allocation.
+    The markers of recently used context ids are cached.
+
+    :param str context_id: The context id, such as the user id and the feature flag name separated by a newline.
+    :return: The first four bytes of the SHA-256 hash of the context id, as a little-endian unsigned integer.
+    :rtype: int
+    """
+    hashed_context_id = hashlib.sha256(context_id.encode()).digest()
+    return int.from_bytes(hashed_context_id[:4], byteorder="little", signed=False)
+
+
+def get_targeting_cache_info() -> CacheInfo:
+    """
+    Gets the statistics of the cache of targeting context markers, which is shared by the targeting filter and
+    percentile allocation.
+
+    :return: Cache statistics.
+    :rtype: CacheInfo
+    """
+    info = get_context_marker.cache_info()
+    # Every miss adds an entry, so the entries that are no longer cached have been evicted
+    return CacheInfo(info.hits, info.misses, info.misses - info.currsize, info.maxsize or 0, info.currsize)
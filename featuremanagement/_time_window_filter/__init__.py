@@ -5,7 +5,7 @@
 # -------------------------------------------------------------------------
 """Time window filter with recurrence support."""
 
-from ._recurrence_evaluator import is_match
+from ._recurrence_evaluator import is_match, get_next_transition
 from ._models import Recurrence, TimeWindowFilterSettings
 
-__all__ = ["is_match", "Recurrence", "TimeWindowFilterSettings"]
+__all__ = ["is_match", "get_next_transition", "Recurrence", "TimeWindowFilterSettings"]
@@ -42,6 +42,34 @@ def is_match(settings: TimeWindowFilterSettings, now: datetime) -> bool:
     return now < occurrence_end_date
 
 
+def get_next_transition(settings: TimeWindowFilterSettings, now: datetime) -> Optional[datetime]:
+    """
+    Get the earliest time after now at which the time window filter result may change. For recurring time windows,
+    the returned time may be earlier than the actual change, but never later.
+
+    :param TimeWindowFilterSettings settings: The settings for the time window filter.
+    :param datetime now: The current time.
+    :return: The time of the next transition, or None if the result never changes again.
+    :rtype: datetime
+    """
+    start = settings.start
+    end = settings.end
+    if start is not None and now < start:
+        return start
+    if end is not None and now < end:
+        return end
+    recurrence = settings.recurrence
+    if recurrence is None or start is None or end is None:
+        return None
+
+    # Occurrences always start a whole number of days after the first one
+    next_transition = start + timedelta(days=(now - start).days + 1)
+    previous_occurrence = _get_previous_occurrence(recurrence, start, now)
+    if previous_occurrence is not None and now < previous_occurrence + (end - start):
+        next_transition = min(next_transition, previous_occurrence + (end - start))
+    return next_transition
+
+
 def _get_previous_occurrence(recurrence: Recurrence, start: datetime, now: datetime) -> Optional[datetime]:
     if now < start:
         return None
@@ -8,5 +8,6 @@
 from ._featuremanager import FeatureManager
 from ._featurefilters import FeatureFilter
 from ._defaultfilters import TimeWindowFilter, TargetingFilter
+from ._event_bus import EvaluationEventBus
 
-__all__ = ["FeatureManager", "TimeWindowFilter", "TargetingFilter", "FeatureFilter"]
+__all__ = ["FeatureManager", "TimeWindowFilter", "TargetingFilter", "FeatureFilter", "EvaluationEventBus"]
@@ -0,0 +1,130 @@
+# ------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Delivery of evaluation events to several asyncio subscribers."""
+
+import asyncio
+import contextvars
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from .._models import EvaluationEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 1024
+
+Subscriber = Callable[[EvaluationEvent], Union[None, Awaitable[None]]]
+
+
+class _Subscriber:
+    def __init__(self, callback: Subscriber, max_queue_size: int) -> None:
+        self.callback = callback
+        self.queue: "asyncio.Queue[Tuple[EvaluationEvent, contextvars.Context]]" = asyncio.Queue(max_queue_size)
+        self.dropped_events = 0
+        self.task: "Optional[asyncio.Task[Any]]" = None
+
+    async def run(self) -> None:
+        """
+        Delivers the queued events to the callback until cancelled.
+        """
+        while True:
+            evaluation_event, context = await self.queue.get()
+            try:
+                result = context.run(self.callback, evaluation_event)
+                if inspect.isawaitable(result):
+                    # The task runs in a copy of the current context, which is the context of the event here
+                    await context.run(asyncio.ensure_future, result)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Evaluation event subscriber %s failed.", self.callback)
+            finally:
+                self.queue.task_done()
+
+
+class EvaluationEventBus:
+    """
+    Delivers evaluation events to several subscribers, each with its own bounded queue consumed by an asyncio task, so
+    a slow subscriber neither blocks evaluations nor the other subscribers. Subscribers can be functions or coroutine
+    functions, and are called in a copy of the context the event was published in, so they see the OpenTelemetry
+    trace and span of the evaluation. When the queue of a subscriber is full, new events for that subscriber are
+    dropped. Pass an instance as the on_feature_evaluated callback of a FeatureManager. The tasks run on the event loop
+    the first events are published from.
+
+    :keyword int max_queue_size: Maximum number of queued events per subscriber. Defaults to 1024.
+    """
+
+    def __init__(self, *, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be greater than 0")
+        self._max_queue_size = max_queue_size
+        self._subscribers: List[_Subscriber] = []
+
+    def subscribe(self, callback: Subscriber) -> Subscriber:
+        """
+        Adds a subscriber. Can be used as a decorator.
+
+        :param Callable callback: Function or coroutine function called with every evaluation event.
+        :return: The callback.
+        :rtype: Callable
+        """
+        self._subscribers.append(_Subscriber(callback, self._max_queue_size))
+        return callback
+
+    async def unsubscribe(self, callback: Subscriber) -> None:
+        """
+        Removes a subscriber after the events already queued for it are delivered.
+
+        :param Callable callback: The callback of the subscriber.
+        """
+        removed = [subscriber for subscriber in self._subscribers if subscriber.callback == callback]
+        self._subscribers = [subscriber for subscriber in self._subscribers if subscriber.callback != callback]
+        await self._stop(removed)
+
+    def __call__(self, evaluation_event: EvaluationEvent) -> None:
+        """
+        Queues an evaluation event for every subscriber. Must be called from the event loop.
+
+        :param EvaluationEvent evaluation_event: The evaluation event.
+        """
+        context = contextvars.copy_context()
+        for subscriber in self._subscribers:
+            if subscriber.task is None:
+                subscriber.task = asyncio.ensure_future(subscriber.run())
+            try:
+                subscriber.queue.put_nowait((evaluation_event, context))
+            except asyncio.QueueFull:
+                subscriber.dropped_events += 1
+
+    @property
+    def dropped_events(self) -> Dict[Subscriber, int]:
+        """
+        Number of events dropped per subscriber because its queue was full.
+
+        :rtype: dict[Callable, int]
+        """
+        return {subscriber.callback: subscriber.dropped_events for subscriber in self._subscribers}
+
+    async def flush(self) -> None:
+        """
+        Waits until all queued events are delivered.
+        """
+        await asyncio.gather(*(subscriber.queue.join() for subscriber in self._subscribers if subscriber.task))
+
+    async def shutdown(self) -> None:
+        """
+        Delivers the queued events and cancels the subscriber tasks. Events published afterwards are ignored.
+        """
+        subscribers, self._subscribers = self._subscribers, []
+        await self._stop(subscribers)
+
+    @staticmethod
+    async def _stop(subscribers: List[_Subscriber]) -> None:
+        tasks = []
+        for subscriber in subscribers:
+            if subscriber.task is not None:
+                await subscriber.queue.join()
+                subscriber.task.cancel()
+                tasks.append(subscriber.task)
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -6,7 +6,7 @@
 """Base class for async feature filters."""
 
 from abc import ABC, abstractmethod
-from typing import Mapping, Callable, Any, Optional
+from typing import Mapping, Callable, Any, Optional, Iterable, Tuple
 
 
 class FeatureFilter(ABC):
@@ -15,6 +15,9 @@ class FeatureFilter(ABC):
     """
 
     _alias: Optional[str] = None
+    _cacheable: bool = False
+    _cache_depends_on: Tuple[str, ...] = ()
+    _cache_ttl: Optional[float] = None
 
     @abstractmethod
     async def evaluate(self, context: Mapping[Any, Any], **kwargs: Any) -> bool:
@@ -51,3 +54,26 @@ class FeatureFilter(ABC):
             return cls
 
         return wrapper
+
+    @staticmethod
+    def cacheable(depends_on: Iterable[str] = ("user", "groups"), ttl: Optional[float] = None) -> Callable[..., Any]:
+        """
+        Decorator to declare that the filter is pure, so the feature manager can reuse its results. The result of a
+        pure filter only depends on its parameters and on the listed keyword arguments, and it has no side effects.
+        Results are reused within the same feature flag snapshot.
+
+        :param Iterable[str] depends_on: Names of the keyword arguments the result depends on, by default the user
+         and groups of the targeting context.
+        :param float ttl: Number of seconds a result can be reused for, or None if it can be reused until the
+         feature flags are refreshed.
+        :return: Decorator
+        :rtype: Callable
+        """
+
+        def wrapper(cls: "FeatureFilter") -> Any:
+            cls._cacheable = True  # pylint: disable=protected-access
+            cls._cache_depends_on = tuple(depends_on)  # pylint: disable=protected-access
+            cls._cache_ttl = ttl  # pylint: disable=protected-access
+            return cls
+
+        return wrapper
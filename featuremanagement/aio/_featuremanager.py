@@ -5,21 +5,55 @@
 # -------------------------------------------------------------------------
 """Async feature manager implementation."""
 
+import asyncio
 import inspect
 import logging
-from typing import cast, overload, Any, Optional, Dict, Mapping, List, Tuple
+import time
+from datetime import datetime, timezone
+from typing import (
+    cast,
+    overload,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Optional,
+    Dict,
+    Iterable,
+    Mapping,
+    List,
+    Tuple,
+    Union,
+)
 from ._defaultfilters import TimeWindowFilter, TargetingFilter
+from .._defaultfilters import EVALUATION_TIME_KEY
 from ._featurefilters import FeatureFilter
-from .._models import EvaluationEvent, Variant, TargetingContext
+from .._models import (
+    EvaluationEvent,
+    EvaluationResult,
+    FeatureFlag,
+    Variant,
+    VariantAssignmentReason,
+    TargetingContext,
+    ClientPayload,
+)
+from .._targeting_context_var import get_targeting_context
 from .._featuremanagerbase import (
     FeatureManagerBase,
     PROVIDED_FEATURE_FILTERS,
     REQUIREMENT_TYPE_ALL,
     FEATURE_FILTER_NAME,
+    DEFAULT_CHUNK_SIZE,
+    EvaluationState,
+    UNKNOWN_FEATURE_FLAG_STATE,
+    DEMAND_ENABLED,
+    DEMAND_VARIANT,
+    DEMAND_ALL,
 )
 
 logger = logging.getLogger(__name__)
 
+BUILTIN_FILTER_TYPES = (TimeWindowFilter, TargetingFilter)
+
 
 class FeatureManager(FeatureManagerBase):
     """
@@ -31,10 +65,21 @@ class FeatureManager(FeatureManagerBase):
     evaluated.
     :keyword Callable[[], TargetingContext] targeting_context_accessor: Callback function to get the current targeting
     context if one isn't provided.
+    :keyword int result_cache_size: If set, evaluation results of feature flags that only use the built-in filters are
+    cached per user and groups, in a least recently used cache of this size.
+    :keyword int filter_result_cache_size: Size of the least recently used cache of results of feature filters
+    declared with FeatureFilter.cacheable. Set to 0 to disable it. Defaults to 1024.
+    :keyword EvaluationProfiler profiler: Profiler collecting the durations of feature flag evaluations, feature
+    filters and variant allocation. Profiling is disabled if not set.
+    :keyword MeterProvider meter_provider: OpenTelemetry meter provider used to record evaluation counts and durations,
+    feature filter invocations, snapshot refresh durations and cache hit ratios. Metrics are disabled if not set.
+    :keyword bool concurrent_filter_evaluation: If True, the feature filters of a feature flag are evaluated
+    concurrently, and the remaining filters are cancelled as soon as the result is decided. Defaults to False.
     """
 
     def __init__(self, configuration: Mapping[str, Any], **kwargs: Any):
         super().__init__(configuration, **kwargs)
+        self._concurrent_filter_evaluation: bool = kwargs.pop("concurrent_filter_evaluation", False)
         self._filters: Dict[str, FeatureFilter] = {}
         filters = [TimeWindowFilter(), TargetingFilter()] + cast(
             List[FeatureFilter], kwargs.pop(PROVIDED_FEATURE_FILTERS, [])
@@ -44,6 +89,10 @@ class FeatureManager(FeatureManagerBase):
             if not isinstance(feature_filter, FeatureFilter):
                 raise ValueError("Custom filter must be a subclass of FeatureFilter")
             self._filters[feature_filter.name] = feature_filter
+        self._builtin_filter_names = {
+            name for name, feature_filter in self._filters.items() if type(feature_filter) in BUILTIN_FILTER_TYPES
+        }
+        self._filter_names = set(self._filters)
 
     @overload  # type: ignore
     async def is_enabled(self, feature_flag_id: str, user_id: str, **kwargs: Any) -> bool:
@@ -66,19 +115,16 @@ class FeatureManager(FeatureManagerBase):
         """
         targeting_context: TargetingContext = await self._build_targeting_context_async(args)
 
-        result = await self._check_feature(feature_flag_id, targeting_context, **kwargs)
-        if (
-            self._on_feature_evaluated
-            and result.feature
-            and result.feature.telemetry.enabled
-            and callable(self._on_feature_evaluated)
-        ):
-            result.user = targeting_context.user_id
-            if inspect.iscoroutinefunction(self._on_feature_evaluated):
-                await self._on_feature_evaluated(result)
-            else:
-                self._on_feature_evaluated(result)
-        return result.enabled
+        self._refresh_snapshot()
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        if self._is_evaluation_observed(feature_flag):
+            result = await self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+            await self._invoke_on_feature_evaluated(result, targeting_context)
+            return result.enabled
+        enabled, _, _ = await self._evaluate_feature_state(
+            feature_flag, feature_flag_id, targeting_context, DEMAND_ENABLED, **kwargs
+        )
+        return enabled
 
     @overload  # type: ignore
     async def get_variant(self, feature_flag_id: str, user_id: str, **kwargs: Any) -> Optional[Variant]:
@@ -102,7 +148,183 @@ class FeatureManager(FeatureManagerBase):
         """
         targeting_context: TargetingContext = await self._build_targeting_context_async(args)
 
-        result = await self._check_feature(feature_flag_id, targeting_context, **kwargs)
+        self._refresh_snapshot()
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        if self._is_evaluation_observed(feature_flag):
+            result = await self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+            await self._invoke_on_feature_evaluated(result, targeting_context)
+            return result.variant
+        _, variant_name, _ = await self._evaluate_feature_state(
+            feature_flag, feature_flag_id, targeting_context, DEMAND_VARIANT, **kwargs
+        )
+        return self._variant_name_to_variant(feature_flag, variant_name) if feature_flag else None
+
+    @overload  # type: ignore
+    async def evaluate(self, feature_flag_id: str, user_id: str, **kwargs: Any) -> EvaluationResult:
+        """
+        Determine the enabled state and the variant of the feature flag for the given context.
+
+        :param str feature_flag_id: Name of the feature flag.
+        :param str user_id: User identifier.
+        :return: Enabled state, variant, assignment reason and snapshot version of the evaluation.
+        :rtype: EvaluationResult
+        """
+
+    async def evaluate(self, feature_flag_id: str, *args: Any, **kwargs: Any) -> EvaluationResult:
+        """
+        Determine the enabled state and the variant of the feature flag for the given context. Unlike calling
+        is_enabled and then get_variant, the feature flag is evaluated once and the on_feature_evaluated callback is
+        called once.
+
+        :param str feature_flag_id: Name of the feature flag.
+        :return: Enabled state, variant, assignment reason and snapshot version of the evaluation.
+        :rtype: EvaluationResult
+        """
+        targeting_context: TargetingContext = await self._build_targeting_context_async(args)
+
+        self._refresh_snapshot()
+        snapshot_version = self._snapshot_version
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        if self._is_evaluation_observed(feature_flag):
+            result = await self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+            await self._invoke_on_feature_evaluated(result, targeting_context)
+            return EvaluationResult(result.enabled, result.variant, result.reason, snapshot_version)
+        evaluation_state = await self._evaluate_feature_state(
+            feature_flag, feature_flag_id, targeting_context, DEMAND_ALL, **kwargs
+        )
+        return self._to_evaluation_result(feature_flag, evaluation_state, snapshot_version)
+
+    async def get_client_payload(self, *args: Any, feature_flag_ids: Iterable[str], **kwargs: Any) -> ClientPayload:
+        """
+        Evaluate feature flags for the given context and serialize their enabled state, variant name and variant
+        configuration to a compact JSON payload for client applications. The targeting context is resolved once for
+        all feature flags. Only the feature flags that are explicitly listed are included, as the payload is visible
+        to the client.
+
+        :keyword Iterable[str] feature_flag_ids: Names of the feature flags that are visible to the client.
+        :return: Serialized feature flag state, with the snapshot version and an ETag.
+        :rtype: ClientPayload
+        """
+        targeting_context: TargetingContext = await self._build_targeting_context_async(args)
+        # The version is read right after the feature flags are resolved, so both come from the same snapshot
+        feature_flags = self._resolve_feature_flags(list(feature_flag_ids))
+        snapshot_version = self._snapshot_version
+        results = await self._evaluate_resolved_feature_flags(feature_flags, targeting_context, **kwargs)
+        return ClientPayload.from_evaluation_events(results, snapshot_version)
+
+    async def evaluate_many(
+        self, feature_flag_ids: Iterable[str], *args: Any, **kwargs: Any
+    ) -> Dict[str, EvaluationEvent]:
+        """
+        Evaluate several feature flags for the same context. The targeting context is resolved once for all feature
+        flags, and the on_feature_evaluated callback is called for all of them once they are evaluated. When
+        concurrent_filter_evaluation is enabled, the feature flags are also evaluated concurrently.
+
+        :param Iterable[str] feature_flag_ids: Names of the feature flags to evaluate.
+        :return: Mapping of feature flag name to EvaluationEvent.
+        :rtype: dict[str, EvaluationEvent]
+        """
+        targeting_context: TargetingContext = await self._build_targeting_context_async(args)
+        feature_flags = self._resolve_feature_flags(list(feature_flag_ids))
+        return await self._evaluate_resolved_feature_flags(feature_flags, targeting_context, **kwargs)
+
+    async def _evaluate_resolved_feature_flags(
+        self,
+        feature_flags: List[Tuple[str, Optional[FeatureFlag]]],
+        targeting_context: TargetingContext,
+        **kwargs: Any,
+    ) -> Dict[str, EvaluationEvent]:
+        results: List[EvaluationEvent]
+        if self._concurrent_filter_evaluation:
+            results = await asyncio.gather(
+                *(
+                    self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+                    for feature_flag_id, feature_flag in feature_flags
+                )
+            )
+        else:
+            results = []
+            for feature_flag_id, feature_flag in feature_flags:
+                results.append(
+                    await self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+                )
+
+        for result in results:
+            result.user = targeting_context.user_id
+        await self._invoke_on_features_evaluated(results)
+        return {feature_flag_id: result for (feature_flag_id, _), result in zip(feature_flags, results)}
+
+    def evaluate_stream(
+        self,
+        contexts: Union[Iterable[Union[str, TargetingContext]], AsyncIterable[Union[str, TargetingContext]]],
+        feature_flag_ids: Iterable[str],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> AsyncIterator[List[Dict[str, EvaluationEvent]]]:
+        """
+        Lazily evaluate feature flags for a stream of targeting contexts. Contexts are consumed in chunks, so memory use
+        only depends on the chunk size, not on the size of the input. Feature flags are resolved once per chunk.
+
+        :param contexts: User ids or TargetingContexts to evaluate the feature flags for.
+        :type contexts: Iterable or AsyncIterable
+        :param Iterable[str] feature_flag_ids: Names of the feature flags to evaluate.
+        :keyword int chunk_size: Number of contexts evaluated per chunk.
+        :return: Async iterator yielding, for every chunk, one mapping of feature flag name to EvaluationEvent per
+        context, in input order.
+        :rtype: AsyncIterator[list[dict[str, EvaluationEvent]]]
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+        # Not a generator itself, so an invalid chunk size raises when called instead of on first iteration
+        return self._evaluate_stream(contexts, list(feature_flag_ids), chunk_size, **kwargs)
+
+    async def _evaluate_stream(
+        self,
+        contexts: Union[Iterable[Union[str, TargetingContext]], AsyncIterable[Union[str, TargetingContext]]],
+        feature_flag_ids: List[str],
+        chunk_size: int,
+        **kwargs: Any,
+    ) -> AsyncIterator[List[Dict[str, EvaluationEvent]]]:
+        chunk: List[Union[str, TargetingContext]] = []
+        if isinstance(contexts, AsyncIterable):
+            async for context in contexts:
+                chunk.append(context)
+                if len(chunk) >= chunk_size:
+                    yield await self._evaluate_chunk(chunk, feature_flag_ids, **kwargs)
+                    chunk = []
+        else:
+            for context in contexts:
+                chunk.append(context)
+                if len(chunk) >= chunk_size:
+                    yield await self._evaluate_chunk(chunk, feature_flag_ids, **kwargs)
+                    chunk = []
+        if chunk:
+            yield await self._evaluate_chunk(chunk, feature_flag_ids, **kwargs)
+
+    async def _evaluate_chunk(
+        self, chunk: List[Union[str, TargetingContext]], feature_flag_ids: List[str], **kwargs: Any
+    ) -> List[Dict[str, EvaluationEvent]]:
+        feature_flags = self._resolve_feature_flags(feature_flag_ids)
+        results = []
+        for context in chunk:
+            targeting_context = super()._build_targeting_context((context,)) or TargetingContext()
+            context_results: Dict[str, EvaluationEvent] = {}
+            for feature_flag_id, feature_flag in feature_flags:
+                result = await self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+                result.user = targeting_context.user_id
+                await self._invoke_on_feature_evaluated(result, targeting_context)
+                context_results[feature_flag_id] = result
+            results.append(context_results)
+        return results
+
+    async def _invoke_on_feature_evaluated(self, result: EvaluationEvent, targeting_context: TargetingContext) -> None:
+        """
+        Calls the on_feature_evaluated callback, if the feature flag has telemetry enabled.
+
+        :param EvaluationEvent result: Evaluation event of the feature flag.
+        :param TargetingContext targeting_context: Targeting context the feature flag was evaluated for.
+        """
         if (
             self._on_feature_evaluated
             and result.feature
@@ -114,10 +336,25 @@ class FeatureManager(FeatureManagerBase):
                 await self._on_feature_evaluated(result)
             else:
                 self._on_feature_evaluated(result)
-        return result.variant
+
+    async def _invoke_on_features_evaluated(self, results: List[EvaluationEvent]) -> None:
+        """
+        Calls the on_feature_evaluated callback for every feature flag with telemetry enabled. Async callbacks are
+        awaited together.
+
+        :param list[EvaluationEvent] results: Evaluation events, with the user already set.
+        """
+        if not self._on_feature_evaluated or not callable(self._on_feature_evaluated):
+            return
+        published = [result for result in results if result.feature and result.feature.telemetry.enabled]
+        if inspect.iscoroutinefunction(self._on_feature_evaluated):
+            await asyncio.gather(*(self._on_feature_evaluated(result) for result in published))
+            return
+        for result in published:
+            self._on_feature_evaluated(result)
 
     async def _build_targeting_context_async(self, args: Tuple[Any]) -> TargetingContext:
-        targeting_context = super()._build_targeting_context(args)
+        targeting_context = super()._build_targeting_context(args) or get_targeting_context()
         if targeting_context:
             return targeting_context
         if not targeting_context and self._targeting_context_accessor and callable(self._targeting_context_accessor):
@@ -136,35 +373,109 @@ class FeatureManager(FeatureManagerBase):
         return TargetingContext()
 
     async def _check_feature_filters(
-        self, evaluation_event: EvaluationEvent, targeting_context: TargetingContext, **kwargs: Any
-    ) -> None:
-        feature_flag = evaluation_event.feature
-        if not feature_flag:
-            return
+        self, feature_flag: FeatureFlag, targeting_context: TargetingContext, **kwargs: Any
+    ) -> bool:
         feature_conditions = feature_flag.conditions
         feature_filters = feature_conditions.client_filters
 
         if len(feature_filters) == 0:
             # Feature flags without any filters return evaluate
-            evaluation_event.enabled = True
-        else:
-            # The assumed value is no filters is based on the requirement type.
-            # Requirement type Any assumes false until proven true, All assumes true until proven false
-            evaluation_event.enabled = feature_conditions.requirement_type == REQUIREMENT_TYPE_ALL
+            return True
+        # The assumed value is no filters is based on the requirement type.
+        # Requirement type Any assumes false until proven true, All assumes true until proven false
+        enabled = feature_conditions.requirement_type == REQUIREMENT_TYPE_ALL
 
-        for feature_filter in feature_filters:
+        if self._concurrent_filter_evaluation and len(feature_filters) > 1:
+            kwargs["user"] = targeting_context.user_id
+            kwargs["groups"] = targeting_context.groups
+            for feature_filter in feature_filters:
+                filter_name = feature_filter[FEATURE_FILTER_NAME]
+                if filter_name not in self._filters:
+                    raise ValueError(f"Feature flag {feature_flag.name} has unknown filter {filter_name}")
+            return await self._check_feature_filters_concurrently(
+                feature_flag.name,
+                feature_filters,
+                feature_conditions.requirement_type == REQUIREMENT_TYPE_ALL,
+                **kwargs,
+            )
+
+        for filter_index, feature_filter in enumerate(feature_filters):
             filter_name = feature_filter[FEATURE_FILTER_NAME]
             kwargs["user"] = targeting_context.user_id
             kwargs["groups"] = targeting_context.groups
             if filter_name not in self._filters:
                 raise ValueError(f"Feature flag {feature_flag.name} has unknown filter {filter_name}")
             if feature_conditions.requirement_type == REQUIREMENT_TYPE_ALL:
-                if not await self._filters[filter_name].evaluate(feature_filter, **kwargs):
-                    evaluation_event.enabled = False
+                if not await self._evaluate_feature_filter(feature_flag.name, filter_index, feature_filter, **kwargs):
+                    enabled = False
                     break
-            elif await self._filters[filter_name].evaluate(feature_filter, **kwargs):
-                evaluation_event.enabled = True
+            elif await self._evaluate_feature_filter(feature_flag.name, filter_index, feature_filter, **kwargs):
+                enabled = True
                 break
+        return enabled
+
+    async def _evaluate_feature_filter(
+        self, feature_flag_name: str, filter_index: int, feature_filter: Mapping[str, Any], **kwargs: Any
+    ) -> bool:
+        """
+        Evaluates a feature filter, reusing the cached result of filters declared as cacheable.
+
+        :param str feature_flag_name: Name of the feature flag the filter belongs to.
+        :param int filter_index: Position of the filter in the conditions of the feature flag.
+        :param Mapping feature_filter: The feature filter configuration.
+        :return: The result of the feature filter.
+        :rtype: bool
+        """
+        filter_instance = self._filters[feature_filter[FEATURE_FILTER_NAME]]
+        cache_key = self._get_filter_cache_key(filter_instance, feature_flag_name, filter_index, kwargs)
+        if cache_key is not None:
+            cached_result = self._load_filter_result(cache_key)
+            if cached_result is not None:
+                return cached_result
+        if self._profiler is None:
+            result = bool(await filter_instance.evaluate(feature_filter, **kwargs))
+        else:
+            start_time = time.perf_counter()
+            result = bool(await filter_instance.evaluate(feature_filter, **kwargs))
+            self._profiler.record_filter(feature_flag_name, filter_instance.name, time.perf_counter() - start_time)
+        if self._metrics:
+            self._metrics.record_filter_invocation(feature_flag_name, filter_instance.name)
+        if cache_key is not None:
+            self._cache_filter_result(cache_key, filter_instance, result)
+        return result
+
+    async def _check_feature_filters_concurrently(
+        self, feature_flag_name: str, feature_filters: List[Dict[str, Any]], requirement_all: bool, **kwargs: Any
+    ) -> bool:
+        """
+        Evaluates feature filters concurrently. With requirement type All, the first filter that returns False decides
+        the result, with requirement type Any the first filter that returns True does. The filters that are still
+        running once the result is decided are cancelled.
+
+        :param str feature_flag_name: Name of the feature flag the filters belong to.
+        :param list[dict] feature_filters: Feature filters to evaluate.
+        :param bool requirement_all: True if the requirement type is All, False if it is Any.
+        :return: True if the feature filters enable the feature flag.
+        :rtype: bool
+        """
+        pending = {
+            asyncio.ensure_future(
+                self._evaluate_feature_filter(feature_flag_name, filter_index, feature_filter, **kwargs)
+            )
+            for filter_index, feature_filter in enumerate(feature_filters)
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if bool(task.result()) != requirement_all:
+                        return not requirement_all
+            return requirement_all
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     async def _check_feature(
         self, feature_flag_id: str, targeting_context: TargetingContext, **kwargs: Any
@@ -177,12 +488,114 @@ class FeatureManager(FeatureManagerBase):
         :return: EvaluationEvent for the given context.
         :rtype: EvaluationEvent
         """
-        evaluation_event, done = super()._check_feature_base(feature_flag_id)
+        self._refresh_snapshot()
+        feature_flag = self._get_cached_feature_flag(feature_flag_id)
+        return await self._check_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
 
-        if done:
-            return evaluation_event
-
-        await self._check_feature_filters(evaluation_event, targeting_context, **kwargs)
+    async def _check_feature_flag(
+        self,
+        feature_flag: Optional[FeatureFlag],
+        feature_flag_id: str,
+        targeting_context: TargetingContext,
+        **kwargs: Any,
+    ) -> EvaluationEvent:
+        """
+        Determine if an already resolved feature flag is enabled for the given context.
 
-        self._assign_allocation(evaluation_event, targeting_context)
+        :param FeatureFlag feature_flag: The feature flag, or None if it doesn't exist.
+        :param str feature_flag_id: Name of the feature flag.
+        :param TargetingContext targeting_context: Targeting context.
+        :return: EvaluationEvent for the given context.
+        :rtype: EvaluationEvent
+        """
+        if self._metrics is None:
+            return await self._evaluate_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+        start_time = time.perf_counter()
+        evaluation_event = await self._evaluate_feature_flag(feature_flag, feature_flag_id, targeting_context, **kwargs)
+        self._metrics.record_evaluation(evaluation_event, feature_flag_id, time.perf_counter() - start_time)
         return evaluation_event
+
+    async def _evaluate_feature_flag(
+        self,
+        feature_flag: Optional[FeatureFlag],
+        feature_flag_id: str,
+        targeting_context: TargetingContext,
+        **kwargs: Any,
+    ) -> EvaluationEvent:
+        evaluation_state = await self._evaluate_feature_state(
+            feature_flag, feature_flag_id, targeting_context, DEMAND_ALL, **kwargs
+        )
+        return self._from_evaluation_state(feature_flag, evaluation_state)
+
+    async def _evaluate_feature_state(
+        self,
+        feature_flag: Optional[FeatureFlag],
+        feature_flag_id: str,
+        targeting_context: TargetingContext,
+        demand: str,
+        **kwargs: Any,
+    ) -> EvaluationState:
+        """
+        Determine the enabled state, variant and reason of a feature flag for the given context, without creating an
+        EvaluationEvent. Feature filters and allocation that can't change the value the caller needs are skipped.
+
+        :param FeatureFlag feature_flag: The feature flag, or None if it doesn't exist.
+        :param str feature_flag_id: Name of the feature flag.
+        :param TargetingContext targeting_context: Targeting context.
+        :param str demand: What the caller needs from the evaluation, one of DEMAND_ENABLED, DEMAND_VARIANT or
+        DEMAND_ALL.
+        :return: Enabled state, variant name and assignment reason.
+        :rtype: tuple[bool, str, str]
+        """
+        constant_state = self._get_constant_state(feature_flag, feature_flag_id)
+        if constant_state is not None or not feature_flag:
+            return constant_state or UNKNOWN_FEATURE_FLAG_STATE
+
+        if not self._needs_feature_filters(feature_flag, demand):
+            return False, None, VariantAssignmentReason.NONE.value
+
+        if self._profiler is None:
+            return await self._evaluate_feature_filters(feature_flag, targeting_context, demand, **kwargs)
+        token = self._profiler.start_evaluation()
+        start_time = time.perf_counter()
+        try:
+            return await self._evaluate_feature_filters(feature_flag, targeting_context, demand, **kwargs)
+        finally:
+            self._profiler.record_evaluation(token, feature_flag.name, time.perf_counter() - start_time)
+
+    async def _evaluate_feature_filters(
+        self, feature_flag: FeatureFlag, targeting_context: TargetingContext, demand: str, **kwargs: Any
+    ) -> EvaluationState:
+        """
+        Determine the enabled state, variant and reason of a feature flag whose state depends on its feature filters,
+        using the result cache if it's enabled.
+
+        :param FeatureFlag feature_flag: The feature flag.
+        :param TargetingContext targeting_context: Targeting context.
+        :param str demand: What the caller needs from the evaluation, one of DEMAND_ENABLED, DEMAND_VARIANT or
+        DEMAND_ALL.
+        :return: Enabled state, variant name and assignment reason.
+        :rtype: tuple[bool, str, str]
+        """
+        cache_key = self._get_result_cache_key(feature_flag, targeting_context, kwargs)
+        if cache_key is not None:
+            cached_state = self._load_cached_state(cache_key)
+            if cached_state is not None:
+                return cached_state
+            # The time windows are evaluated at the same time the expiry of the result is computed from
+            kwargs[EVALUATION_TIME_KEY] = datetime.now(timezone.utc)
+
+        enabled = await self._check_feature_filters(feature_flag, targeting_context, **kwargs)
+        # Partial results aren't cached
+        if cache_key is None and not self._needs_allocation(feature_flag, enabled, demand):
+            return enabled, None, VariantAssignmentReason.NONE.value
+
+        if self._profiler is None:
+            evaluation_state = self._allocate(feature_flag, enabled, targeting_context)
+        else:
+            start_time = time.perf_counter()
+            evaluation_state = self._allocate(feature_flag, enabled, targeting_context)
+            self._profiler.record_allocation(feature_flag.name, time.perf_counter() - start_time)
+        if cache_key is not None:
+            self._cache_state(cache_key, feature_flag, evaluation_state, kwargs[EVALUATION_TIME_KEY])
+        return evaluation_state
@@ -6,9 +6,17 @@
 """Azure Monitor telemetry integration for feature management."""
 
 from ._send_telemetry import publish_telemetry, track_event, TargetingSpanProcessor
+from ._batch_publisher import BatchTelemetryPublisher
+from ._exposure_aggregator import ExposureAggregator
+from ._deduplicator import TelemetryDeduplicator
+from ._file_exporter import FileTelemetryExporter
 
 __all__ = [
     "publish_telemetry",
     "track_event",
     "TargetingSpanProcessor",
+    "BatchTelemetryPublisher",
+    "ExposureAggregator",
+    "TelemetryDeduplicator",
+    "FileTelemetryExporter",
 ]
@@ -0,0 +1,201 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Batched, non-blocking publishing of feature evaluation events."""
+
+import atexit
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+from .._models import EvaluationEvent
+from ._send_telemetry import _publish_sampled_telemetry, _sample
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+DEFAULT_MAX_QUEUE_SIZE = 2048
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+class BatchTelemetryPublisher:  # pylint: disable=too-many-instance-attributes
+    """
+    Publishes feature evaluation events from a background thread, so evaluations don't wait for telemetry. Events are
+    queued in a bounded queue and published in batches, either when a batch is full or when the flush interval
+    elapses. Each event is published in the context it was queued in, so the OpenTelemetry trace and span of the
+    evaluation are kept. An instance can be used directly as the on_feature_evaluated callback of a FeatureManager.
+
+    :keyword int max_queue_size: Maximum number of queued events. Defaults to 2048.
+    :keyword int batch_size: Number of queued events that triggers a flush. Defaults to 512.
+    :keyword float flush_interval: Maximum number of seconds an event stays queued. Defaults to 5.
+    :keyword str overflow_policy: What to do when the queue is full, either "drop_oldest" to drop the oldest queued
+     event, or "drop_newest" to drop the new event. Defaults to "drop_oldest".
+    :keyword Callable[[EvaluationEvent], None] publisher: Function publishing a single event kept by sampling. Defaults
+     to publishing the telemetry the way publish_telemetry does, with the rate the event was kept at as SampleRate.
+    :keyword float sample_rate: Fraction of users to publish events for, overriding the sample_rate of the feature
+     flags. Events are sampled before they are queued.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._max_queue_size: int = kwargs.pop("max_queue_size", DEFAULT_MAX_QUEUE_SIZE)
+        self._batch_size: int = kwargs.pop("batch_size", DEFAULT_BATCH_SIZE)
+        self._flush_interval: float = kwargs.pop("flush_interval", DEFAULT_FLUSH_INTERVAL)
+        self._overflow_policy: str = kwargs.pop("overflow_policy", DROP_OLDEST)
+        self._publisher: Optional[Callable[[EvaluationEvent], None]] = kwargs.pop("publisher", None)
+        self._sample_rate: Optional[float] = kwargs.pop("sample_rate", None)
+        if self._max_queue_size < 1 or self._batch_size < 1:
+            raise ValueError("max_queue_size and batch_size must be greater than 0")
+        if self._overflow_policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown overflow policy {self._overflow_policy}")
+
+        # Queued events, with the rate they were kept at and the context they were queued in
+        self._queue: Deque[Tuple[EvaluationEvent, float, contextvars.Context]] = deque()
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._in_flight = 0
+        self._flush_requested = False
+        self._shutdown = False
+        self._dropped_events = 0
+        self._published_events = 0
+
+    def __call__(self, evaluation_event: EvaluationEvent) -> None:
+        """
+        Queues an evaluation event for publishing. If the queue is full, an event is dropped according to the
+        overflow policy.
+
+        :param EvaluationEvent evaluation_event: The evaluation event to publish.
+        """
+        sample_rate = _sample(evaluation_event, self._sample_rate)
+        if sample_rate is None:
+            return
+        context = contextvars.copy_context()
+        with self._condition:
+            if self._shutdown:
+                self._dropped_events += 1
+                return
+            if len(self._queue) >= self._max_queue_size:
+                self._dropped_events += 1
+                if self._overflow_policy == DROP_NEWEST:
+                    return
+                self._queue.popleft()
+            self._queue.append((evaluation_event, sample_rate, context))
+            if self._worker is None:
+                self._start_worker()
+            if len(self._queue) >= self._batch_size:
+                self._condition.notify_all()
+
+    @property
+    def dropped_events(self) -> int:
+        """
+        Number of events dropped because the queue was full or the publisher was shut down.
+
+        :rtype: int
+        """
+        with self._condition:
+            return self._dropped_events
+
+    @property
+    def published_events(self) -> int:
+        """
+        Number of events handed to the publisher.
+
+        :rtype: int
+        """
+        with self._condition:
+            return self._published_events
+
+    @property
+    def queue_size(self) -> int:
+        """
+        Number of events waiting to be published.
+
+        :rtype: int
+        """
+        with self._condition:
+            return len(self._queue)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Publishes all queued events, and waits until they are published.
+
+        :param float timeout: Maximum number of seconds to wait, or None to wait until done.
+        :return: True if all events were published before the timeout.
+        :rtype: bool
+        """
+        with self._condition:
+            if self._worker is None:
+                return not self._queue
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Publishes the queued events and stops the background thread. Events queued after shutdown are dropped.
+
+        :param float timeout: Maximum number of seconds to wait for the queued events to be published.
+        """
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            self._condition.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+            atexit.unregister(self.shutdown)
+
+    def _start_worker(self) -> None:
+        self._worker = threading.Thread(target=self._run, name="FeatureManagementTelemetry", daemon=True)
+        self._worker.start()
+        atexit.register(self.shutdown)
+
+    def _next_batch(self) -> Optional[List[Tuple[EvaluationEvent, float, contextvars.Context]]]:
+        """
+        Waits until a batch is due, and takes it from the queue.
+
+        :return: The events to publish with the rates they were kept at and the contexts they were queued in, or None
+         if the publisher was shut down and the queue is empty.
+        :rtype: list[tuple[EvaluationEvent, float, ~contextvars.Context]]
+        """
+        with self._condition:
+            deadline = time.monotonic() + self._flush_interval
+            while not self._shutdown and not self._flush_requested and len(self._queue) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if not self._queue:
+                self._flush_requested = False
+                self._condition.notify_all()
+                return None if self._shutdown else []
+            batch = [self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))]
+            if not self._queue:
+                self._flush_requested = False
+            self._in_flight = len(batch)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            for evaluation_event, sample_rate, context in batch:
+                try:
+                    if self._publisher is None:
+                        context.run(_publish_sampled_telemetry, evaluation_event, sample_rate)
+                    else:
+                        context.run(self._publisher, evaluation_event)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Failed to publish the evaluation event of %s.", evaluation_event.feature)
+            with self._condition:
+                self._published_events += len(batch)
+                self._in_flight = 0
+                self._condition.notify_all()
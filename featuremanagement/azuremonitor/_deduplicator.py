@@ -0,0 +1,102 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Deduplication of feature evaluation events."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+from .._models import EvaluationEvent
+from ._send_telemetry import publish_telemetry
+
+DEFAULT_WINDOW = 300.0
+DEFAULT_MAX_SIZE = 10000
+
+# Targeting ID, feature flag name, variant name and enabled state
+DeduplicationKey = Tuple[str, str, Optional[str], bool]
+
+
+class TelemetryDeduplicator:
+    """
+    Suppresses repeated feature evaluation events. An event is only published if the same user didn't get the same
+    result for the same feature flag within the deduplication window, so a user evaluating a feature flag on every
+    request produces one event per window. Events without a targeting ID are always published. An instance can be used
+    directly as the on_feature_evaluated callback of a FeatureManager.
+
+    :keyword float window: Number of seconds a published result suppresses the same result. Defaults to 300.
+    :keyword int max_size: Maximum number of remembered results. When full, the oldest result is forgotten.
+     Defaults to 10000.
+    :keyword Callable[[EvaluationEvent], None] publisher: Function publishing the events that aren't suppressed, such
+     as a BatchTelemetryPublisher. Defaults to publish_telemetry.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._window: float = kwargs.pop("window", DEFAULT_WINDOW)
+        self._max_size: int = kwargs.pop("max_size", DEFAULT_MAX_SIZE)
+        self._publisher: Callable[[EvaluationEvent], None] = kwargs.pop("publisher", publish_telemetry)
+        if self._max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+        self._published: "OrderedDict[DeduplicationKey, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._suppressed_events = 0
+        self._published_events = 0
+
+    def __call__(self, evaluation_event: EvaluationEvent) -> None:
+        """
+        Publishes an evaluation event, unless the same result was published within the deduplication window.
+
+        :param EvaluationEvent evaluation_event: The evaluation event.
+        """
+        feature = evaluation_event.feature
+        if feature and evaluation_event.user:
+            variant_name = evaluation_event.variant.name if evaluation_event.variant else None
+            key = (evaluation_event.user, feature.name, variant_name, evaluation_event.enabled)
+            now = time.monotonic()
+            with self._lock:
+                # Results are ordered by the time they were published, so expired results are at the front
+                while self._published:
+                    oldest_key, published_at = next(iter(self._published.items()))
+                    if now - published_at < self._window:
+                        break
+                    del self._published[oldest_key]
+                if key in self._published:
+                    self._suppressed_events += 1
+                    return
+                self._published[key] = now
+                if len(self._published) > self._max_size:
+                    self._published.popitem(last=False)
+                self._published_events += 1
+        else:
+            with self._lock:
+                self._published_events += 1
+        self._publisher(evaluation_event)
+
+    @property
+    def suppressed_events(self) -> int:
+        """
+        Number of events suppressed as duplicates.
+
+        :rtype: int
+        """
+        with self._lock:
+            return self._suppressed_events
+
+    @property
+    def published_events(self) -> int:
+        """
+        Number of events passed to the publisher.
+
+        :rtype: int
+        """
+        with self._lock:
+            return self._published_events
+
+    def clear(self) -> None:
+        """
+        Forgets all published results, so the next event of every result is published. The counters are kept.
+        """
+        with self._lock:
+            self._published.clear()
@@ -0,0 +1,184 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Aggregated feature exposure telemetry."""
+
+import atexit
+import hashlib
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+from .._models import EvaluationEvent
+from ._send_telemetry import track_event, FEATURE_NAME, ENABLED, VARIANT, REASON, VERSION
+
+logger = logging.getLogger(__name__)
+
+EXPOSURE_EVENT_NAME = "FeatureExposureSummary"
+EXPOSURE_EVENT_VERSION = "1.0.0"
+COUNT = "Count"
+DISTINCT_USERS = "DistinctUsers"
+INTERVAL_START = "IntervalStart"
+INTERVAL_END = "IntervalEnd"
+
+DEFAULT_FLUSH_INTERVAL = 60.0
+DEFAULT_PRECISION = 12
+
+# Feature flag name, enabled state, variant name and assignment reason
+ExposureKey = Tuple[str, bool, Optional[str], str]
+
+
+class _HyperLogLog:
+    """
+    HyperLogLog estimator of the number of distinct values, using 2 ** precision one byte registers.
+
+    :param int precision: Number of bits of the hash used to select a register, between 4 and 16.
+    """
+
+    def __init__(self, precision: int) -> None:
+        self._precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, value: str) -> None:
+        """
+        Adds a value to the estimator.
+
+        :param str value: The value.
+        """
+        hashed = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+        index = hashed >> (64 - self._precision)
+        remaining = hashed & ((1 << (64 - self._precision)) - 1)
+        rank = 64 - self._precision - remaining.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def count(self) -> int:
+        """
+        Estimates the number of distinct values added.
+
+        :return: The estimate.
+        :rtype: int
+        """
+        register_count = len(self._registers)
+        if register_count >= 128:
+            alpha = 0.7213 / (1 + 1.079 / register_count)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[register_count]
+        estimate = alpha * register_count**2 / sum(2.0**-register for register in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * register_count and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = register_count * math.log(register_count / zeros)
+        return round(estimate)
+
+
+@dataclass
+class _Exposure:
+    users: _HyperLogLog
+    count: int = 0
+
+
+class ExposureAggregator:  # pylint: disable=too-many-instance-attributes
+    """
+    Aggregates feature evaluation events instead of publishing each one. Evaluations are counted per feature flag,
+    enabled state, variant and assignment reason, and the number of distinct users is estimated with HyperLogLog. Once
+    per flush interval, one summary event per feature flag, enabled state, variant and reason is tracked. An instance
+    can be used directly as the on_feature_evaluated callback of a FeatureManager.
+
+    :keyword float flush_interval: Number of seconds between summaries. Defaults to 60.
+    :keyword int precision: HyperLogLog precision, between 4 and 16. Higher precisions use 2 ** precision bytes per
+     summary for a relative error of about 1.04 / sqrt(2 ** precision). Defaults to 12, about 1.6%.
+    :keyword str event_name: Name of the summary events. Defaults to "FeatureExposureSummary".
+    :keyword Callable tracker: Function tracking a summary event, with the signature of track_event. Defaults to
+     track_event.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._flush_interval: float = kwargs.pop("flush_interval", DEFAULT_FLUSH_INTERVAL)
+        self._precision: int = kwargs.pop("precision", DEFAULT_PRECISION)
+        self._event_name: str = kwargs.pop("event_name", EXPOSURE_EVENT_NAME)
+        self._tracker: Callable[[str, str, Optional[Dict[str, Optional[str]]]], None] = kwargs.pop(
+            "tracker", track_event
+        )
+        if not 4 <= self._precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+
+        self._exposures: Dict[ExposureKey, _Exposure] = {}
+        self._interval_start = datetime.now(timezone.utc)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def __call__(self, evaluation_event: EvaluationEvent) -> None:
+        """
+        Adds an evaluation event to the current interval.
+
+        :param EvaluationEvent evaluation_event: The evaluation event.
+        """
+        feature = evaluation_event.feature
+        if not feature:
+            return
+        variant_name = evaluation_event.variant.name if evaluation_event.variant else None
+        key = (feature.name, evaluation_event.enabled, variant_name, evaluation_event.reason.value)
+        with self._lock:
+            exposure = self._exposures.get(key)
+            if exposure is None:
+                exposure = self._exposures[key] = _Exposure(_HyperLogLog(self._precision))
+            exposure.count += 1
+            if evaluation_event.user:
+                exposure.users.add(evaluation_event.user)
+            if self._worker is None and not self._stop.is_set():
+                self._worker = threading.Thread(target=self._run, name="FeatureManagementExposures", daemon=True)
+                self._worker.start()
+                atexit.register(self.shutdown)
+
+    def flush(self) -> None:
+        """
+        Tracks the summaries of the current interval and starts a new interval.
+        """
+        interval_end = datetime.now(timezone.utc)
+        with self._lock:
+            exposures, self._exposures = self._exposures, {}
+            interval_start, self._interval_start = self._interval_start, interval_end
+        for (feature_name, enabled, variant_name, reason), exposure in exposures.items():
+            event_properties: Dict[str, Optional[str]] = {
+                FEATURE_NAME: feature_name,
+                ENABLED: str(enabled),
+                REASON: reason,
+                COUNT: str(exposure.count),
+                DISTINCT_USERS: str(exposure.users.count()),
+                INTERVAL_START: interval_start.isoformat(),
+                INTERVAL_END: interval_end.isoformat(),
+                VERSION: EXPOSURE_EVENT_VERSION,
+            }
+            if variant_name:
+                event_properties[VARIANT] = variant_name
+            try:
+                self._tracker(self._event_name, "", event_properties)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Failed to track the exposure summary of %s.", feature_name)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background thread and tracks the summaries of the current interval.
+
+        :param float timeout: Maximum number of seconds to wait for the background thread to stop.
+        """
+        with self._lock:
+            self._stop.set()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+            atexit.unregister(self.shutdown)
+        self.flush()
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self._flush_interval
+        while not self._stop.wait(max(next_flush - time.monotonic(), 0)):
+            self.flush()
+            next_flush += self._flush_interval
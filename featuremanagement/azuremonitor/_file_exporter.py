@@ -0,0 +1,208 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Local file export of feature evaluation events."""
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, List, Optional, Union
+from .._models import EvaluationEvent
+from ._send_telemetry import _get_event_properties, EVENT_NAME, TARGETING_ID
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BUFFER_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+TIMESTAMP = "timestamp"
+NAME = "name"
+PROPERTIES = "properties"
+
+
+class FileTelemetryExporter:  # pylint: disable=too-many-instance-attributes
+    """
+    Writes feature evaluation events to a local file as newline delimited JSON, with the same properties
+    publish_telemetry publishes. Events are buffered and written in batches, when the buffer is full or, from a
+    background thread, when the flush interval elapses. The file is rotated when it grows past max_bytes or gets older
+    than rotation_interval, and rotated files can be compressed with gzip by the background thread. Buffered events
+    are written when the exporter is closed, which happens at interpreter exit at the latest. An instance can be used
+    directly as the on_feature_evaluated callback of a FeatureManager.
+
+    :param str path: Path of the file to write to. Rotated files get a UTC timestamp suffix.
+    :keyword int max_bytes: Size in bytes after which the file is rotated, or 0 to disable size based rotation.
+     Defaults to 10 MiB.
+    :keyword float rotation_interval: Number of seconds after which the file is rotated, or None to disable time based
+     rotation. Defaults to None.
+    :keyword int buffer_size: Number of buffered events that triggers a write. Defaults to 100.
+    :keyword float flush_interval: Maximum number of seconds an event stays buffered. Defaults to 5.
+    :keyword bool compress: Whether rotated files are compressed with gzip. Defaults to False.
+    :keyword float sample_rate: Fraction of users to write events for, overriding the sample_rate of the feature
+     flags.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], **kwargs: Any) -> None:
+        self._path = os.fspath(path)
+        self._max_bytes: int = kwargs.pop("max_bytes", DEFAULT_MAX_BYTES)
+        self._rotation_interval: Optional[float] = kwargs.pop("rotation_interval", None)
+        self._buffer_size: int = kwargs.pop("buffer_size", DEFAULT_BUFFER_SIZE)
+        self._flush_interval: float = kwargs.pop("flush_interval", DEFAULT_FLUSH_INTERVAL)
+        self._compress: bool = kwargs.pop("compress", False)
+        self._sample_rate: Optional[float] = kwargs.pop("sample_rate", None)
+
+        self._lines: List[str] = []
+        self._first_buffered_at = 0.0
+        self._file: Optional[BinaryIO] = None
+        self._file_size = 0
+        self._opened_at = 0.0
+        self._closed = False
+        self._write_failed = False
+        self._pending_compression: List[str] = []
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        atexit.register(self.close)
+
+    def __call__(self, evaluation_event: EvaluationEvent) -> None:
+        """
+        Buffers an evaluation event, writing the buffer if it is full. If writing fails, the error is logged, the
+        events stay buffered and the background thread retries after the flush interval.
+
+        :param EvaluationEvent evaluation_event: The evaluation event.
+        """
+        event_properties = _get_event_properties(evaluation_event, self._sample_rate)
+        if event_properties is None:
+            return
+        if evaluation_event.user:
+            event_properties[TARGETING_ID] = evaluation_event.user
+        line = json.dumps(
+            {
+                TIMESTAMP: datetime.now(timezone.utc).isoformat(),
+                NAME: EVENT_NAME,
+                PROPERTIES: event_properties,
+            },
+            separators=(",", ":"),
+        )
+        with self._condition:
+            if self._closed:
+                return
+            self._lines.append(line + "\n")
+            if len(self._lines) >= self._buffer_size and not self._write_failed:
+                self._try_write_buffer()
+            elif len(self._lines) == 1:
+                # Starts the flush interval of the buffer
+                self._first_buffered_at = time.monotonic()
+                self._start_worker()
+
+    def flush(self) -> None:
+        """
+        Writes all buffered events to the file. If writing fails, the events stay buffered and the error is raised.
+        """
+        with self._condition:
+            self._write_buffer()
+
+    def close(self) -> None:
+        """
+        Writes all buffered events, closes the file and waits for rotated files to be compressed. Events added after
+        closing are ignored.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._try_write_buffer()
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._condition.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+        atexit.unregister(self.close)
+
+    def _write_buffer(self) -> None:
+        if not self._lines:
+            return
+        data = "".join(self._lines).encode("utf-8")
+        if self._file is None:
+            self._open()
+        elif (self._max_bytes and self._file_size + len(data) > self._max_bytes) or (
+            self._rotation_interval is not None and time.time() - self._opened_at >= self._rotation_interval
+        ):
+            self._rotate()
+        if self._file is not None:
+            self._file.write(data)
+            self._file.flush()
+            self._file_size += len(data)
+        # Only cleared once written, so the events can be written again if writing fails
+        self._lines.clear()
+        self._write_failed = False
+
+    def _try_write_buffer(self) -> None:
+        try:
+            self._write_buffer()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to write evaluation events to %s.", self._path)
+            # Retried by the background thread once the flush interval elapses again
+            self._write_failed = True
+            self._first_buffered_at = time.monotonic()
+            self._start_worker()
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self._path, "ab")  # pylint: disable=consider-using-with
+        self._file_size = self._file.tell()
+        self._opened_at = time.time()
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._file_size:
+            rotated_path = f"{self._path}.{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')}"
+            os.replace(self._path, rotated_path)
+            if self._compress:
+                # Compressed by the background thread, so the evaluation that triggered the rotation doesn't wait
+                self._pending_compression.append(rotated_path)
+                self._start_worker()
+        self._open()
+
+    def _start_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="FeatureManagementFileExport", daemon=True)
+            self._worker.start()
+        self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and not self._pending_compression:
+                    if not self._lines:
+                        self._condition.wait()
+                        continue
+                    remaining = self._first_buffered_at + self._flush_interval - time.monotonic()
+                    if remaining > 0:
+                        self._condition.wait(remaining)
+                        continue
+                    self._try_write_buffer()
+                rotated_paths, self._pending_compression = self._pending_compression, []
+                closed = self._closed
+            for rotated_path in rotated_paths:
+                try:
+                    with open(rotated_path, "rb") as source, gzip.open(rotated_path + ".gz", "wb") as target:
+                        shutil.copyfileobj(source, target)
+                    os.remove(rotated_path)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Failed to compress %s.", rotated_path)
+            if closed and not rotated_paths:
+                return
@@ -7,9 +7,16 @@
 
 import logging
 import inspect
+import random
+import threading
+import time
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
 from logging import INFO
-from typing import Any, Callable, Dict, Optional
-from .._models import VariantAssignmentReason, EvaluationEvent, TargetingContext
+from typing import cast, Any, Callable, Dict, Mapping, Optional, Tuple
+from .._models import VariantAssignmentReason, EvaluationEvent, FeatureFlag, TargetingContext
+from .._targeting_context_var import get_targeting_context
+from .._targeting_marker import get_context_marker
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +25,8 @@ _event_logger = logging.getLogger(__name__ + ".events")
 _event_logger.propagate = False
 
 try:
-    from opentelemetry.sdk._logs import LoggingHandler
+    from opentelemetry._logs import Logger, SeverityNumber, get_logger_provider
+    from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
     from opentelemetry.context.context import Context
     from opentelemetry.sdk.trace import Span, SpanProcessor
 
@@ -26,6 +34,8 @@ try:
 except ImportError:
     HAS_OPENTELEMETRY_LOGGING = False
     LoggingHandler = object  # type: ignore
+    LoggerProvider = object  # type: ignore
+    Logger = object  # type: ignore
     SpanProcessor = object  # type: ignore
     Span = object  # type: ignore
     Context = object  # type: ignore
@@ -39,6 +49,7 @@ REASON = "VariantAssignmentReason"
 DEFAULT_WHEN_ENABLED = "DefaultWhenEnabled"
 VERSION = "Version"
 VARIANT_ASSIGNMENT_PERCENTAGE = "VariantAssignmentPercentage"
+SAMPLE_RATE = "SampleRate"
 MICROSOFT_TARGETING_ID = "Microsoft.TargetingId"
 AZURE_MONITOR_EVENT_NAME = "microsoft.custom_event.name"
 
@@ -46,8 +57,22 @@ EVENT_NAME = "FeatureEvaluation"
 
 EVALUATION_EVENT_VERSION = "1.0.0"
 
+SAMPLING_SALT = "telemetry-sample\n"
+
+MAX_CACHED_TRACES = 10000
+
 _EVENTS_LOGGER_INITIALIZED: bool = False
 
+# OpenTelemetry logger of the configured logger provider, used to emit events without the logging module
+_OTEL_EVENT_LOGGER: Optional[Tuple[LoggerProvider, Logger]] = None
+
+# Event properties per feature flag, keyed by enabled state, reason and variant name
+EventTemplateKey = Tuple[bool, VariantAssignmentReason, Optional[str]]
+_EVENT_TEMPLATES: "WeakKeyDictionary[FeatureFlag, Dict[EventTemplateKey, Mapping[str, Optional[str]]]]" = (
+    WeakKeyDictionary()
+)
+_EVENT_TEMPLATES_LOCK = threading.Lock()
+
 
 def _initialize_event_logger() -> None:
     global _EVENTS_LOGGER_INITIALIZED  # pylint: disable=global-statement
@@ -59,6 +84,25 @@ def _initialize_event_logger() -> None:
     _EVENTS_LOGGER_INITIALIZED = True
 
 
+def _get_otel_event_logger() -> Optional[Logger]:
+    """
+    Gets the OpenTelemetry logger that events are emitted with directly, which is only possible once an OpenTelemetry
+    SDK logger provider is configured, for example by the Azure Monitor distro.
+
+    :return: The OpenTelemetry logger, or None if events have to be sent through the logging module.
+    :rtype: ~opentelemetry._logs.Logger
+    """
+    global _OTEL_EVENT_LOGGER  # pylint: disable=global-statement
+    provider = get_logger_provider()
+    if not isinstance(provider, LoggerProvider):
+        return None
+    cached = _OTEL_EVENT_LOGGER
+    if cached is None or cached[0] is not provider:
+        cached = (provider, provider.get_logger(_event_logger.name))
+        _OTEL_EVENT_LOGGER = cached
+    return cached[1]
+
+
 def track_event(event_name: str, user: str, event_properties: Optional[Dict[str, Optional[str]]] = None) -> None:
     """
     Tracks an event with the specified name and properties.
@@ -70,13 +114,27 @@ def track_event(event_name: str, user: str, event_properties: Optional[Dict[str,
     if not HAS_OPENTELEMETRY_LOGGING:
         return
 
-    _initialize_event_logger()
-
     event_properties = event_properties or {}
 
     if user:
         event_properties[TARGETING_ID] = user
 
+    otel_logger = _get_otel_event_logger()
+    if otel_logger is not None:
+        # Emit the log record directly, skipping the logging module and the translation by LoggingHandler
+        attributes = {key: value for key, value in event_properties.items() if value is not None}
+        attributes[AZURE_MONITOR_EVENT_NAME] = event_name
+        otel_logger.emit(
+            timestamp=time.time_ns(),
+            severity_number=SeverityNumber.INFO,
+            severity_text="INFO",
+            body=event_name,
+            attributes=attributes,
+        )
+        return
+
+    _initialize_event_logger()
+
     # Azure Monitor exporter maps this attribute to customEvent telemetry name.
     custom_event_attributes = {
         **event_properties,
@@ -85,33 +143,73 @@ def track_event(event_name: str, user: str, event_properties: Optional[Dict[str,
     _event_logger.info(event_name, extra=custom_event_attributes)
 
 
-def publish_telemetry(evaluation_event: EvaluationEvent) -> None:
+def _sample(evaluation_event: EvaluationEvent, sample_rate: Optional[float] = None) -> Optional[float]:
     """
-    Publishes the telemetry for a feature's evaluation event.
-
-    :param EvaluationEvent evaluation_event: The evaluation event to publish telemetry for.
+    Decides if a telemetry sink keeps an evaluation event. Users are sampled deterministically per feature flag, so a
+    user's events are either all kept or all dropped. The decision doesn't change the event, so every sink that
+    receives the same event samples it at its own rate.
+
+    :param EvaluationEvent evaluation_event: The evaluation event.
+    :param float sample_rate: Fraction of users to keep, or None to use the sample rate of the feature flag.
+    :return: The rate the event was kept at, or None if it's dropped.
+    :rtype: float
     """
-    if not HAS_OPENTELEMETRY_LOGGING:
-        return
-
     feature = evaluation_event.feature
-
     if not feature:
-        return
-
+        return 1.0
+    if sample_rate is None:
+        sample_rate = feature.telemetry.sample_rate
+    if sample_rate >= 1:
+        return 1.0
+    if evaluation_event.user:
+        # Salted, so that which users are sampled doesn't correlate with which users the TargetingFilter rolls out to
+        sample = get_context_marker(SAMPLING_SALT + evaluation_event.user + "\n" + feature.name) / (2**32 - 1)
+    else:
+        sample = random.random()
+    if sample >= sample_rate:
+        return None
+    return sample_rate
+
+
+def _get_event_template(
+    feature: FeatureFlag, enabled: bool, reason: VariantAssignmentReason, variant_name: Optional[str]
+) -> Mapping[str, Optional[str]]:
+    """
+    Gets the properties of the evaluation events of a feature flag that only depend on the result of the evaluation.
+    The properties are built once per feature flag object, so once per snapshot of the feature flags.
+
+    :param FeatureFlag feature: The feature flag.
+    :param bool enabled: Whether the feature flag was enabled.
+    :param VariantAssignmentReason reason: The reason the variant was assigned.
+    :param str variant_name: Name of the assigned variant, if any.
+    :return: Read-only event properties.
+    :rtype: Mapping[str, str]
+    """
+    templates = _EVENT_TEMPLATES.get(feature)
+    if templates is None:
+        with _EVENT_TEMPLATES_LOCK:
+            templates = _EVENT_TEMPLATES.setdefault(feature, {})
+    template_key = (enabled, reason, variant_name)
+    template = templates.get(template_key)
+    if template is None:
+        template = MappingProxyType(_build_event_template(feature, enabled, reason, variant_name))
+        templates[template_key] = template
+    return template
+
+
+def _build_event_template(
+    feature: FeatureFlag, enabled: bool, reason: VariantAssignmentReason, variant_name: Optional[str]
+) -> Dict[str, Optional[str]]:
     event: Dict[str, Optional[str]] = {
         FEATURE_NAME: feature.name,
-        ENABLED: str(evaluation_event.enabled),
+        ENABLED: str(enabled),
         VERSION: EVALUATION_EVENT_VERSION,
     }
 
-    reason = evaluation_event.reason
-    variant = evaluation_event.variant
-
     event[REASON] = reason.value
 
-    if variant:
-        event[VARIANT] = variant.name
+    if variant_name:
+        event[VARIANT] = variant_name
 
     # VariantAllocationPercentage
     allocation_percentage = 0
@@ -124,7 +222,7 @@ def publish_telemetry(evaluation_event: EvaluationEvent) -> None:
     elif reason == VariantAssignmentReason.PERCENTILE:
         if feature.allocation and feature.allocation.percentile:
             for allocation in feature.allocation.percentile:
-                if variant and allocation.variant == variant.name:
+                if variant_name and allocation.variant == variant_name:
                     allocation_percentage += allocation.percentile_to - allocation.percentile_from
             event[VARIANT_ASSIGNMENT_PERCENTAGE] = str(allocation_percentage)
 
@@ -136,13 +234,87 @@ def publish_telemetry(evaluation_event: EvaluationEvent) -> None:
         for metadata_key, metadata_value in feature.telemetry.metadata.items():
             if metadata_key not in event:
                 event[metadata_key] = metadata_value
+    return event
+
 
-    track_event(EVENT_NAME, evaluation_event.user, event_properties=event)
+def publish_telemetry(evaluation_event: EvaluationEvent, *, sample_rate: Optional[float] = None) -> None:
+    """
+    Publishes the telemetry for a feature's evaluation event.
+
+    :param EvaluationEvent evaluation_event: The evaluation event to publish telemetry for.
+    :keyword float sample_rate: Fraction of users to publish telemetry for, overriding the sample_rate of the feature
+     flag's telemetry configuration. Users are sampled deterministically, and the rate is added to the published
+     event as SampleRate.
+    """
+    if not HAS_OPENTELEMETRY_LOGGING:
+        return
+
+    event = _get_event_properties(evaluation_event, sample_rate)
+    if event is not None:
+        track_event(EVENT_NAME, evaluation_event.user, event_properties=event)
+
+
+def _publish_sampled_telemetry(evaluation_event: EvaluationEvent, sample_rate: float) -> None:
+    """
+    Publishes the telemetry for an evaluation event that was already kept by sampling.
+
+    :param EvaluationEvent evaluation_event: The evaluation event to publish telemetry for.
+    :param float sample_rate: The rate the event was kept at.
+    """
+    if not HAS_OPENTELEMETRY_LOGGING or not evaluation_event.feature:
+        return
+    track_event(
+        EVENT_NAME, evaluation_event.user, event_properties=_build_event_properties(evaluation_event, sample_rate)
+    )
+
+
+def _get_event_properties(
+    evaluation_event: EvaluationEvent, sample_rate: Optional[float] = None
+) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Samples an evaluation event, and gets the properties of its telemetry event without the targeting ID.
+
+    :param EvaluationEvent evaluation_event: The evaluation event.
+    :param float sample_rate: Sample rate overriding the sample rate of the feature flag, if any.
+    :return: The event properties, or None if the event isn't published.
+    :rtype: dict[str, str]
+    """
+    if not evaluation_event.feature:
+        return None
+    kept_rate = _sample(evaluation_event, sample_rate)
+    if kept_rate is None:
+        return None
+    return _build_event_properties(evaluation_event, kept_rate)
+
+
+def _build_event_properties(evaluation_event: EvaluationEvent, sample_rate: float) -> Dict[str, Optional[str]]:
+    """
+    Builds the properties of the telemetry event of an evaluation that was kept by sampling, without the targeting ID.
+
+    :param EvaluationEvent evaluation_event: The evaluation event, which must have a feature flag.
+    :param float sample_rate: The rate the event was kept at, added as SampleRate if it's below 1.
+    :return: The event properties.
+    :rtype: dict[str, str]
+    """
+    feature = cast(FeatureFlag, evaluation_event.feature)
+    variant = evaluation_event.variant
+    event = dict(
+        _get_event_template(
+            feature, evaluation_event.enabled, evaluation_event.reason, variant.name if variant else None
+        )
+    )
+
+    if sample_rate < 1:
+        event[SAMPLE_RATE] = str(sample_rate)
+    return event
 
 
 class TargetingSpanProcessor(SpanProcessor):
     """
-    A custom SpanProcessor that attaches the targeting ID to the span and baggage when a new span is started.
+    A custom SpanProcessor that attaches the targeting ID to the span and baggage when a new span is started. The
+    targeting context set with set_targeting_context is used if there is one, which also allows applications with an
+    async targeting context accessor to set the targeting ID. The targeting ID is resolved once per trace, when its
+    local root span starts, and reused for the child spans until the root span ends.
     :keyword Callable[[], TargetingContext] targeting_context_accessor: Callback function to get the current targeting
     context if one isn't provided.
     """
@@ -151,6 +323,9 @@ class TargetingSpanProcessor(SpanProcessor):
         self._targeting_context_accessor: Optional[Callable[[], TargetingContext]] = kwargs.pop(
             "targeting_context_accessor", None
         )
+        # Targeting ID of the traces with a started local root span, and the span ID of the root span
+        self._trace_targeting_ids: Dict[int, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
 
     def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:  # pylint: disable=unused-argument
         """
@@ -162,18 +337,60 @@ class TargetingSpanProcessor(SpanProcessor):
         if not HAS_OPENTELEMETRY_LOGGING:
             logger.info("OpenTelemetry logging handler is not installed.")
             return
-        if self._targeting_context_accessor and callable(self._targeting_context_accessor):
+        span_context = span.context if span is not None else None
+        if span_context is not None:
+            with self._lock:
+                cached = self._trace_targeting_ids.get(span_context.trace_id)
+            if cached is not None:
+                span.set_attribute(TARGETING_ID, cached[1])
+                return
+        targeting_id = self._resolve_targeting_id()
+        if not targeting_id:
+            return
+        span.set_attribute(TARGETING_ID, targeting_id)
+        if span_context is not None and (span.parent is None or span.parent.is_remote):
+            with self._lock:
+                self._trace_targeting_ids[span_context.trace_id] = (span_context.span_id, targeting_id)
+                if len(self._trace_targeting_ids) > MAX_CACHED_TRACES:
+                    # Root spans that never end must not grow the cache forever
+                    del self._trace_targeting_ids[next(iter(self._trace_targeting_ids))]
+
+    def on_end(self, span: Any) -> None:
+        """
+        Forgets the targeting ID of a trace when its local root span ends.
+
+        :param ReadableSpan span: The span that ended.
+        """
+        span_context = span.context if span is not None else None
+        if span_context is None:
+            return
+        with self._lock:
+            cached = self._trace_targeting_ids.get(span_context.trace_id)
+            if cached is not None and cached[0] == span_context.span_id:
+                del self._trace_targeting_ids[span_context.trace_id]
+
+    def _resolve_targeting_id(self) -> Optional[str]:
+        """
+        Gets the targeting ID from the current targeting context, or from the targeting context accessor.
+
+        :return: The targeting ID, or None if there is none.
+        :rtype: str
+        """
+        targeting_context = get_targeting_context()
+        if not targeting_context and self._targeting_context_accessor and callable(self._targeting_context_accessor):
             if inspect.iscoroutinefunction(self._targeting_context_accessor):
                 logger.warning("Async targeting_context_accessor is not supported.")
-                return
+                return None
             targeting_context = self._targeting_context_accessor()
             if not targeting_context or not isinstance(targeting_context, TargetingContext):
                 logger.warning(
                     "targeting_context_accessor did not return a TargetingContext. Received type %s.",
                     type(targeting_context),
                 )
-                return
-            if not targeting_context.user_id:
-                logger.debug("TargetingContext does not have a user ID.")
-                return
-            span.set_attribute(TARGETING_ID, targeting_context.user_id)
+                return None
+        if not targeting_context:
+            return None
+        if not targeting_context.user_id:
+            logger.debug("TargetingContext does not have a user ID.")
+            return None
+        return targeting_context.user_id
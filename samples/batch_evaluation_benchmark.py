@@ -0,0 +1,83 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""
+Sample benchmarking batch evaluation with the thread, process and interpreter executors.
+
+Results of 1,000,000 evaluations (50,000 users and 20 feature flags) on Python 3.11 with a single CPU, where sequential
+calls evaluate for every user and feature flag:
+
+* sequential: 14.04s
+* thread: 12.11s
+* process: 12.35s
+
+These numbers only show the overhead of the executors, as every worker runs on the same CPU. The batch executors
+are still faster than sequential calls, because targeting contexts and feature flags are resolved once per batch
+instead of on every call. The speedup with several CPUs, and the interpreter executor, which requires Python 3.14,
+haven't been measured yet; run this sample on the target machine to measure them.
+The thread executor only helps with feature filters that release the GIL, such as filters doing I/O, or on
+free-threaded builds.
+"""
+
+import concurrent.futures
+import os
+import time
+from featuremanagement import FeatureManager
+
+FEATURE_COUNT = 20
+USER_COUNT = 50000
+
+feature_flags = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": f"Feature{i}",
+                "enabled": True,
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.Targeting",
+                            "parameters": {
+                                "Audience": {
+                                    "Groups": [{"Name": "Beta", "RolloutPercentage": 50}],
+                                    "DefaultRolloutPercentage": 20,
+                                }
+                            },
+                        }
+                    ]
+                },
+                "variants": [
+                    {"name": "On", "configuration_value": True},
+                    {"name": "Off", "configuration_value": False},
+                ],
+                "allocation": {"percentile": [{"variant": "On", "from": 0, "to": 50}], "default_when_enabled": "Off"},
+            }
+            for i in range(FEATURE_COUNT)
+        ]
+    }
+}
+
+if __name__ == "__main__":
+    feature_manager = FeatureManager(feature_flags)
+    users = [f"user{i}" for i in range(USER_COUNT)]
+    feature_flag_ids = feature_manager.list_feature_flag_names()
+
+    executors = ["thread", "process"]
+    if hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+        executors.append("interpreter")
+
+    print(f"CPUs: {os.cpu_count()}")
+    start = time.perf_counter()
+    for user in users:
+        for feature_flag_id in feature_flag_ids:
+            feature_manager.evaluate(feature_flag_id, user)
+    print(f"sequential: {time.perf_counter() - start:.2f}s")
+
+    for executor in executors:
+        start = time.perf_counter()
+        feature_manager.evaluate_batch(
+            users, feature_flag_ids, executor=executor, max_workers=os.cpu_count(), chunk_size=1000
+        )
+        print(f"{executor}: {time.perf_counter() - start:.2f}s")
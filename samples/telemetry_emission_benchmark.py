@@ -0,0 +1,57 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Sample benchmarking emission of evaluation events through the logging module and the OpenTelemetry Logs API."""
+
+import time
+from contextlib import nullcontext
+from unittest.mock import patch
+from opentelemetry._logs import set_logger_provider
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import InMemoryLogRecordExporter, SimpleLogRecordProcessor
+from featuremanagement import EvaluationEvent, FeatureFlag, VariantAssignmentReason
+from featuremanagement.azuremonitor import publish_telemetry
+
+EVENT_COUNT = 100000
+
+feature_flag = FeatureFlag.convert_from_json(
+    {
+        "id": "Beta",
+        "enabled": True,
+        "telemetry": {"enabled": True, "metadata": {"ETag": "etag", "FeatureFlagId": "beta"}},
+    }
+)
+
+
+def _benchmark(route: str, exporter: InMemoryLogRecordExporter, direct: bool) -> None:
+    evaluation_event = EvaluationEvent(feature_flag)
+    evaluation_event.enabled = True
+    evaluation_event.user = "Adam"
+    evaluation_event.reason = VariantAssignmentReason.DEFAULT_WHEN_ENABLED
+
+    # Without the OpenTelemetry logger the events are sent through the logging module and LoggingHandler
+    logging_route = (
+        nullcontext()
+        if direct
+        else patch("featuremanagement.azuremonitor._send_telemetry._get_otel_event_logger", return_value=None)
+    )
+    with logging_route:
+        start = time.perf_counter()
+        for _ in range(EVENT_COUNT):
+            publish_telemetry(evaluation_event)
+        elapsed = time.perf_counter() - start
+    print(f"{route}: {elapsed:.2f}s, {elapsed / EVENT_COUNT * 1e6:.1f}us per event")
+    assert len(exporter.get_finished_logs()) == EVENT_COUNT
+    exporter.clear()
+
+
+if __name__ == "__main__":
+    log_exporter = InMemoryLogRecordExporter()
+    logger_provider = LoggerProvider()
+    logger_provider.add_log_record_processor(SimpleLogRecordProcessor(log_exporter))
+    set_logger_provider(logger_provider)
+
+    _benchmark("logging", log_exporter, direct=False)
+    _benchmark("opentelemetry", log_exporter, direct=True)
@@ -0,0 +1,154 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the batched telemetry publisher."""
+
+import threading
+from unittest.mock import patch
+import pytest
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import InMemoryLogRecordExporter, SimpleLogRecordProcessor
+from opentelemetry.sdk.trace import TracerProvider
+from featuremanagement import EvaluationEvent, FeatureFlag, FeatureManager
+from featuremanagement.azuremonitor import BatchTelemetryPublisher
+
+
+def _evaluation_event(name):
+    return EvaluationEvent(FeatureFlag.convert_from_json({"id": name, "enabled": True}))
+
+
+class TestBatchTelemetryPublisher:
+    # method: flush
+    def test_flush(self):
+        published = []
+        publisher = BatchTelemetryPublisher(publisher=published.append, flush_interval=60)
+        for i in range(10):
+            publisher(_evaluation_event(f"Flag{i}"))
+        assert publisher.flush(timeout=5)
+        assert [event.feature.name for event in published] == [f"Flag{i}" for i in range(10)]
+        assert publisher.published_events == 10
+        assert publisher.queue_size == 0
+        publisher.shutdown()
+
+    # method: __call__
+    def test_batch_size(self):
+        batch_published = threading.Event()
+        published = []
+
+        def publish(evaluation_event):
+            published.append(evaluation_event)
+            if len(published) == 4:
+                batch_published.set()
+
+        publisher = BatchTelemetryPublisher(publisher=publish, batch_size=4, flush_interval=60)
+        for i in range(4):
+            publisher(_evaluation_event(f"Flag{i}"))
+        assert batch_published.wait(5)
+        publisher.shutdown()
+
+    # method: __call__
+    def test_flush_interval(self):
+        flushed = threading.Event()
+        publisher = BatchTelemetryPublisher(publisher=lambda event: flushed.set(), flush_interval=0.01)
+        publisher(_evaluation_event("Alpha"))
+        assert flushed.wait(5)
+        publisher.shutdown()
+
+    # method: __call__
+    def test_drop_oldest(self):
+        published = []
+        publisher = BatchTelemetryPublisher(publisher=published.append, max_queue_size=2, flush_interval=60)
+        # The flush interval keeps the events queued until shutdown
+        for name in ("Alpha", "Beta", "Gamma"):
+            publisher(_evaluation_event(name))
+        assert publisher.dropped_events == 1
+        publisher.shutdown()
+        assert [event.feature.name for event in published] == ["Beta", "Gamma"]
+
+    # method: __call__
+    def test_drop_newest(self):
+        published = []
+        publisher = BatchTelemetryPublisher(
+            publisher=published.append, max_queue_size=2, flush_interval=60, overflow_policy="drop_newest"
+        )
+        # The flush interval keeps the events queued until shutdown
+        for name in ("Alpha", "Beta", "Gamma"):
+            publisher(_evaluation_event(name))
+        assert publisher.dropped_events == 1
+        publisher.shutdown()
+        assert [event.feature.name for event in published] == ["Alpha", "Beta"]
+
+    # method: shutdown
+    def test_shutdown(self):
+        published = []
+        publisher = BatchTelemetryPublisher(publisher=published.append, flush_interval=60)
+        publisher(_evaluation_event("Alpha"))
+        publisher.shutdown()
+        assert len(published) == 1
+        publisher(_evaluation_event("Beta"))
+        assert len(published) == 1
+        assert publisher.dropped_events == 1
+
+    # method: __call__
+    def test_publisher_error(self):
+        published = []
+
+        def publish(evaluation_event):
+            if evaluation_event.feature.name == "Alpha":
+                raise RuntimeError("Publishing failed")
+            published.append(evaluation_event)
+
+        publisher = BatchTelemetryPublisher(publisher=publish, flush_interval=60)
+        publisher(_evaluation_event("Alpha"))
+        publisher(_evaluation_event("Beta"))
+        assert publisher.flush(timeout=5)
+        assert [event.feature.name for event in published] == ["Beta"]
+        publisher.shutdown()
+
+    # method: __init__
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="Unknown overflow policy"):
+            BatchTelemetryPublisher(overflow_policy="block")
+        with pytest.raises(ValueError):
+            BatchTelemetryPublisher(max_queue_size=0)
+
+    # method: __call__
+    def test_on_feature_evaluated(self):
+        published = []
+        publisher = BatchTelemetryPublisher(publisher=published.append, flush_interval=60)
+        feature_manager = FeatureManager(
+            {
+                "feature_management": {
+                    "feature_flags": [{"id": "Alpha", "enabled": True, "telemetry": {"enabled": True}}]
+                }
+            },
+            on_feature_evaluated=publisher,
+        )
+        assert feature_manager.is_enabled("Alpha", "Adam")
+        publisher.shutdown()
+        assert published[0].feature.name == "Alpha"
+        assert published[0].user == "Adam"
+
+    # method: __call__
+    def test_trace_context(self):
+        exporter = InMemoryLogRecordExporter()
+        logger_provider = LoggerProvider()
+        logger_provider.add_log_record_processor(SimpleLogRecordProcessor(exporter))
+        tracer = TracerProvider().get_tracer(__name__)
+        publisher = BatchTelemetryPublisher(flush_interval=60)
+        evaluation_event = EvaluationEvent(
+            FeatureFlag.convert_from_json({"id": "Alpha", "enabled": True, "telemetry": {"enabled": True}})
+        )
+
+        with patch("featuremanagement.azuremonitor._send_telemetry.get_logger_provider", return_value=logger_provider):
+            with tracer.start_as_current_span("request") as span:
+                publisher(evaluation_event)
+            assert publisher.flush(timeout=5)
+        publisher.shutdown()
+
+        log_records = exporter.get_finished_logs()
+        assert len(log_records) == 1
+        assert log_records[0].log_record.trace_id == span.get_span_context().trace_id
+        assert log_records[0].log_record.span_id == span.get_span_context().span_id
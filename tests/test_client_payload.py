@@ -0,0 +1,131 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for client payload generation."""
+
+import json
+import pytest
+from featuremanagement import FeatureManager, ClientPayload, TargetingContext
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {"id": "Alpha", "enabled": "true", "conditions": {"client_filters": []}},
+            {"id": "Beta", "enabled": "false", "conditions": {"client_filters": []}},
+            {
+                "id": "Gamma",
+                "enabled": "true",
+                "variants": [
+                    {"name": "Big", "configuration_value": {"size": 10}},
+                    {"name": "Small", "configuration_value": "small"},
+                ],
+                "allocation": {
+                    "default_when_enabled": "Small",
+                    "user": [{"variant": "Big", "users": ["Adam"]}],
+                },
+                "telemetry": {"enabled": True},
+            },
+        ]
+    }
+}
+
+ALL_FEATURE_FLAGS = ["Alpha", "Beta", "Gamma"]
+
+
+class TestClientPayload:
+    # method: get_client_payload
+    def test_client_payload(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        payload = feature_manager.get_client_payload("Adam", feature_flag_ids=ALL_FEATURE_FLAGS)
+
+        assert isinstance(payload, ClientPayload)
+        assert payload.snapshot_version == feature_manager.snapshot_version
+        content = json.loads(payload.content)
+        assert content == {"feature_flags": content["feature_flags"]}
+        assert content["feature_flags"] == {
+            "Alpha": {"enabled": True},
+            "Beta": {"enabled": False},
+            "Gamma": {"enabled": True, "variant": "Big", "configuration": {"size": 10}},
+        }
+
+        other = feature_manager.get_client_payload(
+            TargetingContext(user_id="Brittney"), feature_flag_ids=ALL_FEATURE_FLAGS
+        )
+        assert json.loads(other.content)["feature_flags"]["Gamma"] == {
+            "enabled": True,
+            "variant": "Small",
+            "configuration": "small",
+        }
+        assert other.etag != payload.etag
+
+    # method: get_client_payload
+    def test_client_payload_selected_flags(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        payload = feature_manager.get_client_payload("Adam", feature_flag_ids=["Alpha", "Missing"])
+
+        assert json.loads(payload.content)["feature_flags"] == {
+            "Alpha": {"enabled": True},
+            "Missing": {"enabled": False},
+        }
+
+    # method: get_client_payload
+    def test_client_payload_requires_feature_flags(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        with pytest.raises(TypeError):
+            feature_manager.get_client_payload("Adam")  # pylint: disable=missing-kwoa
+
+    # method: get_client_payload
+    def test_client_payload_etag(self):
+        feature_flags = json.loads(json.dumps(FEATURE_FLAGS))
+        feature_manager = FeatureManager(feature_flags)
+        payload = feature_manager.get_client_payload("Adam", feature_flag_ids=ALL_FEATURE_FLAGS)
+
+        assert payload.etag.startswith('"') and payload.etag.endswith('"')
+        assert feature_manager.get_client_payload("Adam", feature_flag_ids=ALL_FEATURE_FLAGS).etag == payload.etag
+        assert payload.is_not_modified(payload.etag)
+        assert payload.is_not_modified('"other", W/' + payload.etag)
+        assert payload.is_not_modified("*")
+        assert not payload.is_not_modified(None)
+        assert not payload.is_not_modified('"other"')
+
+        # Replacing the configuration creates a new snapshot, the ETag only changes with the feature flag state
+        feature_flags["feature_management"] = json.loads(json.dumps(FEATURE_FLAGS["feature_management"]))
+        refreshed = feature_manager.get_client_payload("Adam", feature_flag_ids=ALL_FEATURE_FLAGS)
+        assert refreshed.snapshot_version == payload.snapshot_version + 1
+        assert refreshed.is_not_modified(payload.etag)
+        assert FeatureManager(FEATURE_FLAGS).get_client_payload("Adam", feature_flag_ids=ALL_FEATURE_FLAGS).etag == (
+            payload.etag
+        )
+
+        feature_flags["feature_management"]["feature_flags"][0]["enabled"] = "false"
+        feature_flags["feature_management"] = dict(feature_flags["feature_management"])
+        changed = feature_manager.get_client_payload("Adam", feature_flag_ids=ALL_FEATURE_FLAGS)
+        assert not changed.is_not_modified(payload.etag)
+
+    # method: get_client_payload
+    def test_client_payload_telemetry(self):
+        events = []
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=events.append)
+        feature_manager.get_client_payload("Adam", feature_flag_ids=ALL_FEATURE_FLAGS)
+
+        assert len(events) == 1
+        assert events[0].feature.name == "Gamma"
+        assert events[0].user == "Adam"
+
+    # method: get_client_payload
+    def test_client_payload_snapshot_version(self):
+        feature_flags = json.loads(json.dumps(FEATURE_FLAGS))
+
+        def accessor():
+            # Replaces the configuration while the payload is created
+            feature_flags["feature_management"] = {"feature_flags": [{"id": "Alpha", "enabled": "false"}]}
+            return TargetingContext(user_id="Adam")
+
+        feature_manager = FeatureManager(feature_flags, targeting_context_accessor=accessor)
+        initial_version = feature_manager.snapshot_version
+        payload = feature_manager.get_client_payload(feature_flag_ids=["Alpha"])
+
+        assert json.loads(payload.content)["feature_flags"] == {"Alpha": {"enabled": False}}
+        assert payload.snapshot_version == initial_version + 1
@@ -0,0 +1,88 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for async client payload generation."""
+
+import json
+import pytest
+from featuremanagement import ClientPayload, TargetingContext
+from featuremanagement.aio import FeatureManager
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {"id": "Alpha", "enabled": "true", "conditions": {"client_filters": []}},
+            {"id": "Beta", "enabled": "false", "conditions": {"client_filters": []}},
+            {
+                "id": "Gamma",
+                "enabled": "true",
+                "variants": [
+                    {"name": "Big", "configuration_value": {"size": 10}},
+                    {"name": "Small", "configuration_value": "small"},
+                ],
+                "allocation": {
+                    "default_when_enabled": "Small",
+                    "user": [{"variant": "Big", "users": ["Adam"]}],
+                },
+                "telemetry": {"enabled": True},
+            },
+        ]
+    }
+}
+
+
+class TestClientPayloadAsync:
+    # method: get_client_payload
+    @pytest.mark.asyncio
+    async def test_client_payload(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        payload = await feature_manager.get_client_payload("Adam", feature_flag_ids=["Alpha", "Beta", "Gamma"])
+
+        assert isinstance(payload, ClientPayload)
+        assert json.loads(payload.content)["feature_flags"] == {
+            "Alpha": {"enabled": True},
+            "Beta": {"enabled": False},
+            "Gamma": {"enabled": True, "variant": "Big", "configuration": {"size": 10}},
+        }
+        assert payload.is_not_modified(payload.etag)
+
+    # method: get_client_payload
+    @pytest.mark.asyncio
+    async def test_client_payload_async_accessor(self):
+        calls = []
+        events = []
+
+        async def accessor():
+            calls.append(1)
+            return TargetingContext(user_id="Adam")
+
+        async def on_feature_evaluated(event):
+            events.append(event)
+
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS, targeting_context_accessor=accessor, on_feature_evaluated=on_feature_evaluated
+        )
+        payload = await feature_manager.get_client_payload(feature_flag_ids=["Alpha", "Gamma"])
+
+        assert len(calls) == 1
+        assert len(events) == 1
+        assert json.loads(payload.content)["feature_flags"]["Gamma"]["variant"] == "Big"
+
+    # method: get_client_payload
+    @pytest.mark.asyncio
+    async def test_client_payload_snapshot_version(self):
+        feature_flags = json.loads(json.dumps(FEATURE_FLAGS))
+
+        async def accessor():
+            # Replaces the configuration while the payload is created
+            feature_flags["feature_management"] = {"feature_flags": [{"id": "Alpha", "enabled": "false"}]}
+            return TargetingContext(user_id="Adam")
+
+        feature_manager = FeatureManager(feature_flags, targeting_context_accessor=accessor)
+        initial_version = feature_manager.snapshot_version
+        payload = await feature_manager.get_client_payload(feature_flag_ids=["Alpha"])
+
+        assert json.loads(payload.content)["feature_flags"] == {"Alpha": {"enabled": False}}
+        assert payload.snapshot_version == initial_version + 1
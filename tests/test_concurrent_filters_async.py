@@ -0,0 +1,122 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for concurrent feature filter evaluation in the async FeatureManager."""
+
+import asyncio
+import time
+import pytest
+from featuremanagement.aio import FeatureManager, FeatureFilter
+
+
+@FeatureFilter.alias("Delay")
+class DelayFilter(FeatureFilter):
+    def __init__(self):
+        self.cancelled = []
+
+    async def evaluate(self, context, **kwargs):
+        parameters = context.get("parameters", {})
+        try:
+            await asyncio.sleep(parameters["Delay"])
+        except asyncio.CancelledError:
+            self.cancelled.append(parameters["Delay"])
+            raise
+        return parameters["Result"]
+
+
+@FeatureFilter.alias("Fail")
+class FailFilter(FeatureFilter):
+    async def evaluate(self, context, **kwargs):
+        raise RuntimeError("Filter failed")
+
+
+def _feature_flags(requirement_type, *filters):
+    return {
+        "feature_management": {
+            "feature_flags": [
+                {
+                    "id": "Alpha",
+                    "enabled": "true",
+                    "conditions": {"requirement_type": requirement_type, "client_filters": list(filters)},
+                }
+            ]
+        }
+    }
+
+
+def _delay(delay, result):
+    return {"name": "Delay", "parameters": {"Delay": delay, "Result": result}}
+
+
+class TestConcurrentFiltersAsync:
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_any_short_circuits_on_true(self):
+        delay_filter = DelayFilter()
+        feature_manager = FeatureManager(
+            _feature_flags("Any", _delay(5, False), _delay(0.01, True)),
+            feature_filters=[delay_filter],
+            concurrent_filter_evaluation=True,
+        )
+
+        start = time.perf_counter()
+        assert await feature_manager.is_enabled("Alpha")
+        assert time.perf_counter() - start < 1
+        assert delay_filter.cancelled == [5]
+
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_all_short_circuits_on_false(self):
+        delay_filter = DelayFilter()
+        feature_manager = FeatureManager(
+            _feature_flags("All", _delay(5, True), _delay(0.01, False)),
+            feature_filters=[delay_filter],
+            concurrent_filter_evaluation=True,
+        )
+
+        start = time.perf_counter()
+        assert not await feature_manager.is_enabled("Alpha")
+        assert time.perf_counter() - start < 1
+        assert delay_filter.cancelled == [5]
+
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_filters_run_concurrently(self):
+        feature_manager = FeatureManager(
+            _feature_flags("All", _delay(0.2, True), _delay(0.2, True)),
+            feature_filters=[DelayFilter()],
+            concurrent_filter_evaluation=True,
+        )
+        start = time.perf_counter()
+        assert await feature_manager.is_enabled("Alpha")
+        assert time.perf_counter() - start < 0.35
+
+        feature_manager = FeatureManager(
+            _feature_flags("Any", _delay(0.01, False), _delay(0.01, False)),
+            feature_filters=[DelayFilter()],
+            concurrent_filter_evaluation=True,
+        )
+        assert not await feature_manager.is_enabled("Alpha")
+
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_filter_errors(self):
+        delay_filter = DelayFilter()
+        feature_manager = FeatureManager(
+            _feature_flags("Any", _delay(5, True), {"name": "Fail"}),
+            feature_filters=[delay_filter, FailFilter()],
+            concurrent_filter_evaluation=True,
+        )
+        with pytest.raises(RuntimeError):
+            await feature_manager.is_enabled("Alpha")
+        assert delay_filter.cancelled == [5]
+
+        feature_manager = FeatureManager(
+            _feature_flags("Any", _delay(0.01, True), {"name": "Unknown"}),
+            feature_filters=[DelayFilter()],
+            concurrent_filter_evaluation=True,
+        )
+        with pytest.raises(ValueError):
+            await feature_manager.is_enabled("Alpha")
@@ -0,0 +1,124 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for evaluations that skip the work the caller doesn't need."""
+
+import pytest
+from featuremanagement import FeatureManager, FeatureFilter, EvaluationProfiler, VariantAssignmentReason
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "NoVariants",
+                "enabled": True,
+                "conditions": {"client_filters": [{"name": "Counting"}]},
+                "telemetry": {"enabled": True},
+            },
+            {
+                "id": "Variants",
+                "enabled": True,
+                "variants": [{"name": "Big"}, {"name": "Small"}],
+                "allocation": {"user": [{"variant": "Small", "users": ["Brian"]}], "default_when_enabled": "Big"},
+                "conditions": {"client_filters": [{"name": "Counting"}]},
+            },
+            {
+                "id": "StatusOverride",
+                "enabled": True,
+                "variants": [{"name": "Big"}, {"name": "Off", "status_override": "Disabled"}],
+                "allocation": {"user": [{"variant": "Off", "users": ["Brian"]}], "default_when_enabled": "Big"},
+                "conditions": {"client_filters": [{"name": "Counting"}]},
+            },
+            {
+                "id": "DisabledOverride",
+                "enabled": True,
+                "variants": [{"name": "On", "status_override": "Enabled"}],
+                "allocation": {"default_when_disabled": "On"},
+                "conditions": {"client_filters": [{"name": "Counting", "parameters": {"Result": False}}]},
+            },
+            {
+                "id": "Targeted",
+                "enabled": True,
+                "variants": [{"name": "Big"}, {"name": "Small"}],
+                "allocation": {"user": [{"variant": "Small", "users": ["Brian"]}], "default_when_enabled": "Big"},
+                "conditions": {
+                    "client_filters": [
+                        {"name": "Microsoft.Targeting", "parameters": {"Audience": {"Users": ["Brian"]}}}
+                    ]
+                },
+            },
+        ]
+    }
+}
+
+
+class Counting(FeatureFilter):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def evaluate(self, context, **kwargs):
+        self.calls += 1
+        return context.get("parameters", {}).get("Result", True)
+
+
+class TestDemandDrivenEvaluation:
+    # method: get_variant
+    def test_get_variant_skips_feature_filters(self):
+        counting = Counting()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[counting])
+        assert feature_manager.get_variant("NoVariants", "Adam") is None
+        assert counting.calls == 0
+        assert feature_manager.get_variant("Variants", "Brian").name == "Small"
+        assert counting.calls == 1
+
+    # method: get_variant
+    def test_get_variant_with_telemetry(self):
+        events = []
+        counting = Counting()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[counting], on_feature_evaluated=events.append)
+        assert feature_manager.get_variant("NoVariants", "Adam") is None
+        assert counting.calls == 1
+        assert len(events) == 1
+        assert events[0].enabled
+        assert events[0].reason == VariantAssignmentReason.NONE
+
+    # method: is_enabled
+    def test_is_enabled_skips_allocation(self):
+        profiler = EvaluationProfiler()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[Counting()], profiler=profiler)
+        assert feature_manager.is_enabled("Variants", "Brian")
+        assert "Variants" not in profiler.allocation_stats
+
+        # A variant with a status override can disable the feature flag
+        assert not feature_manager.is_enabled("StatusOverride", "Brian")
+        assert feature_manager.is_enabled("StatusOverride", "Adam")
+        assert profiler.allocation_stats["StatusOverride"].calls == 2
+
+        # The default variant when disabled can enable the feature flag
+        assert feature_manager.is_enabled("DisabledOverride", "Adam")
+
+    # method: get_variant
+    def test_get_variant_unknown_filter(self):
+        feature_manager = FeatureManager(
+            {
+                "feature_management": {
+                    "feature_flags": [
+                        {"id": "Alpha", "enabled": True, "conditions": {"client_filters": [{"name": "Unknown"}]}}
+                    ]
+                }
+            }
+        )
+        # The feature filters aren't needed for the variant, but an unknown filter is still an error
+        with pytest.raises(ValueError, match="Feature flag Alpha has unknown filter Unknown"):
+            feature_manager.get_variant("Alpha", "Adam")
+
+    # method: is_enabled
+    def test_is_enabled_with_result_cache(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, result_cache_size=10)
+        # Cached results are complete, so they can be used by get_variant
+        assert feature_manager.is_enabled("Targeted", "Brian")
+        assert feature_manager.get_variant("Targeted", "Brian").name == "Small"
+        assert feature_manager.result_cache_info.hits == 1
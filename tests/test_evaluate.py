@@ -0,0 +1,96 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for single-call evaluation of the enabled state and variant of a feature flag."""
+
+import pytest
+from featuremanagement import (
+    FeatureManager,
+    FeatureFilter,
+    EvaluationResult,
+    TargetingContext,
+    VariantAssignmentReason,
+)
+
+
+def _feature_flags(configuration_value):
+    return {
+        "feature_management": {
+            "feature_flags": [
+                {
+                    "id": "Alpha",
+                    "enabled": True,
+                    "variants": [{"name": "Big", "configuration_value": configuration_value}, {"name": "Small"}],
+                    "allocation": {
+                        "group": [{"variant": "Small", "groups": ["Beta"]}],
+                        "default_when_enabled": "Big",
+                    },
+                    "conditions": {"client_filters": [{"name": "Counting"}]},
+                    "telemetry": {"enabled": True},
+                },
+            ]
+        }
+    }
+
+
+class Counting(FeatureFilter):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def evaluate(self, context, **kwargs):
+        self.calls += 1
+        return True
+
+
+class TestEvaluate:
+    # method: evaluate
+    def test_evaluate(self):
+        events = []
+        counting = Counting()
+        feature_manager = FeatureManager(
+            _feature_flags(10), feature_filters=[counting], on_feature_evaluated=events.append
+        )
+
+        result = feature_manager.evaluate("Alpha", TargetingContext(user_id="Adam", groups=["Beta"]))
+        assert isinstance(result, EvaluationResult)
+        assert result.enabled
+        assert result.variant.name == "Small"
+        assert result.reason == VariantAssignmentReason.GROUP
+        assert result.snapshot_version == feature_manager.snapshot_version
+        assert counting.calls == 1
+        assert len(events) == 1
+        assert events[0].user == "Adam"
+        assert events[0].variant.name == "Small"
+
+        result = feature_manager.evaluate("Alpha", "Brian")
+        assert result.variant.name == "Big"
+        assert result.variant.configuration == 10
+        assert result.reason == VariantAssignmentReason.DEFAULT_WHEN_ENABLED
+        assert counting.calls == 2
+        assert len(events) == 2
+
+    # method: evaluate
+    def test_evaluate_immutable(self):
+        result = FeatureManager(_feature_flags(10), feature_filters=[Counting()]).evaluate("Alpha", "Adam")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.enabled = False
+
+    # method: evaluate
+    def test_evaluate_unknown_feature_flag(self):
+        result = FeatureManager(_feature_flags(10), feature_filters=[Counting()]).evaluate("Unknown", "Adam")
+        assert result == EvaluationResult(False, None, VariantAssignmentReason.NONE, 0)
+
+    # method: evaluate
+    def test_evaluate_snapshot_version(self):
+        configuration = _feature_flags(10)
+        feature_manager = FeatureManager(configuration, feature_filters=[Counting()])
+        first = feature_manager.evaluate("Alpha", "Adam")
+        configuration.update(_feature_flags(20))
+        second = feature_manager.evaluate("Alpha", "Adam")
+        assert second.snapshot_version == first.snapshot_version + 1
+        assert first.variant.configuration == 10
+        assert second.variant.configuration == 20
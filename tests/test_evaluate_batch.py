@@ -0,0 +1,126 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for parallel batch feature flag evaluation."""
+
+import concurrent.futures
+import pickle
+import pytest
+from featuremanagement import FeatureManager, FeatureFilter, TargetingContext
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Target",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.Targeting",
+                            "parameters": {"Audience": {"Users": ["Adam"], "DefaultRolloutPercentage": 50}},
+                        }
+                    ]
+                },
+                "variants": [{"name": "Big", "configuration_value": 10}, {"name": "Small", "configuration_value": 1}],
+                "allocation": {
+                    "default_when_enabled": "Small",
+                    "default_when_disabled": "Small",
+                    "percentile": [{"variant": "Big", "from": 0, "to": 50}],
+                },
+                "telemetry": {"enabled": True},
+            },
+            {
+                "id": "Custom",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "UserLength", "parameters": {"Length": 4}}]},
+            },
+        ]
+    }
+}
+
+
+@FeatureFilter.alias("UserLength")
+class UserLengthFilter(FeatureFilter):
+    def evaluate(self, context, **kwargs):
+        return len(kwargs.get("user", "")) == context.get("parameters", {}).get("Length")
+
+
+class TestEvaluateBatch:
+    # method: evaluate_batch
+    def test_evaluate_batch_matches_sequential(self):
+        users = [f"user{i}" for i in range(40)] + ["Adam", "Bob"]
+        contexts = users[:-1] + [TargetingContext(user_id="Bob", groups=["Ring0"])]
+        events = []
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS, feature_filters=[UserLengthFilter()], on_feature_evaluated=events.append
+        )
+
+        results = feature_manager.evaluate_batch(contexts, ["Target", "Custom"], max_workers=2, chunk_size=8)
+
+        assert len(results) == len(contexts)
+        for user, result in zip(users, results):
+            assert result["Target"].enabled == feature_manager.is_enabled("Target", user)
+            expected_variant = feature_manager.get_variant("Target", user)
+            assert result["Target"].variant.name == expected_variant.name
+            assert result["Target"].variant.configuration == expected_variant.configuration
+            assert result["Target"].snapshot_version == feature_manager.snapshot_version
+            sequential = feature_manager._check_feature(  # pylint: disable=protected-access
+                "Target", TargetingContext(user_id=user)
+            )
+            assert result["Target"].reason == sequential.reason
+            assert result["Custom"].enabled == (len(user) == 4)
+        assert [event.user for event in events[: len(contexts)]] == users
+
+    # method: evaluate_batch
+    def test_evaluate_batch_empty(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        assert not feature_manager.evaluate_batch([], ["Target"])
+
+    # method: evaluate_batch
+    def test_snapshot_configuration_is_picklable(self):
+        class Provider(dict):
+            def __reduce__(self):
+                raise TypeError("Provider can't be pickled")
+
+        feature_manager = FeatureManager(Provider(FEATURE_FLAGS))
+        snapshot_configuration = feature_manager._get_snapshot_configuration()  # pylint: disable=protected-access
+        snapshot = pickle.loads(pickle.dumps(snapshot_configuration))
+
+        assert FeatureManager(snapshot).list_feature_flag_names() == ["Target", "Custom"]
+
+    # method: evaluate_batch
+    def test_evaluate_batch_thread_executor(self):
+        users = [f"user{i}" for i in range(20)]
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[UserLengthFilter()])
+
+        results = feature_manager.evaluate_batch(users, ["Target"], executor="thread", max_workers=4, chunk_size=3)
+
+        assert [result["Target"].enabled for result in results] == [
+            feature_manager.is_enabled("Target", user) for user in users
+        ]
+
+    # method: evaluate_batch
+    @pytest.mark.skipif(
+        not hasattr(concurrent.futures, "InterpreterPoolExecutor"), reason="Requires Python 3.14 or newer"
+    )
+    def test_evaluate_batch_interpreter_executor(self):
+        users = [f"user{i}" for i in range(20)]
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+
+        results = feature_manager.evaluate_batch(users, ["Target"], executor="interpreter", max_workers=2)
+
+        assert [result["Target"].enabled for result in results] == [
+            feature_manager.is_enabled("Target", user) for user in users
+        ]
+
+    # method: evaluate_batch
+    def test_evaluate_batch_invalid_executor(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        with pytest.raises(ValueError):
+            feature_manager.evaluate_batch(["Adam"], ["Target"], executor="fiber")
+        if not hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+            with pytest.raises(ValueError):
+                feature_manager.evaluate_batch(["Adam"], ["Target"], executor="interpreter")
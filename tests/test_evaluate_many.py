@@ -0,0 +1,56 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for evaluating several feature flags at once."""
+
+from featuremanagement import FeatureManager, TargetingContext
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {"id": "Alpha", "enabled": "true", "telemetry": {"enabled": True}},
+            {"id": "Beta", "enabled": "false"},
+            {
+                "id": "Gamma",
+                "enabled": "true",
+                "variants": [{"name": "Big", "configuration_value": 10}],
+                "allocation": {"user": [{"variant": "Big", "users": ["Adam"]}]},
+                "telemetry": {"enabled": True},
+            },
+        ]
+    }
+}
+
+
+class TestEvaluateMany:
+    # method: evaluate_many
+    def test_evaluate_many(self):
+        calls = []
+        events = []
+
+        def accessor():
+            calls.append(1)
+            return TargetingContext(user_id="Adam")
+
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS, targeting_context_accessor=accessor, on_feature_evaluated=events.append
+        )
+        results = feature_manager.evaluate_many(["Alpha", "Beta", "Gamma", "Missing"])
+
+        assert len(calls) == 1
+        assert list(results) == ["Alpha", "Beta", "Gamma", "Missing"]
+        assert results["Alpha"].enabled
+        assert not results["Beta"].enabled
+        assert results["Gamma"].variant.name == "Big"
+        assert not results["Missing"].enabled
+        assert all(result.user == "Adam" for result in results.values())
+        assert [event.feature.name for event in events] == ["Alpha", "Gamma"]
+
+    # method: evaluate_many
+    def test_evaluate_many_user_id(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        results = feature_manager.evaluate_many(["Gamma"], "Brittney")
+        assert results["Gamma"].enabled
+        assert results["Gamma"].variant is None
@@ -0,0 +1,83 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for evaluating several feature flags at once with the async FeatureManager."""
+
+import asyncio
+import time
+import pytest
+from featuremanagement import TargetingContext
+from featuremanagement.aio import FeatureManager, FeatureFilter
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {"id": "Alpha", "enabled": "true", "telemetry": {"enabled": True}},
+            {"id": "Beta", "enabled": "false"},
+            {
+                "id": "Gamma",
+                "enabled": "true",
+                "variants": [{"name": "Big", "configuration_value": 10}],
+                "allocation": {"user": [{"variant": "Big", "users": ["Adam"]}]},
+                "telemetry": {"enabled": True},
+            },
+        ]
+    }
+}
+
+
+@FeatureFilter.alias("Slow")
+class SlowFilter(FeatureFilter):
+    async def evaluate(self, context, **kwargs):
+        await asyncio.sleep(0.2)
+        return True
+
+
+class TestEvaluateManyAsync:
+    # method: evaluate_many
+    @pytest.mark.asyncio
+    async def test_evaluate_many(self):
+        calls = []
+        events = []
+
+        async def accessor():
+            calls.append(1)
+            return TargetingContext(user_id="Adam")
+
+        async def on_feature_evaluated(event):
+            events.append(event)
+
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS, targeting_context_accessor=accessor, on_feature_evaluated=on_feature_evaluated
+        )
+        results = await feature_manager.evaluate_many(["Alpha", "Beta", "Gamma"])
+
+        assert len(calls) == 1
+        assert list(results) == ["Alpha", "Beta", "Gamma"]
+        assert results["Alpha"].enabled
+        assert not results["Beta"].enabled
+        assert results["Gamma"].variant.name == "Big"
+        assert sorted(event.feature.name for event in events) == ["Alpha", "Gamma"]
+        assert all(event.user == "Adam" for event in events)
+
+    # method: evaluate_many
+    @pytest.mark.asyncio
+    async def test_evaluate_many_concurrently(self):
+        feature_flags = {
+            "feature_management": {
+                "feature_flags": [
+                    {"id": name, "enabled": "true", "conditions": {"client_filters": [{"name": "Slow"}]}}
+                    for name in ["Alpha", "Beta", "Gamma"]
+                ]
+            }
+        }
+        feature_manager = FeatureManager(
+            feature_flags, feature_filters=[SlowFilter()], concurrent_filter_evaluation=True
+        )
+
+        start = time.perf_counter()
+        results = await feature_manager.evaluate_many(["Alpha", "Beta", "Gamma"], "Adam")
+        assert time.perf_counter() - start < 0.5
+        assert all(result.enabled for result in results.values())
@@ -0,0 +1,76 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for streaming feature flag evaluation."""
+
+import pytest
+from featuremanagement import FeatureManager, TargetingContext
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {"id": "Alpha", "enabled": "true", "conditions": {"client_filters": []}},
+            {
+                "id": "Target",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.Targeting",
+                            "parameters": {"Audience": {"Users": ["Adam"], "DefaultRolloutPercentage": 0}},
+                        }
+                    ]
+                },
+                "telemetry": {"enabled": True},
+            },
+        ]
+    }
+}
+
+
+class TestEvaluateStream:
+    # method: evaluate_stream
+    def test_evaluate_stream_chunks(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        contexts = ["Adam", TargetingContext(user_id="Brian"), "Cass", "Adam", "Dave"]
+
+        chunks = list(feature_manager.evaluate_stream(contexts, ["Alpha", "Target"], chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        results = [result for chunk in chunks for result in chunk]
+        assert [result["Target"].enabled for result in results] == [True, False, False, True, False]
+        assert all(result["Alpha"].enabled for result in results)
+        assert [result["Target"].user for result in results] == ["Adam", "Brian", "Cass", "Adam", "Dave"]
+
+    # method: evaluate_stream
+    def test_evaluate_stream_is_lazy(self):
+        consumed = []
+
+        def contexts():
+            for user in ["Adam", "Brian", "Cass"]:
+                consumed.append(user)
+                yield user
+
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        stream = feature_manager.evaluate_stream(contexts(), ["Target"], chunk_size=1)
+        assert not consumed
+        assert next(stream)[0]["Target"].enabled
+        assert consumed == ["Adam"]
+
+    # method: evaluate_stream
+    def test_evaluate_stream_telemetry(self):
+        events = []
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=events.append)
+
+        for _ in feature_manager.evaluate_stream(["Adam", "Brian"], ["Alpha", "Target"]):
+            pass
+
+        assert [event.user for event in events] == ["Adam", "Brian"]
+
+    # method: evaluate_stream
+    def test_evaluate_stream_invalid_chunk_size(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        with pytest.raises(ValueError):
+            feature_manager.evaluate_stream(["Adam"], ["Alpha"], chunk_size=0)
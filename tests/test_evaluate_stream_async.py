@@ -0,0 +1,64 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for async streaming feature flag evaluation."""
+
+import pytest
+from featuremanagement import TargetingContext
+from featuremanagement.aio import FeatureManager
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {"id": "Alpha", "enabled": "true", "conditions": {"client_filters": []}},
+            {
+                "id": "Target",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.Targeting",
+                            "parameters": {"Audience": {"Users": ["Adam"], "DefaultRolloutPercentage": 0}},
+                        }
+                    ]
+                },
+            },
+        ]
+    }
+}
+
+
+class TestEvaluateStreamAsync:
+    # method: evaluate_stream
+    @pytest.mark.asyncio
+    async def test_evaluate_stream_iterable(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        contexts = ["Adam", TargetingContext(user_id="Brian"), "Cass"]
+
+        chunks = [chunk async for chunk in feature_manager.evaluate_stream(contexts, ["Alpha", "Target"], chunk_size=2)]
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        results = [result for chunk in chunks for result in chunk]
+        assert [result["Target"].enabled for result in results] == [True, False, False]
+
+    # method: evaluate_stream
+    @pytest.mark.asyncio
+    async def test_evaluate_stream_async_iterable(self):
+        async def contexts():
+            for user in ["Adam", "Brian", "Adam"]:
+                yield user
+
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        results = []
+        async for chunk in feature_manager.evaluate_stream(contexts(), ["Target"], chunk_size=2):
+            results.extend(chunk)
+
+        assert [result["Target"].enabled for result in results] == [True, False, True]
+
+    # method: evaluate_stream
+    def test_evaluate_stream_invalid_chunk_size(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        with pytest.raises(ValueError):
+            feature_manager.evaluate_stream(["Adam"], ["Alpha"], chunk_size=0)
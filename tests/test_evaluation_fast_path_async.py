@@ -0,0 +1,76 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for evaluations that don't create evaluation events."""
+
+from unittest.mock import patch
+import pytest
+from featuremanagement import EvaluationEvent
+from featuremanagement.aio import FeatureManager
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": True,
+                "variants": [{"name": "Big", "configuration_value": {"size": 10}}, {"name": "Small"}],
+                "allocation": {
+                    "user": [{"variant": "Small", "users": ["Brian"]}],
+                    "percentile": [{"variant": "Big", "from": 0, "to": 100}],
+                },
+                "conditions": {
+                    "client_filters": [
+                        {"name": "Microsoft.Targeting", "parameters": {"Audience": {"DefaultRolloutPercentage": 50}}}
+                    ]
+                },
+                "telemetry": {"enabled": True},
+            },
+            {"id": "Beta", "enabled": True, "telemetry": {"enabled": False}},
+        ]
+    }
+}
+
+
+class TestEvaluationFastPathAsync:
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_no_evaluation_event_without_callback(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        expected = [await feature_manager.is_enabled("Alpha", f"user{i}") for i in range(20)]
+        with patch("featuremanagement._featuremanagerbase.EvaluationEvent") as evaluation_event:
+            assert [await feature_manager.is_enabled("Alpha", f"user{i}") for i in range(20)] == expected
+            assert (await feature_manager.get_variant("Alpha", "Brian")).name == "Small"
+            assert not await feature_manager.is_enabled("Unknown", "Adam")
+            assert await feature_manager.get_variant("Unknown", "Adam") is None
+        evaluation_event.assert_not_called()
+        assert True in expected and False in expected
+
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_evaluation_event_with_callback(self):
+        events = []
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=events.append)
+        assert (await feature_manager.get_variant("Alpha", "Brian")).name == "Small"
+        assert await feature_manager.is_enabled("Beta", "Brian")
+        # Only feature flags with telemetry enabled are passed to the callback
+        assert len(events) == 1
+        assert isinstance(events[0], EvaluationEvent)
+        assert events[0].user == "Brian"
+        assert events[0].variant.name == "Small"
+
+    # method: get_variant
+    @pytest.mark.asyncio
+    async def test_shared_variants(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        variant = await feature_manager.get_variant("Alpha", "Brian")
+        assert await feature_manager.get_variant("Alpha", "Brian") is variant
+        assert (await feature_manager.evaluate_many(["Alpha"], "Brian"))["Alpha"].variant is variant
+
+        big = [await feature_manager.get_variant("Alpha", f"user{i}") for i in range(20)]
+        big = [variant for variant in big if variant]
+        assert big
+        assert all(variant is big[0] for variant in big)
+        assert big[0].configuration == {"size": 10}
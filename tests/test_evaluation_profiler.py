@@ -0,0 +1,123 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the evaluation profiler."""
+
+import time
+from unittest.mock import patch
+from featuremanagement import FeatureManager, FeatureFilter, EvaluationProfiler, ProfileStats
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": "true",
+                "variants": [{"name": "Big"}],
+                "allocation": {"default_when_enabled": "Big"},
+                "conditions": {"requirement_type": "All", "client_filters": [{"name": "Fast"}, {"name": "Slow"}]},
+            },
+        ]
+    }
+}
+
+
+class Fast(FeatureFilter):
+    def evaluate(self, context, **kwargs):
+        return True
+
+
+class Slow(FeatureFilter):
+    def evaluate(self, context, **kwargs):
+        time.sleep(0.02)
+        return True
+
+
+class Moderate(FeatureFilter):
+    def evaluate(self, context, **kwargs):
+        time.sleep(0.004)
+        return True
+
+
+class TestEvaluationProfiler:
+    # method: record_filter
+    def test_profiler(self):
+        profiler = EvaluationProfiler(slow_threshold=0.01)
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[Fast(), Slow()], profiler=profiler)
+        assert feature_manager.get_variant("Alpha", "Adam").name == "Big"
+        assert feature_manager.get_variant("Alpha", "Brian").name == "Big"
+
+        filter_stats = profiler.filter_stats
+        assert set(filter_stats) == {("Alpha", "Fast"), ("Alpha", "Slow")}
+        assert filter_stats[("Alpha", "Fast")].calls == 2
+        assert filter_stats[("Alpha", "Slow")].calls == 2
+        assert filter_stats[("Alpha", "Slow")].max_time >= 0.02
+        assert filter_stats[("Alpha", "Slow")].total_time >= 0.04
+        assert profiler.allocation_stats["Alpha"].calls == 2
+        assert profiler.evaluation_stats["Alpha"].calls == 2
+        assert profiler.evaluation_stats["Alpha"].total_time >= filter_stats[("Alpha", "Slow")].total_time
+
+        slow_evaluations = profiler.slow_evaluations
+        assert [sample.feature_flag_name for sample in slow_evaluations] == ["Alpha"] * 2
+        assert [name for name, _ in slow_evaluations[0].steps] == ["Fast", "Slow", None]
+        assert slow_evaluations[0].steps[1][1] >= 0.02
+        assert slow_evaluations[0].duration >= sum(duration for _, duration in slow_evaluations[0].steps)
+
+        profiler.reset()
+        assert not profiler.evaluation_stats
+        assert not profiler.filter_stats
+        assert not profiler.slow_evaluations
+
+    # method: record_evaluation
+    def test_slow_evaluation_of_fast_filters(self):
+        profiler = EvaluationProfiler(slow_threshold=0.01)
+        feature_manager = FeatureManager(
+            {
+                "feature_management": {
+                    "feature_flags": [
+                        {
+                            "id": "Beta",
+                            "enabled": "true",
+                            "conditions": {
+                                "requirement_type": "All",
+                                "client_filters": [{"name": "Moderate"}, {"name": "Moderate"}, {"name": "Moderate"}],
+                            },
+                        },
+                    ]
+                }
+            },
+            feature_filters=[Moderate()],
+            profiler=profiler,
+        )
+        assert feature_manager.is_enabled("Beta", "Adam")
+        # No filter is slower than the threshold, but the evaluation is
+        (slow_evaluation,) = profiler.slow_evaluations
+        assert [name for name, _ in slow_evaluation.steps] == ["Moderate"] * 3
+        assert all(duration < slow_evaluation.duration for _, duration in slow_evaluation.steps)
+
+    # method: slow_evaluations
+    def test_max_slow_samples(self):
+        profiler = EvaluationProfiler(slow_threshold=0, max_slow_samples=3)
+        for i in range(5):
+            token = profiler.start_evaluation()
+            profiler.record_filter(f"Flag{i}", "Filter", 1.0)
+            profiler.record_allocation(f"Flag{i}", 2.0)
+            profiler.record_evaluation(token, f"Flag{i}", 3.0)
+        assert [sample.feature_flag_name for sample in profiler.slow_evaluations] == ["Flag2", "Flag3", "Flag4"]
+        assert profiler.slow_evaluations[-1].steps == (("Filter", 1.0), (None, 2.0))
+        profiler.record_allocation("Flag", 2.0)
+        profiler.record_allocation("Flag", 1.0)
+        assert profiler.allocation_stats["Flag"] == ProfileStats(2, 3.0, 2.0)
+        # Steps recorded outside an evaluation aren't sampled
+        assert len(profiler.slow_evaluations) == 3
+
+    # method: is_enabled
+    def test_profiler_disabled(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[Fast(), Slow()])
+        # The first evaluation loads the feature flag
+        feature_manager.is_enabled("Alpha", "Adam")
+        with patch("featuremanagement._featuremanager.time.perf_counter") as perf_counter:
+            feature_manager.is_enabled("Alpha", "Adam")
+            perf_counter.assert_not_called()
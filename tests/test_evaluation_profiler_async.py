@@ -0,0 +1,44 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the evaluation profiler with the async FeatureManager."""
+
+import asyncio
+import pytest
+from featuremanagement import EvaluationProfiler
+from featuremanagement.aio import FeatureManager, FeatureFilter
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "Slow"}]},
+            },
+        ]
+    }
+}
+
+
+class Slow(FeatureFilter):
+    async def evaluate(self, context, **kwargs):
+        await asyncio.sleep(0.02)
+        return True
+
+
+class TestEvaluationProfilerAsync:
+    # method: record_filter
+    @pytest.mark.asyncio
+    async def test_profiler(self):
+        profiler = EvaluationProfiler(slow_threshold=0.01)
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[Slow()], profiler=profiler)
+        assert (await feature_manager.evaluate("Alpha", "Adam")).enabled
+        assert profiler.filter_stats[("Alpha", "Slow")].calls == 1
+        assert profiler.allocation_stats["Alpha"].calls == 1
+        (slow_evaluation,) = profiler.slow_evaluations
+        assert [name for name, _ in slow_evaluation.steps] == ["Slow", None]
+        assert profiler.evaluation_stats["Alpha"].calls == 1
+        assert slow_evaluation.duration >= 0.02
@@ -0,0 +1,126 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the evaluation event bus."""
+
+import threading
+import time
+from unittest.mock import patch
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from featuremanagement import FeatureManager, EvaluationEventBus
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [{"id": "Alpha", "enabled": "true", "telemetry": {"enabled": True}}],
+    }
+}
+
+
+class TestEvaluationEventBus:
+    # method: subscribe
+    def test_subscribers(self):
+        bus = EvaluationEventBus()
+        first, second = [], []
+        bus.subscribe(first.append)
+
+        @bus.subscribe
+        def record(evaluation_event):
+            second.append(evaluation_event.user)
+
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        feature_manager.is_enabled("Alpha", "Adam")
+        feature_manager.is_enabled("Alpha", "Brian")
+        bus.flush()
+        assert [evaluation_event.user for evaluation_event in first] == ["Adam", "Brian"]
+        assert second == ["Adam", "Brian"]
+        bus.shutdown()
+
+    # method: __call__
+    def test_slow_subscriber(self):
+        bus = EvaluationEventBus(max_queue_size=2)
+        started, release = threading.Event(), threading.Event()
+        fast = []
+
+        def slow(_evaluation_event):
+            started.set()
+            release.wait(5)
+
+        bus.subscribe(slow)
+        bus.subscribe(fast.append)
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        feature_manager.is_enabled("Alpha", "Adam")
+        assert started.wait(5)
+        for _ in range(4):
+            feature_manager.is_enabled("Alpha", "Adam")
+        # The slow subscriber is delivering one event and has two queued, while the fast one isn't held back
+        assert bus.dropped_events[slow] == 2
+        release.set()
+        bus.flush()
+        assert len(fast) + bus.dropped_events[fast.append] == 5
+        bus.shutdown()
+
+    # method: __call__
+    def test_failing_subscriber(self):
+        bus = EvaluationEventBus()
+        received = []
+
+        def fail(evaluation_event):
+            raise RuntimeError("Subscriber failed")
+
+        bus.subscribe(fail)
+        bus.subscribe(received.append)
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        feature_manager.is_enabled("Alpha", "Adam")
+        feature_manager.is_enabled("Alpha", "Adam")
+        bus.flush()
+        assert len(received) == 2
+        bus.shutdown()
+
+    # method: unsubscribe
+    def test_unsubscribe(self):
+        bus = EvaluationEventBus()
+        received = []
+        bus.subscribe(received.append)
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        feature_manager.is_enabled("Alpha", "Adam")
+        bus.unsubscribe(received.append)
+        feature_manager.is_enabled("Alpha", "Adam")
+        bus.flush()
+        assert len(received) == 1
+        assert not bus.dropped_events
+
+    # method: __call__
+    def test_trace_context(self):
+        bus = EvaluationEventBus()
+        span_contexts = []
+        bus.subscribe(lambda _: span_contexts.append(trace.get_current_span().get_span_context()))
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        with TracerProvider().get_tracer(__name__).start_as_current_span("request") as span:
+            feature_manager.is_enabled("Alpha", "Adam")
+        bus.flush()
+        assert span_contexts == [span.get_span_context()]
+        bus.shutdown()
+
+    # method: shutdown
+    def test_shutdown_at_exit(self):
+        release = threading.Event()
+        with patch("featuremanagement._event_bus.atexit") as mock_atexit:
+            bus = EvaluationEventBus()
+            mock_atexit.register.assert_called_once_with(bus.shutdown, 5.0)
+            bus.subscribe(lambda _: release.wait(5))
+            bus(None)
+            # A subscriber that doesn't finish doesn't hold up the shutdown past the timeout
+            start_time = time.monotonic()
+            bus.shutdown(0.1)
+            assert time.monotonic() - start_time < 1
+            mock_atexit.unregister.assert_called_once_with(bus.shutdown)
+        release.set()
+
+    # method: __init__
+    def test_invalid_queue_size(self):
+        with pytest.raises(ValueError):
+            EvaluationEventBus(max_queue_size=0)
@@ -0,0 +1,96 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the asyncio evaluation event bus."""
+
+import asyncio
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from featuremanagement.aio import FeatureManager, EvaluationEventBus
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [{"id": "Alpha", "enabled": "true", "telemetry": {"enabled": True}}],
+    }
+}
+
+
+class TestEvaluationEventBusAsync:
+    # method: subscribe
+    @pytest.mark.asyncio
+    async def test_subscribers(self):
+        bus = EvaluationEventBus()
+        sync_received, async_received = [], []
+        bus.subscribe(sync_received.append)
+
+        @bus.subscribe
+        async def record(evaluation_event):
+            await asyncio.sleep(0)
+            async_received.append(evaluation_event.user)
+
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        await feature_manager.is_enabled("Alpha", "Adam")
+        await feature_manager.is_enabled("Alpha", "Brian")
+        await bus.flush()
+        assert [evaluation_event.user for evaluation_event in sync_received] == ["Adam", "Brian"]
+        assert async_received == ["Adam", "Brian"]
+        await bus.shutdown()
+
+    # method: __call__
+    @pytest.mark.asyncio
+    async def test_slow_subscriber(self):
+        bus = EvaluationEventBus(max_queue_size=2)
+        release = asyncio.Event()
+        fast = []
+
+        async def slow(_evaluation_event):
+            await release.wait()
+
+        bus.subscribe(slow)
+        bus.subscribe(fast.append)
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        for _ in range(5):
+            await feature_manager.is_enabled("Alpha", "Adam")
+        assert bus.dropped_events[slow] >= 2
+        release.set()
+        await bus.flush()
+        assert len(fast) + bus.dropped_events[fast.append] == 5
+        await bus.shutdown()
+
+    # method: unsubscribe
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        bus = EvaluationEventBus()
+        received = []
+        bus.subscribe(received.append)
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        await feature_manager.is_enabled("Alpha", "Adam")
+        await bus.unsubscribe(received.append)
+        await feature_manager.is_enabled("Alpha", "Adam")
+        assert len(received) == 1
+
+    # method: __call__
+    @pytest.mark.asyncio
+    async def test_trace_context(self):
+        bus = EvaluationEventBus()
+        sync_span_contexts, async_span_contexts = [], []
+        bus.subscribe(lambda _: sync_span_contexts.append(trace.get_current_span().get_span_context()))
+
+        @bus.subscribe
+        async def record(_evaluation_event):
+            await asyncio.sleep(0)
+            async_span_contexts.append(trace.get_current_span().get_span_context())
+
+        feature_manager = FeatureManager(FEATURE_FLAGS, on_feature_evaluated=bus)
+        tracer = TracerProvider().get_tracer(__name__)
+        with tracer.start_as_current_span("first") as first:
+            await feature_manager.is_enabled("Alpha", "Adam")
+        with tracer.start_as_current_span("second") as second:
+            await feature_manager.is_enabled("Alpha", "Brian")
+        await bus.flush()
+        assert sync_span_contexts == [first.get_span_context(), second.get_span_context()]
+        assert async_span_contexts == [first.get_span_context(), second.get_span_context()]
+        await bus.shutdown()
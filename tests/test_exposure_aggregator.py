@@ -0,0 +1,105 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the exposure aggregator."""
+
+import threading
+import pytest
+from featuremanagement import EvaluationEvent, FeatureFlag, FeatureManager, Variant, VariantAssignmentReason
+from featuremanagement.azuremonitor import ExposureAggregator
+from featuremanagement.azuremonitor._exposure_aggregator import _HyperLogLog
+
+
+def _evaluation_event(user, variant_name="Big", reason=VariantAssignmentReason.USER, enabled=True):
+    evaluation_event = EvaluationEvent(FeatureFlag.convert_from_json({"id": "Alpha", "enabled": True}))
+    evaluation_event.enabled = enabled
+    evaluation_event.user = user
+    evaluation_event.variant = Variant(variant_name, None)
+    evaluation_event.reason = reason
+    return evaluation_event
+
+
+class TestExposureAggregator:
+    # method: count
+    @pytest.mark.parametrize("cardinality", [10, 1000, 50000])
+    def test_hyperloglog(self, cardinality):
+        hyperloglog = _HyperLogLog(12)
+        for i in range(cardinality):
+            hyperloglog.add(f"user{i}")
+            hyperloglog.add(f"user{i}")
+        assert abs(hyperloglog.count() - cardinality) <= max(1, cardinality * 0.05)
+
+    # method: flush
+    def test_flush(self):
+        tracked = []
+        aggregator = ExposureAggregator(tracker=lambda *args: tracked.append(args), flush_interval=60)
+        for i in range(100):
+            aggregator(_evaluation_event(f"user{i % 10}"))
+        aggregator(_evaluation_event("Adam", "Small", VariantAssignmentReason.DEFAULT_WHEN_ENABLED))
+        aggregator.shutdown()
+
+        summaries = {event_properties["Variant"]: event_properties for _, _, event_properties in tracked}
+        assert all(event_name == "FeatureExposureSummary" for event_name, _, _ in tracked)
+        assert summaries["Big"]["FeatureName"] == "Alpha"
+        assert summaries["Big"]["Enabled"] == "True"
+        assert summaries["Big"]["VariantAssignmentReason"] == "User"
+        assert summaries["Big"]["Count"] == "100"
+        assert summaries["Big"]["DistinctUsers"] == "10"
+        assert summaries["Small"]["Count"] == "1"
+        assert summaries["Small"]["VariantAssignmentReason"] == "DefaultWhenEnabled"
+        assert summaries["Big"]["IntervalStart"] <= summaries["Big"]["IntervalEnd"]
+
+        tracked.clear()
+        aggregator.flush()
+        assert not tracked
+
+    # method: flush
+    def test_enabled_state(self):
+        tracked = []
+        aggregator = ExposureAggregator(tracker=lambda *args: tracked.append(args), flush_interval=60)
+        for i in range(10):
+            aggregator(_evaluation_event(f"user{i}", "Off", VariantAssignmentReason.DEFAULT_WHEN_DISABLED, i < 3))
+        aggregator.shutdown()
+
+        summaries = {event_properties["Enabled"]: event_properties for _, _, event_properties in tracked}
+        assert len(tracked) == 2
+        assert summaries["True"]["Count"] == "3"
+        assert summaries["False"]["Count"] == "7"
+        assert summaries["False"]["DistinctUsers"] == "7"
+
+    # method: __call__
+    def test_flush_interval(self):
+        tracked = threading.Event()
+        aggregator = ExposureAggregator(tracker=lambda *args: tracked.set(), flush_interval=0.01)
+        aggregator(_evaluation_event("Adam"))
+        assert tracked.wait(5)
+        aggregator.shutdown()
+
+    # method: __init__
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError):
+            ExposureAggregator(precision=20)
+
+    # method: __call__
+    def test_on_feature_evaluated(self):
+        tracked = []
+        aggregator = ExposureAggregator(tracker=lambda *args: tracked.append(args), flush_interval=60)
+        feature_manager = FeatureManager(
+            {
+                "feature_management": {
+                    "feature_flags": [{"id": "Alpha", "enabled": True, "telemetry": {"enabled": True}}]
+                }
+            },
+            on_feature_evaluated=aggregator,
+        )
+        for user in ("Adam", "Brian", "Adam"):
+            feature_manager.is_enabled("Alpha", user)
+        aggregator.shutdown()
+        assert len(tracked) == 1
+        _, _, event_properties = tracked[0]
+        assert event_properties["Enabled"] == "True"
+        assert event_properties["Count"] == "3"
+        assert event_properties["DistinctUsers"] == "2"
+        assert "Variant" not in event_properties
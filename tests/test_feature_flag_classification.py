@@ -0,0 +1,222 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the static classification of feature flags."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+from featuremanagement import (
+    FeatureManager,
+    FeatureFilter,
+    TargetingContext,
+    FeatureFlagClassification,
+    VariantAssignmentReason,
+)
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+VARIANTS = [{"name": "On", "configuration": True}, {"name": "Off", "configuration": False}]
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Disabled",
+                "enabled": "false",
+                "variants": VARIANTS,
+                "allocation": {"default_when_disabled": "Off"},
+            },
+            {
+                "id": "NoFilters",
+                "enabled": "true",
+                "variants": VARIANTS,
+                "allocation": {"default_when_enabled": "On"},
+            },
+            {
+                "id": "ZeroRollout",
+                "enabled": "true",
+                "variants": VARIANTS,
+                "allocation": {"default_when_disabled": "Off"},
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.Targeting",
+                            "parameters": {
+                                "Audience": {
+                                    "Groups": [{"Name": "Ring0", "RolloutPercentage": 0}],
+                                    "DefaultRolloutPercentage": 0,
+                                }
+                            },
+                        }
+                    ]
+                },
+            },
+            {
+                "id": "Rollout",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {"name": "Microsoft.Targeting", "parameters": {"Audience": {"DefaultRolloutPercentage": 50}}}
+                    ]
+                },
+            },
+            {
+                "id": "Percentile",
+                "enabled": "true",
+                "variants": VARIANTS,
+                "allocation": {"percentile": [{"variant": "On", "from": 0, "to": 100}]},
+            },
+            {
+                "id": "Expired",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.TimeWindow",
+                            "parameters": {"End": format_datetime(NOW - timedelta(days=1))},
+                        }
+                    ]
+                },
+            },
+            {
+                "id": "Upcoming",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.TimeWindow",
+                            "parameters": {"Start": format_datetime(NOW + timedelta(days=1))},
+                        }
+                    ]
+                },
+            },
+            {
+                "id": "Custom",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "AlwaysOn"}]},
+            },
+            {
+                "id": "AnyRequirement",
+                "enabled": "true",
+                "conditions": {
+                    "requirement_type": "Any",
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.TimeWindow",
+                            "parameters": {"End": format_datetime(NOW - timedelta(days=1))},
+                        },
+                        {"name": "AlwaysOn"},
+                    ],
+                },
+            },
+            {
+                "id": "AllRequirement",
+                "enabled": "true",
+                "conditions": {
+                    "requirement_type": "All",
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.TimeWindow",
+                            "parameters": {"End": format_datetime(NOW - timedelta(days=1))},
+                        },
+                        {"name": "AlwaysOn"},
+                    ],
+                },
+            },
+        ]
+    }
+}
+
+
+class AlwaysOn(FeatureFilter):
+    def evaluate(self, context, **kwargs):
+        return True
+
+
+class TestFeatureFlagClassification:
+    # method: get_feature_flag_classification
+    def test_classification(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[AlwaysOn()])
+        expected = {
+            "Disabled": FeatureFlagClassification.CONSTANT,
+            "NoFilters": FeatureFlagClassification.CONSTANT,
+            "ZeroRollout": FeatureFlagClassification.CONSTANT,
+            "Rollout": FeatureFlagClassification.CONTEXT_DEPENDENT,
+            "Percentile": FeatureFlagClassification.CONTEXT_DEPENDENT,
+            "Expired": FeatureFlagClassification.CONSTANT,
+            "Upcoming": FeatureFlagClassification.TIME_DEPENDENT,
+            "Custom": FeatureFlagClassification.CUSTOM_FILTER_DEPENDENT,
+            "AnyRequirement": FeatureFlagClassification.CUSTOM_FILTER_DEPENDENT,
+            "AllRequirement": FeatureFlagClassification.CONSTANT,
+        }
+        for feature_flag_id, classification in expected.items():
+            assert feature_manager.get_feature_flag_classification(feature_flag_id) == classification
+        assert feature_manager.get_feature_flag_classification("Missing") is None
+
+    # method: get_feature_flag_classification
+    def test_replaced_builtin_filter(self):
+        class CustomTargeting(FeatureFilter):
+            def evaluate(self, context, **kwargs):
+                return True
+
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS, feature_filters=[FeatureFilter.alias("Microsoft.Targeting")(CustomTargeting)()]
+        )
+        assert (
+            feature_manager.get_feature_flag_classification("ZeroRollout")
+            == FeatureFlagClassification.CUSTOM_FILTER_DEPENDENT
+        )
+        assert feature_manager.is_enabled("ZeroRollout", "Adam")
+
+    # method: is_enabled
+    def test_constant_results(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[AlwaysOn()])
+        targeting_context = TargetingContext(user_id="Adam", groups=["Ring0"])
+        with patch("featuremanagement._featuremanager.FeatureManager._check_feature_filters") as check_feature_filters:
+            assert not feature_manager.is_enabled("ZeroRollout", targeting_context)
+            assert feature_manager.is_enabled("NoFilters", targeting_context)
+            assert not feature_manager.is_enabled("Expired", targeting_context)
+            assert not feature_manager.is_enabled("AllRequirement", targeting_context)
+            check_feature_filters.assert_not_called()
+
+        variant = feature_manager.get_variant("ZeroRollout", targeting_context)
+        assert variant.name == "Off"
+        assert feature_manager.get_variant("NoFilters", targeting_context).name == "On"
+
+    # method: is_enabled
+    def test_constant_reasons(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        evaluation_events = feature_manager.evaluate_many(["ZeroRollout", "NoFilters", "Disabled"], "Adam").values()
+        assert [event.reason for event in evaluation_events] == [
+            VariantAssignmentReason.DEFAULT_WHEN_DISABLED,
+            VariantAssignmentReason.DEFAULT_WHEN_ENABLED,
+            VariantAssignmentReason.DEFAULT_WHEN_DISABLED,
+        ]
+        assert [event.variant.name for event in evaluation_events] == ["Off", "On", "Off"]
+
+    # method: get_feature_flag_classification
+    def test_classification_refresh(self):
+        configuration = {"feature_management": {"feature_flags": [{"id": "Alpha", "enabled": "true"}]}}
+        feature_manager = FeatureManager(configuration)
+        assert feature_manager.get_feature_flag_classification("Alpha") == FeatureFlagClassification.CONSTANT
+        assert feature_manager.is_enabled("Alpha")
+
+        configuration["feature_management"] = {
+            "feature_flags": [
+                {
+                    "id": "Alpha",
+                    "enabled": "true",
+                    "conditions": {
+                        "client_filters": [
+                            {"name": "Microsoft.Targeting", "parameters": {"Audience": {"Users": ["Adam"]}}}
+                        ]
+                    },
+                }
+            ]
+        }
+        assert feature_manager.get_feature_flag_classification("Alpha") == FeatureFlagClassification.CONTEXT_DEPENDENT
+        assert feature_manager.is_enabled("Alpha", "Adam")
+        assert not feature_manager.is_enabled("Alpha", "Brian")
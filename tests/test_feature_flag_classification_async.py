@@ -0,0 +1,70 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the static classification of feature flags in the async FeatureManager."""
+
+from unittest.mock import patch
+import pytest
+from featuremanagement import TargetingContext, FeatureFlagClassification
+from featuremanagement.aio import FeatureManager, FeatureFilter
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "ZeroRollout",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {"name": "Microsoft.Targeting", "parameters": {"Audience": {"DefaultRolloutPercentage": 0}}}
+                    ]
+                },
+            },
+            {
+                "id": "Rollout",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {"name": "Microsoft.Targeting", "parameters": {"Audience": {"DefaultRolloutPercentage": 50}}}
+                    ]
+                },
+            },
+            {
+                "id": "Custom",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "AlwaysOn"}]},
+            },
+        ]
+    }
+}
+
+
+class AlwaysOn(FeatureFilter):
+    async def evaluate(self, context, **kwargs):
+        return True
+
+
+class TestFeatureFlagClassificationAsync:
+    # method: get_feature_flag_classification
+    def test_classification(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[AlwaysOn()])
+        assert feature_manager.get_feature_flag_classification("ZeroRollout") == FeatureFlagClassification.CONSTANT
+        assert feature_manager.get_feature_flag_classification("Rollout") == FeatureFlagClassification.CONTEXT_DEPENDENT
+        assert (
+            feature_manager.get_feature_flag_classification("Custom")
+            == FeatureFlagClassification.CUSTOM_FILTER_DEPENDENT
+        )
+
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_constant_results(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[AlwaysOn()])
+        targeting_context = TargetingContext(user_id="Adam")
+        with patch(
+            "featuremanagement.aio._featuremanager.FeatureManager._check_feature_filters"
+        ) as check_feature_filters:
+            assert not await feature_manager.is_enabled("ZeroRollout", targeting_context)
+            check_feature_filters.assert_not_called()
+        assert await feature_manager.is_enabled("Custom", targeting_context)
@@ -0,0 +1,180 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the local file telemetry exporter."""
+
+import gzip
+import json
+import shutil
+import threading
+import time
+from unittest.mock import patch
+from featuremanagement import EvaluationEvent, FeatureFlag, FeatureManager
+from featuremanagement.azuremonitor import FileTelemetryExporter
+
+FEATURE_FLAG = FeatureFlag.convert_from_json(
+    {"id": "Alpha", "enabled": True, "telemetry": {"enabled": True, "metadata": {"ETag": "etag"}}}
+)
+
+
+def _evaluation_event(user):
+    evaluation_event = EvaluationEvent(FEATURE_FLAG)
+    evaluation_event.enabled = True
+    evaluation_event.user = user
+    return evaluation_event
+
+
+def _read_lines(path):
+    with open(path, encoding="utf-8") as events_file:
+        return [json.loads(line) for line in events_file]
+
+
+class TestFileTelemetryExporter:
+    # method: __call__
+    def test_buffered_writes(self, tmp_path):
+        path = tmp_path / "events.ndjson"
+        exporter = FileTelemetryExporter(path, buffer_size=3, flush_interval=60)
+        exporter(_evaluation_event("Adam"))
+        exporter(_evaluation_event("Brian"))
+        assert not path.exists()
+        exporter(_evaluation_event("Charlie"))
+        events = _read_lines(path)
+        assert [event["properties"]["TargetingId"] for event in events] == ["Adam", "Brian", "Charlie"]
+        assert events[0]["name"] == "FeatureEvaluation"
+        assert events[0]["properties"]["FeatureName"] == "Alpha"
+        assert events[0]["properties"]["Enabled"] == "True"
+        assert events[0]["properties"]["ETag"] == "etag"
+        assert "timestamp" in events[0]
+
+        exporter(_evaluation_event("Dana"))
+        exporter.close()
+        assert len(_read_lines(path)) == 4
+        exporter(_evaluation_event("Eve"))
+        assert len(_read_lines(path)) == 4
+
+    # method: flush
+    def test_flush(self, tmp_path):
+        path = tmp_path / "logs" / "events.ndjson"
+        exporter = FileTelemetryExporter(path, flush_interval=60)
+        exporter(_evaluation_event("Adam"))
+        exporter.flush()
+        assert len(_read_lines(path)) == 1
+        exporter.close()
+
+    # method: __call__
+    def test_size_rotation(self, tmp_path):
+        path = tmp_path / "events.ndjson"
+        exporter = FileTelemetryExporter(path, buffer_size=1, max_bytes=400, compress=True)
+        for user in ("Adam", "Brian", "Charlie", "Dana"):
+            exporter(_evaluation_event(user))
+        exporter.close()
+
+        rotated = sorted(tmp_path.glob("events.ndjson.*.gz"))
+        assert rotated
+        assert not list(tmp_path.glob("events.ndjson.*[0-9]"))
+        users = []
+        for rotated_path in rotated:
+            with gzip.open(rotated_path, "rt", encoding="utf-8") as rotated_file:
+                users += [json.loads(line)["properties"]["TargetingId"] for line in rotated_file]
+        users += [event["properties"]["TargetingId"] for event in _read_lines(path)]
+        assert users == ["Adam", "Brian", "Charlie", "Dana"]
+
+    # method: __call__
+    def test_background_compression(self, tmp_path):
+        path = tmp_path / "events.ndjson"
+        compressing_threads = []
+        copy = shutil.copyfileobj
+
+        def copyfileobj(source, target):
+            compressing_threads.append(threading.current_thread())
+            copy(source, target)
+
+        exporter = FileTelemetryExporter(path, buffer_size=1, max_bytes=1, compress=True)
+        with patch("featuremanagement.azuremonitor._file_exporter.shutil.copyfileobj", copyfileobj):
+            exporter(_evaluation_event("Adam"))
+            exporter(_evaluation_event("Brian"))
+            exporter.close()
+        assert compressing_threads
+        assert threading.current_thread() not in compressing_threads
+        (rotated_path,) = tmp_path.glob("events.ndjson.*.gz")
+        with gzip.open(rotated_path, "rt", encoding="utf-8") as rotated_file:
+            assert json.loads(rotated_file.read())["properties"]["TargetingId"] == "Adam"
+
+    # method: __call__
+    def test_flush_interval(self, tmp_path):
+        path = tmp_path / "events.ndjson"
+        exporter = FileTelemetryExporter(path, flush_interval=0.01)
+        exporter(_evaluation_event("Adam"))
+        # The buffer is written by the background thread, without another event arriving
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(_read_lines(path)) == 1
+        exporter.close()
+
+    # method: __init__
+    def test_close_at_exit(self, tmp_path):
+        with patch("featuremanagement.azuremonitor._file_exporter.atexit") as mock_atexit:
+            exporter = FileTelemetryExporter(tmp_path / "events.ndjson", flush_interval=60)
+            mock_atexit.register.assert_called_once_with(exporter.close)
+            exporter(_evaluation_event("Adam"))
+            exporter.close()
+            mock_atexit.unregister.assert_called_once_with(exporter.close)
+        assert len(_read_lines(tmp_path / "events.ndjson")) == 1
+
+    # method: __call__
+    def test_time_rotation(self, tmp_path):
+        path = tmp_path / "events.ndjson"
+        exporter = FileTelemetryExporter(path, buffer_size=1, rotation_interval=60)
+        with patch("featuremanagement.azuremonitor._file_exporter.time.time", return_value=1000.0):
+            exporter(_evaluation_event("Adam"))
+            exporter(_evaluation_event("Brian"))
+        with patch("featuremanagement.azuremonitor._file_exporter.time.time", return_value=1060.0):
+            exporter(_evaluation_event("Charlie"))
+        exporter.close()
+        (rotated_path,) = tmp_path.glob("events.ndjson.*")
+        assert [event["properties"]["TargetingId"] for event in _read_lines(rotated_path)] == ["Adam", "Brian"]
+        assert [event["properties"]["TargetingId"] for event in _read_lines(path)] == ["Charlie"]
+
+    # method: __call__
+    def test_on_feature_evaluated(self, tmp_path):
+        path = tmp_path / "events.ndjson"
+        exporter = FileTelemetryExporter(path)
+        feature_manager = FeatureManager(
+            {
+                "feature_management": {
+                    "feature_flags": [{"id": "Beta", "enabled": True, "telemetry": {"enabled": True}}]
+                }
+            },
+            on_feature_evaluated=exporter,
+        )
+        assert feature_manager.is_enabled("Beta", "Adam")
+        exporter.close()
+        (event,) = _read_lines(path)
+        assert event["properties"]["FeatureName"] == "Beta"
+        assert event["properties"]["TargetingId"] == "Adam"
+
+    # method: __call__
+    def test_write_failure(self, tmp_path):
+        path = tmp_path / "events.ndjson"
+        exporter = FileTelemetryExporter(path, buffer_size=2, flush_interval=0.01)
+        feature_manager = FeatureManager(
+            {
+                "feature_management": {
+                    "feature_flags": [{"id": "Beta", "enabled": True, "telemetry": {"enabled": True}}]
+                }
+            },
+            on_feature_evaluated=exporter,
+        )
+        with patch("featuremanagement.azuremonitor._file_exporter.open", side_effect=OSError, create=True):
+            assert feature_manager.is_enabled("Beta", "Adam")
+            assert feature_manager.is_enabled("Beta", "Brian")
+            assert not path.exists()
+        # The events stay buffered and are written by the background thread once writing succeeds
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        exporter.close()
+        assert [event["properties"]["TargetingId"] for event in _read_lines(path)] == ["Adam", "Brian"]
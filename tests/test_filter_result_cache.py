@@ -0,0 +1,147 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the cache of results of cacheable feature filters."""
+
+from unittest.mock import patch
+from featuremanagement import FeatureManager, FeatureFilter, TargetingContext
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "Counting"}]},
+            },
+            {
+                "id": "Beta",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "Region"}]},
+            },
+            {
+                "id": "Gamma",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "Impure"}]},
+            },
+        ]
+    }
+}
+
+
+@FeatureFilter.cacheable()
+class Counting(FeatureFilter):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, context, **kwargs):
+        self.calls += 1
+        return kwargs.get("user") == "Adam"
+
+
+@FeatureFilter.cacheable(depends_on=["region"], ttl=60)
+class Region(FeatureFilter):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, context, **kwargs):
+        self.calls += 1
+        return kwargs.get("region") == "west"
+
+
+class Impure(FeatureFilter):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, context, **kwargs):
+        self.calls += 1
+        return True
+
+
+class TestFilterResultCache:
+    # method: cacheable
+    def test_cacheable_declaration(self):
+        counting = Counting()
+        region = Region()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[counting, region])
+        # Counting depends on the user and groups only, and its results never expire
+        with patch("featuremanagement._result_cache.time.time", return_value=1000.0):
+            assert feature_manager.is_enabled("Alpha", "Adam", region="west")
+        with patch("featuremanagement._result_cache.time.time", return_value=1000000.0):
+            assert feature_manager.is_enabled("Alpha", "Adam", region="east")
+        assert counting.calls == 1
+        # Region depends on the region only
+        assert feature_manager.is_enabled("Beta", "Adam", region="west")
+        assert feature_manager.is_enabled("Beta", TargetingContext(user_id="Brian", groups=["Ring0"]), region="west")
+        assert region.calls == 1
+
+    # method: is_enabled
+    def test_cacheable_filter(self):
+        counting = Counting()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[counting])
+        assert feature_manager.is_enabled("Alpha", TargetingContext(user_id="Adam", groups=["Ring0"]))
+        assert feature_manager.is_enabled("Alpha", TargetingContext(user_id="Adam", groups=["Ring0"]))
+        assert counting.calls == 1
+        assert not feature_manager.is_enabled("Alpha", TargetingContext(user_id="Brian", groups=["Ring0"]))
+        assert counting.calls == 2
+        assert feature_manager.is_enabled("Alpha", TargetingContext(user_id="Adam", groups=["Ring1"]))
+        assert counting.calls == 3
+        cache_info = feature_manager.filter_result_cache_info
+        assert cache_info.hits == 1
+        assert cache_info.currsize == 3
+
+    # method: is_enabled
+    def test_depends_on_kwargs(self):
+        region = Region()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[region])
+        assert feature_manager.is_enabled("Beta", "Adam", region="west")
+        assert feature_manager.is_enabled("Beta", "Brian", region="west")
+        assert region.calls == 1
+        assert not feature_manager.is_enabled("Beta", "Adam", region="east")
+        assert region.calls == 2
+
+    # method: is_enabled
+    def test_ttl(self):
+        region = Region()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[region])
+        with (
+            patch("featuremanagement._result_cache.time.time", return_value=1000.0),
+            patch("featuremanagement._featuremanagerbase.time.time", return_value=1000.0),
+        ):
+            assert feature_manager.is_enabled("Beta", region="west")
+            assert feature_manager.is_enabled("Beta", region="west")
+        assert region.calls == 1
+        with patch("featuremanagement._result_cache.time.time", return_value=1061.0):
+            assert feature_manager.is_enabled("Beta", region="west")
+        assert region.calls == 2
+
+    # method: is_enabled
+    def test_not_cacheable(self):
+        impure = Impure()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[impure])
+        assert feature_manager.is_enabled("Gamma", "Adam")
+        assert feature_manager.is_enabled("Gamma", "Adam")
+        assert impure.calls == 2
+
+    # method: is_enabled
+    def test_cache_disabled(self):
+        counting = Counting()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[counting], filter_result_cache_size=0)
+        assert feature_manager.is_enabled("Alpha", "Adam")
+        assert feature_manager.is_enabled("Alpha", "Adam")
+        assert counting.calls == 2
+        assert feature_manager.filter_result_cache_info is None
+
+    # method: is_enabled
+    def test_cache_refresh(self):
+        counting = Counting()
+        configuration = {"feature_management": FEATURE_FLAGS["feature_management"]}
+        feature_manager = FeatureManager(configuration, feature_filters=[counting])
+        assert feature_manager.is_enabled("Alpha", "Adam")
+        configuration["feature_management"] = {
+            "feature_flags": list(FEATURE_FLAGS["feature_management"]["feature_flags"])
+        }
+        assert feature_manager.is_enabled("Alpha", "Adam")
+        assert counting.calls == 2
@@ -0,0 +1,66 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the cache of results of cacheable feature filters in the async FeatureManager."""
+
+import pytest
+from featuremanagement.aio import FeatureManager, FeatureFilter
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": "true",
+                "conditions": {"requirement_type": "All", "client_filters": [{"name": "Counting"}, {"name": "Other"}]},
+            },
+        ]
+    }
+}
+
+
+@FeatureFilter.cacheable()
+class Counting(FeatureFilter):
+    def __init__(self):
+        self.calls = 0
+
+    async def evaluate(self, context, **kwargs):
+        self.calls += 1
+        return kwargs.get("user") == "Adam"
+
+
+@FeatureFilter.cacheable(depends_on=[])
+class Other(FeatureFilter):
+    def __init__(self):
+        self.calls = 0
+
+    async def evaluate(self, context, **kwargs):
+        self.calls += 1
+        return True
+
+
+class TestFilterResultCacheAsync:
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_cacheable_filter(self):
+        counting, other = Counting(), Other()
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[counting, other])
+        assert await feature_manager.is_enabled("Alpha", "Adam")
+        assert await feature_manager.is_enabled("Alpha", "Adam")
+        assert not await feature_manager.is_enabled("Alpha", "Brian")
+        assert counting.calls == 2
+        assert other.calls == 1
+
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_cacheable_filter_concurrent(self):
+        counting, other = Counting(), Other()
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS, feature_filters=[counting, other], concurrent_filter_evaluation=True
+        )
+        assert await feature_manager.is_enabled("Alpha", "Adam")
+        assert await feature_manager.is_enabled("Alpha", "Adam")
+        assert counting.calls == 1
+        assert other.calls == 1
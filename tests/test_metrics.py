@@ -0,0 +1,107 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the OpenTelemetry metrics of the FeatureManager."""
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from featuremanagement import FeatureManager, FeatureFilter
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": "true",
+                "variants": [{"name": "Big"}, {"name": "Small"}],
+                "allocation": {"user": [{"variant": "Big", "users": ["Adam"]}], "default_when_enabled": "Small"},
+            },
+            {
+                "id": "Beta",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "AlwaysOn"}]},
+            },
+        ]
+    }
+}
+
+
+class AlwaysOn(FeatureFilter):
+    def evaluate(self, context, **kwargs):
+        return True
+
+
+def _collect(reader):
+    data_points = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                data_points[metric.name] = list(metric.data.data_points)
+    return data_points
+
+
+class TestMetrics:
+    # method: is_enabled
+    def test_evaluation_metrics(self):
+        reader = InMemoryMetricReader()
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS,
+            feature_filters=[AlwaysOn()],
+            meter_provider=MeterProvider(metric_readers=[reader]),
+            result_cache_size=10,
+        )
+        assert feature_manager.metrics_enabled
+        assert feature_manager.get_variant("Alpha", "Adam").name == "Big"
+        assert feature_manager.get_variant("Alpha", "Brian").name == "Small"
+        assert feature_manager.get_variant("Alpha", "Brian").name == "Small"
+        assert feature_manager.is_enabled("Beta", "Adam")
+
+        data_points = _collect(reader)
+        evaluations = {
+            (
+                point.attributes["feature_flag.key"],
+                point.attributes.get("feature_flag.result.variant"),
+                point.attributes["feature_flag.result.reason"],
+            ): point.value
+            for point in data_points["feature_flag.evaluations"]
+        }
+        assert evaluations == {
+            ("Alpha", "Big", "User"): 1,
+            ("Alpha", "Small", "DefaultWhenEnabled"): 2,
+            ("Beta", None, "None"): 1,
+        }
+        durations = {
+            point.attributes["feature_flag.key"]: point.count
+            for point in data_points["feature_flag.evaluation.duration"]
+        }
+        assert durations == {"Alpha": 3, "Beta": 1}
+
+        (filter_invocations,) = data_points["feature_flag.filter.invocations"]
+        assert filter_invocations.value == 1
+        assert filter_invocations.attributes["feature_flag.filter.name"] == "AlwaysOn"
+
+        assert sum(point.count for point in data_points["feature_flag.compile.duration"]) == 2
+        hit_ratios = {
+            point.attributes["feature_flag.cache.name"]: point.value
+            for point in data_points["feature_flag.cache.hit_ratio"]
+        }
+        assert hit_ratios["result"] == 1 / 3
+
+    # method: is_enabled
+    def test_refresh_metrics(self):
+        reader = InMemoryMetricReader()
+        configuration = {"feature_management": {"feature_flags": [{"id": "Alpha", "enabled": "true"}]}}
+        feature_manager = FeatureManager(configuration, meter_provider=MeterProvider(metric_readers=[reader]))
+        assert feature_manager.is_enabled("Alpha")
+        configuration["feature_management"] = {"feature_flags": [{"id": "Alpha", "enabled": "false"}]}
+        assert not feature_manager.is_enabled("Alpha")
+        (refresh,) = _collect(reader)["feature_flag.snapshot.refresh.duration"]
+        assert refresh.count == 1
+
+    # method: is_enabled
+    def test_metrics_disabled(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[AlwaysOn()])
+        assert not feature_manager.metrics_enabled
+        assert feature_manager.is_enabled("Beta")
@@ -0,0 +1,51 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the OpenTelemetry metrics of the async FeatureManager."""
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from featuremanagement.aio import FeatureManager, FeatureFilter
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "AlwaysOn"}]},
+            },
+        ]
+    }
+}
+
+
+class AlwaysOn(FeatureFilter):
+    async def evaluate(self, context, **kwargs):
+        return True
+
+
+class TestMetricsAsync:
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_evaluation_metrics(self):
+        reader = InMemoryMetricReader()
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS, feature_filters=[AlwaysOn()], meter_provider=MeterProvider(metric_readers=[reader])
+        )
+        assert await feature_manager.is_enabled("Alpha", "Adam")
+        assert await feature_manager.is_enabled("Alpha", "Brian")
+
+        metrics = {
+            metric.name: list(metric.data.data_points)
+            for resource_metrics in reader.get_metrics_data().resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+        (evaluations,) = metrics["feature_flag.evaluations"]
+        assert evaluations.value == 2
+        (filter_invocations,) = metrics["feature_flag.filter.invocations"]
+        assert filter_invocations.value == 2
@@ -0,0 +1,158 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the evaluation result cache."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+from featuremanagement import FeatureManager, FeatureFilter, TargetingContext, CacheInfo
+
+END = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Target",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.Targeting",
+                            "parameters": {"Audience": {"Groups": [{"Name": "Ring0", "RolloutPercentage": 100}]}},
+                        }
+                    ]
+                },
+            },
+            {
+                "id": "Window",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [{"name": "Microsoft.TimeWindow", "parameters": {"End": format_datetime(END)}}]
+                },
+            },
+            {
+                "id": "Custom",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "AlwaysOn"}]},
+            },
+        ]
+    }
+}
+
+
+class AlwaysOn(FeatureFilter):
+    def evaluate(self, context, **kwargs):
+        return True
+
+
+class TestResultCache:
+    # method: result_cache
+    def test_result_cache_disabled(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        assert feature_manager.is_enabled("Target", TargetingContext(user_id="Adam", groups=["Ring0"]))
+        assert feature_manager.result_cache_info is None
+
+    # method: result_cache
+    def test_result_cache_hits(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, result_cache_size=10)
+
+        assert feature_manager.is_enabled("Target", TargetingContext(user_id="Adam", groups=["Ring1", "Ring0"]))
+        assert feature_manager.result_cache_info == CacheInfo(0, 1, 0, 10, 1)
+        # Group order doesn't matter
+        assert feature_manager.is_enabled("Target", TargetingContext(user_id="Adam", groups=["Ring0", "Ring1"]))
+        assert feature_manager.result_cache_info == CacheInfo(1, 1, 0, 10, 1)
+        assert not feature_manager.is_enabled("Target", TargetingContext(user_id="Adam", groups=["Ring1"]))
+        assert feature_manager.result_cache_info == CacheInfo(1, 2, 0, 10, 2)
+
+    # method: result_cache
+    def test_result_cache_skips_custom_filters_and_kwargs(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[AlwaysOn()], result_cache_size=10)
+
+        assert feature_manager.is_enabled("Custom", "Adam")
+        assert feature_manager.is_enabled("Custom", "Adam")
+        assert feature_manager.is_enabled(
+            "Target", TargetingContext(user_id="Adam", groups=["ring0"]), ignore_case=True
+        )
+        assert feature_manager.result_cache_info == CacheInfo(0, 0, 0, 10, 0)
+
+    # method: result_cache
+    def test_result_cache_evictions(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, result_cache_size=2)
+        for user in ["Adam", "Brian", "Cass", "Adam"]:
+            feature_manager.is_enabled("Target", user)
+        assert feature_manager.result_cache_info == CacheInfo(0, 4, 2, 2, 2)
+
+    # method: result_cache
+    def test_result_cache_time_window_expiry(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, result_cache_size=10)
+        assert feature_manager.is_enabled("Window", "Adam")
+        assert feature_manager.is_enabled("Window", "Adam")
+        assert feature_manager.result_cache_info.hits == 1
+
+        with patch("featuremanagement._result_cache.time.time", return_value=END.timestamp()):
+            assert feature_manager.is_enabled("Window", "Adam")
+        assert feature_manager.result_cache_info.hits == 1
+        assert feature_manager.result_cache_info.misses == 2
+
+        with patch("featuremanagement._result_cache.time.time", return_value=END.timestamp() - 1):
+            assert feature_manager.is_enabled("Window", "Adam")
+        assert feature_manager.result_cache_info.hits == 2
+        assert time.time() < END.timestamp()
+
+    # method: result_cache
+    def test_result_cache_expiry_from_evaluation_time(self):
+        # A daily window that was last open from 60 to 30 minutes ago
+        start = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=1, minutes=60)
+        end = start + timedelta(minutes=30)
+        feature_flags = {
+            "feature_management": {
+                "feature_flags": [
+                    {
+                        "id": "Daily",
+                        "enabled": "true",
+                        "conditions": {
+                            "client_filters": [
+                                {
+                                    "name": "Microsoft.TimeWindow",
+                                    "parameters": {
+                                        "Start": format_datetime(start),
+                                        "End": format_datetime(end),
+                                        "Recurrence": {
+                                            "Pattern": {"Type": "Daily", "Interval": 1},
+                                            "Range": {"Type": "NoEnd"},
+                                        },
+                                    },
+                                }
+                            ]
+                        },
+                    }
+                ]
+            }
+        }
+        feature_manager = FeatureManager(feature_flags, result_cache_size=10)
+        assert not feature_manager.is_enabled("Daily", "Adam")
+
+        # The result of an evaluation just before the window closed expires when the window closes, even if the
+        # evaluation finishes after that
+        evaluation_time = end - timedelta(seconds=1)
+        with patch("featuremanagement._featuremanager.datetime") as mock_datetime:
+            mock_datetime.now.return_value = evaluation_time
+            assert feature_manager.is_enabled("Daily", "Brian")
+        assert not feature_manager.is_enabled("Daily", "Brian")
+        assert feature_manager.result_cache_info.hits == 0
+
+    # method: result_cache
+    def test_result_cache_snapshot_invalidation(self):
+        feature_flags = {"feature_management": {"feature_flags": [{"id": "Alpha", "enabled": "true"}]}}
+        feature_manager = FeatureManager(feature_flags, result_cache_size=10)
+        assert feature_manager.is_enabled("Alpha", "Adam")
+        assert feature_manager.is_enabled("Alpha", "Adam")
+
+        feature_flags["feature_management"] = {"feature_flags": [{"id": "Alpha", "enabled": "false"}]}
+        assert not feature_manager.is_enabled("Alpha", "Adam")
+        assert feature_manager.result_cache_info.currsize == 0
@@ -0,0 +1,52 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the evaluation result cache of the async FeatureManager."""
+
+import pytest
+from featuremanagement import TargetingContext, CacheInfo
+from featuremanagement.aio import FeatureManager, FeatureFilter
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Target",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {
+                            "name": "Microsoft.Targeting",
+                            "parameters": {"Audience": {"Groups": [{"Name": "Ring0", "RolloutPercentage": 100}]}},
+                        }
+                    ]
+                },
+            },
+            {
+                "id": "Custom",
+                "enabled": "true",
+                "conditions": {"client_filters": [{"name": "AlwaysOn"}]},
+            },
+        ]
+    }
+}
+
+
+class AlwaysOn(FeatureFilter):
+    async def evaluate(self, context, **kwargs):
+        return True
+
+
+class TestResultCacheAsync:
+    # method: result_cache
+    @pytest.mark.asyncio
+    async def test_result_cache_hits(self):
+        feature_manager = FeatureManager(FEATURE_FLAGS, feature_filters=[AlwaysOn()], result_cache_size=10)
+        targeting_context = TargetingContext(user_id="Adam", groups=["Ring0"])
+
+        assert await feature_manager.is_enabled("Target", targeting_context)
+        assert await feature_manager.is_enabled("Target", targeting_context)
+        assert await feature_manager.is_enabled("Custom", targeting_context)
+        assert feature_manager.result_cache_info == CacheInfo(1, 1, 0, 10, 1)
@@ -8,7 +8,20 @@
 import logging
 from unittest.mock import patch
 import pytest
-from featuremanagement import EvaluationEvent, FeatureFlag, Variant, VariantAssignmentReason, TargetingContext
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import InMemoryLogRecordExporter, SimpleLogRecordProcessor
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from featuremanagement import (
+    EvaluationEvent,
+    FeatureFlag,
+    Variant,
+    VariantAssignmentReason,
+    TargetingContext,
+    set_targeting_context,
+    reset_targeting_context,
+)
 import featuremanagement.azuremonitor._send_telemetry
 from featuremanagement.azuremonitor import TargetingSpanProcessor
 
@@ -85,6 +98,54 @@ class TestSendTelemetryAppinsights:
             assert mock_event_logger_info.call_args.kwargs["extra"]["CustomProperty"] == "custom_value"
             assert mock_event_logger_info.call_args.kwargs["extra"]["TargetingId"] == "test_user"
 
+    def test_track_event_otel_logger_provider(self):
+        exporter = InMemoryLogRecordExporter()
+        logger_provider = LoggerProvider()
+        logger_provider.add_log_record_processor(SimpleLogRecordProcessor(exporter))
+        tracer = TracerProvider().get_tracer(__name__)
+
+        with (
+            patch("featuremanagement.azuremonitor._send_telemetry.get_logger_provider", return_value=logger_provider),
+            patch("featuremanagement.azuremonitor._send_telemetry._event_logger.info") as mock_event_logger_info,
+            tracer.start_as_current_span("request") as span,
+        ):
+            featuremanagement.azuremonitor._send_telemetry.track_event(  # pylint: disable=protected-access
+                "FeatureEvaluation",
+                "test_user",
+                {"microsoft.custom_event.name": "override_attempt", "CustomProperty": "custom_value", "Empty": None},
+            )
+
+        mock_event_logger_info.assert_not_called()
+        log_records = exporter.get_finished_logs()
+        assert len(log_records) == 1
+        log_record = log_records[0].log_record
+        assert log_record.body == "FeatureEvaluation"
+        assert log_record.severity_text == "INFO"
+        assert log_record.trace_id == span.get_span_context().trace_id
+        assert dict(log_record.attributes) == {
+            "microsoft.custom_event.name": "FeatureEvaluation",
+            "CustomProperty": "custom_value",
+            "TargetingId": "test_user",
+        }
+        assert log_records[0].instrumentation_scope.name == "featuremanagement.azuremonitor._send_telemetry.events"
+
+    def test_track_event_otel_logger_provider_changed(self):
+        first_exporter = InMemoryLogRecordExporter()
+        first_provider = LoggerProvider()
+        first_provider.add_log_record_processor(SimpleLogRecordProcessor(first_exporter))
+        second_exporter = InMemoryLogRecordExporter()
+        second_provider = LoggerProvider()
+        second_provider.add_log_record_processor(SimpleLogRecordProcessor(second_exporter))
+
+        for provider in (first_provider, second_provider):
+            with patch("featuremanagement.azuremonitor._send_telemetry.get_logger_provider", return_value=provider):
+                featuremanagement.azuremonitor._send_telemetry.track_event(  # pylint: disable=protected-access
+                    "FeatureEvaluation", "test_user"
+                )
+
+        assert len(first_exporter.get_finished_logs()) == 1
+        assert len(second_exporter.get_finished_logs()) == 1
+
     def test_send_telemetry_appinsights_no_user(self):
         feature_flag = FeatureFlag.convert_from_json({"id": "TestFeature"})
         evaluation_event = EvaluationEvent(feature_flag)
@@ -251,6 +312,35 @@ class TestSendTelemetryAppinsights:
             assert event_properties["VariantAssignmentPercentage"] == "25"
             assert "DefaultWhenEnabled" not in event_properties
 
+    def test_send_telemetry_appinsights_event_template(self):
+        feature_flag = FeatureFlag.convert_from_json(
+            {"id": "TestFeature", "telemetry": {"enabled": True, "metadata": {"ETag": "etag"}}}
+        )
+        send_telemetry = featuremanagement.azuremonitor._send_telemetry  # pylint: disable=protected-access
+        template = send_telemetry._get_event_template(  # pylint: disable=protected-access
+            feature_flag, True, VariantAssignmentReason.NONE, None
+        )
+        assert template is send_telemetry._get_event_template(  # pylint: disable=protected-access
+            feature_flag, True, VariantAssignmentReason.NONE, None
+        )
+        with pytest.raises(TypeError):
+            template["Enabled"] = "False"
+
+        with (
+            patch("featuremanagement.azuremonitor._send_telemetry._initialize_event_logger"),
+            patch("featuremanagement.azuremonitor._send_telemetry._event_logger.info") as mock_logger_info,
+        ):
+            for user in ("Adam", "Brian"):
+                evaluation_event = EvaluationEvent(feature_flag)
+                evaluation_event.enabled = True
+                evaluation_event.user = user
+                send_telemetry.publish_telemetry(evaluation_event)
+            first, second = [call.kwargs["extra"] for call in mock_logger_info.call_args_list]
+            assert first["TargetingId"] == "Adam"
+            assert second["TargetingId"] == "Brian"
+            assert first["ETag"] == second["ETag"] == "etag"
+        assert "TargetingId" not in template
+
     def test_targeting_span_processor(self, caplog):
         processor = TargetingSpanProcessor()
         processor.on_start(None)
@@ -288,6 +378,43 @@ class TestSendTelemetryAppinsights:
 
         self.user_id = None
 
+    def test_targeting_span_processor_context_var(self):
+        processor = TargetingSpanProcessor(targeting_context_accessor=self.async_targeting_context_accessor)
+        token = set_targeting_context(TargetingContext(user_id="context_user"))
+        try:
+            with patch("opentelemetry.sdk.trace.Span") as mock_span:
+                processor.on_start(mock_span)
+                mock_span.set_attribute.assert_called_once_with("TargetingId", "context_user")
+        finally:
+            reset_targeting_context(token)
+
+    def test_targeting_span_processor_trace_cache(self):
+        accessor_calls = []
+
+        def accessor():
+            accessor_calls.append(True)
+            return TargetingContext(user_id="trace_user")
+
+        processor = TargetingSpanProcessor(targeting_context_accessor=accessor)
+        exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(processor)
+        tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+        tracer = tracer_provider.get_tracer(__name__)
+        with tracer.start_as_current_span("root"):
+            with tracer.start_as_current_span("child"):
+                with tracer.start_as_current_span("grandchild"):
+                    pass
+            assert len(processor._trace_targeting_ids) == 1  # pylint: disable=protected-access
+        assert not processor._trace_targeting_ids  # pylint: disable=protected-access
+
+        assert len(accessor_calls) == 1
+        assert [span.attributes["TargetingId"] for span in exporter.get_finished_spans()] == ["trace_user"] * 3
+
+        with tracer.start_as_current_span("second_root"):
+            pass
+        assert len(accessor_calls) == 2
+
     def bad_targeting_context_accessor(self):
         return "not targeting context"
 
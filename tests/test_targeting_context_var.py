@@ -0,0 +1,86 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the targeting context held in a context variable."""
+
+import asyncio
+import contextvars
+from featuremanagement import (
+    FeatureManager,
+    TargetingContext,
+    set_targeting_context,
+    reset_targeting_context,
+    get_targeting_context,
+)
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [{"name": "Microsoft.Targeting", "parameters": {"Audience": {"Users": ["Adam"]}}}]
+                },
+            },
+        ]
+    }
+}
+
+
+class TestTargetingContextVar:
+    # method: set_targeting_context
+    def test_set_and_reset(self):
+        assert get_targeting_context() is None
+        targeting_context = TargetingContext(user_id="Adam")
+        token = set_targeting_context(targeting_context)
+        assert get_targeting_context() is targeting_context
+        reset_targeting_context(token)
+        assert get_targeting_context() is None
+
+    # method: set_targeting_context
+    def test_isolated_contexts(self):
+        token = set_targeting_context(TargetingContext(user_id="Adam"))
+        try:
+            context = contextvars.Context()
+            assert context.run(get_targeting_context) is None
+        finally:
+            reset_targeting_context(token)
+
+    # method: is_enabled
+    def test_feature_manager(self):
+        accessor_calls = []
+
+        def accessor():
+            accessor_calls.append(True)
+            return TargetingContext(user_id="Brian")
+
+        feature_manager = FeatureManager(FEATURE_FLAGS, targeting_context_accessor=accessor)
+        assert not feature_manager.is_enabled("Alpha")
+        assert len(accessor_calls) == 1
+
+        token = set_targeting_context(TargetingContext(user_id="Adam"))
+        try:
+            assert feature_manager.is_enabled("Alpha")
+            # An explicit targeting context takes precedence
+            assert not feature_manager.is_enabled("Alpha", "Brian")
+        finally:
+            reset_targeting_context(token)
+        assert len(accessor_calls) == 1
+        assert not feature_manager.is_enabled("Alpha")
+
+    # method: is_enabled
+    def test_accessor_called_every_evaluation_in_task(self):
+        user_ids = ["Adam", "Belle"]
+        feature_manager = FeatureManager(
+            FEATURE_FLAGS, targeting_context_accessor=lambda: TargetingContext(user_id=user_ids[0])
+        )
+
+        async def main():
+            assert feature_manager.is_enabled("Alpha")
+            user_ids.pop(0)
+            assert not feature_manager.is_enabled("Alpha")
+
+        asyncio.run(main())
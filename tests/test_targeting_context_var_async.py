@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the targeting context held in a context variable, with the async FeatureManager."""
+
+import asyncio
+import pytest
+from featuremanagement import TargetingContext, set_targeting_context, reset_targeting_context
+from featuremanagement.aio import FeatureManager
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Alpha",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [{"name": "Microsoft.Targeting", "parameters": {"Audience": {"Users": ["Adam"]}}}]
+                },
+            },
+        ]
+    }
+}
+
+
+class TestTargetingContextVarAsync:
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_feature_manager_tasks(self):
+        async def accessor():
+            return TargetingContext(user_id="Brian")
+
+        feature_manager = FeatureManager(FEATURE_FLAGS, targeting_context_accessor=accessor)
+
+        async def request(user_id):
+            token = set_targeting_context(TargetingContext(user_id=user_id))
+            try:
+                await asyncio.sleep(0)
+                return await feature_manager.is_enabled("Alpha")
+            finally:
+                reset_targeting_context(token)
+
+        assert await asyncio.gather(request("Adam"), request("Brian"), request("Adam")) == [True, False, True]
+        assert not await feature_manager.is_enabled("Alpha")
+
+    # method: is_enabled
+    @pytest.mark.asyncio
+    async def test_accessor_called_every_evaluation(self):
+        user_ids = ["Adam", "Belle"]
+
+        async def accessor():
+            return TargetingContext(user_id=user_ids[0])
+
+        feature_manager = FeatureManager(FEATURE_FLAGS, targeting_context_accessor=accessor)
+        # A long-lived task, such as a queue worker, evaluates for whichever user the accessor returns
+        assert await feature_manager.is_enabled("Alpha")
+        user_ids.pop(0)
+        assert not await feature_manager.is_enabled("Alpha")
@@ -0,0 +1,58 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the memoized targeting context markers."""
+
+import hashlib
+from featuremanagement import FeatureManager, get_targeting_cache_info
+from featuremanagement._targeting_marker import get_context_marker
+
+FEATURE_FLAGS = {
+    "feature_management": {
+        "feature_flags": [
+            {
+                "id": "Rollout",
+                "enabled": "true",
+                "conditions": {
+                    "client_filters": [
+                        {"name": "Microsoft.Targeting", "parameters": {"Audience": {"DefaultRolloutPercentage": 50}}}
+                    ]
+                },
+                "variants": [{"name": "A"}, {"name": "B"}],
+                "allocation": {
+                    "percentile": [{"variant": "A", "from": 0, "to": 50}, {"variant": "B", "from": 50, "to": 100}],
+                    "default_when_disabled": "B",
+                },
+            },
+        ]
+    }
+}
+
+
+class TestTargetingMarker:
+    # method: get_context_marker
+    def test_context_marker(self):
+        context_id = "Adam\nRollout"
+        expected = int.from_bytes(hashlib.sha256(context_id.encode()).digest()[:4], byteorder="little", signed=False)
+        assert get_context_marker(context_id) == expected
+
+    # method: get_targeting_cache_info
+    def test_context_marker_cache_is_shared(self):
+        get_context_marker.cache_clear()
+        feature_manager = FeatureManager(FEATURE_FLAGS)
+        users = [f"user{i}" for i in range(20)]
+
+        first = [feature_manager.get_variant("Rollout", user).name for user in users]
+        info = get_targeting_cache_info()
+        assert info.hits == 0
+        # One marker for the rollout, and one for the allocation of the users in the rollout
+        assert info.misses == info.currsize
+        assert 20 <= info.misses <= 40
+
+        assert [feature_manager.get_variant("Rollout", user).name for user in users] == first
+        repeated = get_targeting_cache_info()
+        assert repeated.hits == info.misses
+        assert repeated.misses == info.misses
+        assert repeated.evictions == 0
@@ -0,0 +1,87 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for the telemetry deduplicator."""
+
+from unittest.mock import patch
+import pytest
+from featuremanagement import EvaluationEvent, FeatureFlag, Variant
+from featuremanagement.azuremonitor import TelemetryDeduplicator
+
+FEATURE_FLAG = FeatureFlag.convert_from_json({"id": "Alpha", "enabled": True})
+
+
+def _evaluation_event(user, enabled=True, variant_name=None):
+    evaluation_event = EvaluationEvent(FEATURE_FLAG)
+    evaluation_event.user = user
+    evaluation_event.enabled = enabled
+    if variant_name:
+        evaluation_event.variant = Variant(variant_name, None)
+    return evaluation_event
+
+
+class TestTelemetryDeduplicator:
+    # method: __call__
+    def test_suppress_duplicates(self):
+        published = []
+        deduplicator = TelemetryDeduplicator(publisher=published.append)
+        deduplicator(_evaluation_event("Adam"))
+        deduplicator(_evaluation_event("Adam"))
+        deduplicator(_evaluation_event("Brian"))
+        deduplicator(_evaluation_event("Adam", enabled=False))
+        deduplicator(_evaluation_event("Adam", variant_name="Big"))
+        deduplicator(_evaluation_event("Adam", variant_name="Big"))
+        assert [(event.user, event.enabled) for event in published] == [
+            ("Adam", True),
+            ("Brian", True),
+            ("Adam", False),
+            ("Adam", True),
+        ]
+        assert deduplicator.suppressed_events == 2
+        assert deduplicator.published_events == 4
+
+    # method: __call__
+    def test_anonymous_events(self):
+        published = []
+        deduplicator = TelemetryDeduplicator(publisher=published.append)
+        deduplicator(_evaluation_event(""))
+        deduplicator(_evaluation_event(""))
+        assert len(published) == 2
+        assert deduplicator.suppressed_events == 0
+
+    # method: __call__
+    def test_window(self):
+        published = []
+        deduplicator = TelemetryDeduplicator(publisher=published.append, window=10)
+        with patch("featuremanagement.azuremonitor._deduplicator.time.monotonic", return_value=100.0):
+            deduplicator(_evaluation_event("Adam"))
+        with patch("featuremanagement.azuremonitor._deduplicator.time.monotonic", return_value=109.0):
+            deduplicator(_evaluation_event("Adam"))
+        with patch("featuremanagement.azuremonitor._deduplicator.time.monotonic", return_value=110.0):
+            deduplicator(_evaluation_event("Adam"))
+        assert len(published) == 2
+        assert deduplicator.suppressed_events == 1
+
+    # method: __call__
+    def test_max_size(self):
+        published = []
+        deduplicator = TelemetryDeduplicator(publisher=published.append, max_size=2)
+        for user in ("Adam", "Brian", "Charlie", "Adam"):
+            deduplicator(_evaluation_event(user))
+        assert len(published) == 4
+
+    # method: clear
+    def test_clear(self):
+        published = []
+        deduplicator = TelemetryDeduplicator(publisher=published.append)
+        deduplicator(_evaluation_event("Adam"))
+        deduplicator.clear()
+        deduplicator(_evaluation_event("Adam"))
+        assert len(published) == 2
+
+    # method: __init__
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            TelemetryDeduplicator(max_size=0)
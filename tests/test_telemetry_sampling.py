@@ -0,0 +1,126 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""Tests for telemetry sampling."""
+
+from unittest.mock import patch
+import pytest
+from featuremanagement import EvaluationEvent, FeatureFlag, FeatureManager
+from featuremanagement.azuremonitor import publish_telemetry, BatchTelemetryPublisher
+
+
+def _evaluation_event(user, sample_rate=None):
+    telemetry = {"enabled": True}
+    if sample_rate is not None:
+        telemetry["sample_rate"] = sample_rate
+    evaluation_event = EvaluationEvent(
+        FeatureFlag.convert_from_json({"id": "Alpha", "enabled": True, "telemetry": telemetry})
+    )
+    evaluation_event.user = user
+    return evaluation_event
+
+
+def _published_users(evaluation_events, **kwargs):
+    with (
+        patch("featuremanagement.azuremonitor._send_telemetry._initialize_event_logger"),
+        patch("featuremanagement.azuremonitor._send_telemetry._event_logger.info") as mock_logger_info,
+    ):
+        for evaluation_event in evaluation_events:
+            publish_telemetry(evaluation_event, **kwargs)
+        return [call.kwargs["extra"] for call in mock_logger_info.call_args_list]
+
+
+class TestTelemetrySampling:
+    # method: publish_telemetry
+    def test_no_sampling(self):
+        published = _published_users([_evaluation_event(f"user{i}") for i in range(10)])
+        assert len(published) == 10
+        assert all("SampleRate" not in event_properties for event_properties in published)
+
+    # method: publish_telemetry
+    def test_feature_flag_sample_rate(self):
+        published = _published_users([_evaluation_event(f"user{i}", sample_rate=0.25) for i in range(1000)])
+        assert 150 < len(published) < 350
+        assert all(event_properties["SampleRate"] == "0.25" for event_properties in published)
+
+    # method: publish_telemetry
+    def test_deterministic_per_user(self):
+        users = [f"user{i}" for i in range(100)]
+        first = _published_users([_evaluation_event(user, sample_rate=0.5) for user in users])
+        second = _published_users([_evaluation_event(user, sample_rate=0.5) for user in users])
+        assert [event_properties["TargetingId"] for event_properties in first] == [
+            event_properties["TargetingId"] for event_properties in second
+        ]
+
+    # method: publish_telemetry
+    def test_sample_rate_override(self):
+        assert not _published_users([_evaluation_event(f"user{i}") for i in range(10)], sample_rate=0)
+        published = _published_users([_evaluation_event(f"user{i}", sample_rate=0) for i in range(10)], sample_rate=1)
+        assert len(published) == 10
+
+    # method: publish_telemetry
+    def test_independent_of_targeting(self):
+        evaluation_events = []
+        feature_manager = FeatureManager(
+            {
+                "feature_management": {
+                    "feature_flags": [
+                        {
+                            "id": "Alpha",
+                            "enabled": True,
+                            "conditions": {
+                                "client_filters": [
+                                    {
+                                        "name": "Microsoft.Targeting",
+                                        "parameters": {"Audience": {"DefaultRolloutPercentage": 50}},
+                                    }
+                                ]
+                            },
+                            "telemetry": {"enabled": True, "sample_rate": 0.25},
+                        }
+                    ]
+                }
+            },
+            on_feature_evaluated=evaluation_events.append,
+        )
+        for i in range(2000):
+            feature_manager.is_enabled("Alpha", f"user{i}")
+        published = _published_users(evaluation_events)
+        # The users kept by sampling are rolled out to at the rollout percentage
+        enabled = [event_properties for event_properties in published if event_properties["Enabled"] == "True"]
+        assert 0.4 < len(enabled) / len(published) < 0.6
+
+    # method: __call__
+    def test_batch_publisher_sampling(self):
+        publisher = BatchTelemetryPublisher(sample_rate=0.5, flush_interval=60)
+        with (
+            patch("featuremanagement.azuremonitor._send_telemetry._initialize_event_logger"),
+            patch("featuremanagement.azuremonitor._send_telemetry._event_logger.info") as mock_logger_info,
+        ):
+            for i in range(100):
+                publisher(_evaluation_event(f"user{i}"))
+            publisher.shutdown()
+        published = [call.kwargs["extra"] for call in mock_logger_info.call_args_list]
+        assert 20 < len(published) < 80
+        assert all(event_properties["SampleRate"] == "0.5" for event_properties in published)
+
+    # method: __call__
+    def test_sinks_sample_independently(self):
+        evaluation_events = [_evaluation_event(f"user{i}") for i in range(1000)]
+        kept = []
+        publisher = BatchTelemetryPublisher(publisher=kept.append, sample_rate=0.1, flush_interval=60)
+        for evaluation_event in evaluation_events:
+            publisher(evaluation_event)
+        publisher.shutdown()
+        assert 50 < len(kept) < 150
+        # Sampling by the batch publisher doesn't change the rate or the decision of another sink
+        published = _published_users(evaluation_events, sample_rate=0.5)
+        assert 400 < len(published) < 600
+        assert all(event_properties["SampleRate"] == "0.5" for event_properties in published)
+
+    # method: convert_from_json
+    def test_invalid_sample_rate(self):
+        with pytest.raises(ValueError, match="Invalid setting 'sample_rate' with value '2' for feature 'Alpha'."):
+            _evaluation_event("Adam", sample_rate=2)
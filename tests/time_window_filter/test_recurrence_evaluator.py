@@ -5,7 +5,7 @@
 # -------------------------------------------------------------------------
 from datetime import datetime
 import pytest
-from featuremanagement._time_window_filter._recurrence_evaluator import is_match
+from featuremanagement._time_window_filter._recurrence_evaluator import is_match, get_next_transition
 from featuremanagement._time_window_filter._models import TimeWindowFilterSettings, Recurrence
 
 
@@ -279,3 +279,32 @@ def test_weekly_recurrence_now_before_min_offset():
 
     # Verify that the main method is_match correctly handles the scenario
     assert is_match(settings, now) is False
+
+
+def test_get_next_transition_without_recurrence():
+    start = datetime(2025, 4, 7, 9, 0, 0)
+    end = datetime(2025, 4, 7, 17, 0, 0)
+    settings = TimeWindowFilterSettings(start=start, end=end, recurrence=None)
+
+    assert get_next_transition(settings, datetime(2025, 4, 7, 8, 0, 0)) == start
+    assert get_next_transition(settings, datetime(2025, 4, 7, 10, 0, 0)) == end
+    assert get_next_transition(settings, datetime(2025, 4, 7, 18, 0, 0)) is None
+
+
+def test_get_next_transition_daily_recurrence():
+    start = datetime(2025, 4, 7, 9, 0, 0)
+    end = datetime(2025, 4, 7, 17, 0, 0)
+    recurrence = Recurrence(
+        {
+            "Pattern": {"Type": "Daily", "Interval": 2},
+            "Range": {"Type": "NoEnd"},
+        }
+    )
+    settings = TimeWindowFilterSettings(start=start, end=end, recurrence=recurrence)
+
+    # Inside the second occurrence
+    assert get_next_transition(settings, datetime(2025, 4, 9, 10, 0, 0)) == datetime(2025, 4, 9, 17, 0, 0)
+    # Between occurrences, never later than the next possible start
+    assert get_next_transition(settings, datetime(2025, 4, 9, 18, 0, 0)) == datetime(2025, 4, 10, 9, 0, 0)
+    assert not is_match(settings, datetime(2025, 4, 10, 10, 0, 0))
+    assert is_match(settings, datetime(2025, 4, 11, 10, 0, 0))